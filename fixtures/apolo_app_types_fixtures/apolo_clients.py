@@ -195,8 +195,6 @@ def presets_available(request):
 def mock_get_preset_cpu():
     with (
         patch("apolo_app_types.helm.apps.common.get_preset") as mock,
-        patch("apolo_app_types.helm.apps.llm.get_preset") as mock_llm,
-        patch("apolo_app_types.helm.apps.stable_diffusion.get_preset") as mock_sd,
         patch("apolo_app_types.helm.apps.text_embeddings.get_preset") as mock_tei,
     ):
 
@@ -212,8 +210,6 @@ def mock_get_preset_cpu():
             )
 
         mock.side_effect = return_preset
-        mock_llm.side_effect = return_preset
-        mock_sd.side_effect = return_preset
         mock_tei.side_effect = return_preset
 
         yield mock
@@ -223,8 +219,6 @@ def mock_get_preset_cpu():
 def mock_get_preset_gpu():
     with (
         patch("apolo_app_types.helm.apps.common.get_preset") as mock,
-        patch("apolo_app_types.helm.apps.llm.get_preset") as mock_llm,
-        patch("apolo_app_types.helm.apps.stable_diffusion.get_preset") as mock_sd,
         patch("apolo_app_types.helm.apps.text_embeddings.get_preset") as mock_tei,
     ):
         from apolo_sdk import Preset
@@ -242,14 +236,15 @@ def mock_get_preset_gpu():
             )
 
         mock.side_effect = return_preset
-        mock_llm.side_effect = return_preset
-        mock_sd.side_effect = return_preset
         mock_tei.side_effect = return_preset
         yield mock
 
 
 @pytest.fixture
 def mock_kubernetes_client():
+    from apolo_app_types.clients.kube import reset_api_client
+
+    reset_api_client()
     with (
         patch("kubernetes.config.load_config") as mock_load_config,
         patch("kubernetes.config.load_incluster_config") as mock_load_incluster_config,
@@ -431,6 +426,7 @@ def mock_kubernetes_client():
             "mock_custom_objects": mock_custom_objects_instance,
             "fake_ingresses": fake_ingresses,
         }
+    reset_api_client()
 
 
 @pytest.fixture
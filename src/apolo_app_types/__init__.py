@@ -1,161 +1,329 @@
-from apolo_app_types.dynamic_outputs import (
-    BaseModelFilter,
-    DynamicAppBasicResponse,
-    DynamicAppFilterParams,
-    DynamicAppIdResponse,
-    DynamicAppListResponse,
-    FilterCondition,
-    FilterOperator,
-    compare_equal,
-    compare_like,
-    parse_filter_string,
-)
-from apolo_app_types.job_utils import JobRunParams, prepare_job_run_params
-from apolo_app_types.protocols.apolo_deploy import ApoloDeployInputs, ApoloDeployOutputs
-from apolo_app_types.protocols.bundles import (
-    DeepSeekR1Inputs,
-    GptOssInputs,
-    LLama4Inputs,
-    MistralInputs,
-)
-from apolo_app_types.protocols.common import (
-    ApoloFilesMount,
-    ApoloSecret,
-    AppInputs,
-    AppInputsDeployer,
-    AppOutputs,
-    AppOutputsDeployer,
-    BasicAuth,
-    Bucket,
-    Env,
-    HttpApi,
-    HuggingFaceModel,
-    HuggingFaceToken,
-    OpenAICompatChatAPI,
-    OpenAICompatEmbeddingsAPI,
-    OptionalSecret,
-    ServiceAPI,
-)
-from apolo_app_types.protocols.custom_deployment import (
-    Container,
-    ContainerImage,
-    CustomDeploymentInputs,
-    CustomDeploymentOutputs,
-    InitContainer,
-)
-from apolo_app_types.protocols.dockerhub import (
-    DockerConfigModel,
-    DockerHubInputs,
-    DockerHubOutputs,
-)
-from apolo_app_types.protocols.fooocus import (
-    FooocusAppInputs,
-    FooocusAppOutputs,
-    FooocusInputs,
-    FooocusOutputs,
-)
-from apolo_app_types.protocols.github import (
-    GithubAppInputs,
-    GithubAppOutputs,
-    GithubAuth,
-    GithubImageRegistryAuth,
-)
-from apolo_app_types.protocols.hugging_face import (
-    HuggingFaceAppInputs,
-    HuggingFaceAppOutputs,
-    HuggingFaceCacheInputs,
-    HuggingFaceCacheOutputs,
-)
-from apolo_app_types.protocols.job import (
-    ContainerHTTPServer,
-    DiskVolume,
-    JobAdvancedConfig,
-    JobAppInput,
-    JobAppOutput,
-    JobImageConfig,
-    JobMetadataConfig,
-    JobNetworkingConfig,
-    JobPriority,
-    JobResourcesConfig,
-    JobRestartPolicy,
-    JobSchedulingConfig,
-    SecretVolume,
-)
-from apolo_app_types.protocols.jupyter import (
-    JupyterAppInputs,
-    JupyterAppOutputs,
-    JupyterInputs,
-    JupyterOutputs,
-    JupyterTypes,
-)
-from apolo_app_types.protocols.lightrag import (
-    AnthropicLLMProvider,
-    EmbeddingProvider,
-    GeminiLLMProvider,
-    LightRAGAppInputs,
-    LightRAGAppOutputs,
-    LightRAGEmbeddingConfig,
-    LightRAGLLMConfig,
-    LightRAGPersistence,
-    LLMProvider,
-    OllamaEmbeddingProvider,
-    OllamaLLMProvider,
-    OpenAIEmbeddingProvider,
-    OpenAILLMProvider,
-)
-from apolo_app_types.protocols.llm import (
-    LLMInputs,
-    LLMModelConfig,
-    OpenAICompatibleAPI,
-    OpenAICompatibleChatAPI,
-    OpenAICompatibleCompletionsAPI,
-    OpenAICompatibleEmbeddingsAPI,
-    VLLMOutputs,
-    VLLMOutputsV2,
-)
-from apolo_app_types.protocols.mlflow import (
-    MLFlowAppOutputs,
-    MLFlowTrackingServerURL,
-)
-from apolo_app_types.protocols.openwebui import (
-    OpenWebUIAppInputs,
-    OpenWebUIAppOutputs,
-)
-from apolo_app_types.protocols.postgres import (
-    CrunchyPostgresOutputs,
-    CrunchyPostgresUserCredentials,
-    PGBouncer,
-    PostgresConfig,
-    PostgresInputs,
-    PostgresOutputs,
-)
-from apolo_app_types.protocols.private_gpt import PrivateGPTInputs, PrivateGPTOutputs
-from apolo_app_types.protocols.pycharm import PycharmInputs, PycharmOutputs
-from apolo_app_types.protocols.shell import (
-    ShellAppInputs,
-    ShellAppOutputs,
-    ShellInputs,
-    ShellOutputs,
-)
-from apolo_app_types.protocols.spark_job import SparkJobInputs, SparkJobOutputs
-from apolo_app_types.protocols.stable_diffusion import (
-    SDModel,
-    SDOutputs,
-    StableDiffusionInputs,
-    StableDiffusionOutputs,
-    TextToImgAPI,
-)
-from apolo_app_types.protocols.text_embeddings import (
-    TextEmbeddingsInferenceAppInputs,
-    TextEmbeddingsInferenceAppOutputs,
-)
-from apolo_app_types.protocols.vscode import (
-    VSCodeAppInputs,
-    VSCodeAppOutputs,
-    VSCodeInputs,
-    VSCodeOutputs,
-)
-from apolo_app_types.protocols.weaviate import WeaviateInputs, WeaviateOutputs
+"""Apolo Platform App Types.
+
+Public names are resolved lazily: a protocol module is imported only when
+one of its names is first accessed, so entry points such as the hook CLI
+don't pay for building every pydantic model up front.
+"""
+
+import importlib
+import typing as t
+
+
+if t.TYPE_CHECKING:
+    from apolo_app_types.dynamic_outputs import (
+        BaseModelFilter,
+        DynamicAppBasicResponse,
+        DynamicAppFilterParams,
+        DynamicAppIdResponse,
+        DynamicAppListResponse,
+        FilterCondition,
+        FilterOperator,
+        compare_equal,
+        compare_like,
+        parse_filter_string,
+    )
+    from apolo_app_types.job_utils import JobRunParams, prepare_job_run_params
+    from apolo_app_types.protocols.apolo_deploy import (
+        ApoloDeployInputs,
+        ApoloDeployOutputs,
+    )
+    from apolo_app_types.protocols.bundles import (
+        DeepSeekR1Inputs,
+        GptOssInputs,
+        LLama4Inputs,
+        MistralInputs,
+    )
+    from apolo_app_types.protocols.common import (
+        ApoloFilesMount,
+        ApoloSecret,
+        AppInputs,
+        AppInputsDeployer,
+        AppOutputs,
+        AppOutputsDeployer,
+        BasicAuth,
+        Bucket,
+        Env,
+        HttpApi,
+        HuggingFaceModel,
+        HuggingFaceToken,
+        OpenAICompatChatAPI,
+        OpenAICompatEmbeddingsAPI,
+        OptionalSecret,
+        ServiceAPI,
+    )
+    from apolo_app_types.protocols.custom_deployment import (
+        Container,
+        ContainerImage,
+        CustomDeploymentInputs,
+        CustomDeploymentOutputs,
+        InitContainer,
+    )
+    from apolo_app_types.protocols.dockerhub import (
+        DockerConfigModel,
+        DockerHubInputs,
+        DockerHubOutputs,
+    )
+    from apolo_app_types.protocols.fooocus import (
+        FooocusAppInputs,
+        FooocusAppOutputs,
+        FooocusInputs,
+        FooocusOutputs,
+    )
+    from apolo_app_types.protocols.github import (
+        GithubAppInputs,
+        GithubAppOutputs,
+        GithubAuth,
+        GithubImageRegistryAuth,
+    )
+    from apolo_app_types.protocols.hugging_face import (
+        HuggingFaceAppInputs,
+        HuggingFaceAppOutputs,
+        HuggingFaceCacheInputs,
+        HuggingFaceCacheOutputs,
+    )
+    from apolo_app_types.protocols.job import (
+        ContainerHTTPServer,
+        DiskVolume,
+        JobAdvancedConfig,
+        JobAppInput,
+        JobAppOutput,
+        JobImageConfig,
+        JobMetadataConfig,
+        JobNetworkingConfig,
+        JobPriority,
+        JobResourcesConfig,
+        JobRestartPolicy,
+        JobSchedulingConfig,
+        SecretVolume,
+    )
+    from apolo_app_types.protocols.jupyter import (
+        JupyterAppInputs,
+        JupyterAppOutputs,
+        JupyterInputs,
+        JupyterOutputs,
+        JupyterTypes,
+    )
+    from apolo_app_types.protocols.lightrag import (
+        AnthropicLLMProvider,
+        EmbeddingProvider,
+        GeminiLLMProvider,
+        LightRAGAppInputs,
+        LightRAGAppOutputs,
+        LightRAGEmbeddingConfig,
+        LightRAGLLMConfig,
+        LightRAGPersistence,
+        LLMProvider,
+        OllamaEmbeddingProvider,
+        OllamaLLMProvider,
+        OpenAIEmbeddingProvider,
+        OpenAILLMProvider,
+    )
+    from apolo_app_types.protocols.llm import (
+        LLMInputs,
+        LLMModelConfig,
+        OpenAICompatibleAPI,
+        OpenAICompatibleChatAPI,
+        OpenAICompatibleCompletionsAPI,
+        OpenAICompatibleEmbeddingsAPI,
+        VLLMOutputs,
+        VLLMOutputsV2,
+    )
+    from apolo_app_types.protocols.mlflow import (
+        MLFlowAppOutputs,
+        MLFlowTrackingServerURL,
+    )
+    from apolo_app_types.protocols.openwebui import (
+        OpenWebUIAppInputs,
+        OpenWebUIAppOutputs,
+    )
+    from apolo_app_types.protocols.postgres import (
+        CrunchyPostgresOutputs,
+        CrunchyPostgresUserCredentials,
+        PGBouncer,
+        PostgresConfig,
+        PostgresInputs,
+        PostgresOutputs,
+    )
+    from apolo_app_types.protocols.private_gpt import (
+        PrivateGPTInputs,
+        PrivateGPTOutputs,
+    )
+    from apolo_app_types.protocols.pycharm import PycharmInputs, PycharmOutputs
+    from apolo_app_types.protocols.shell import (
+        ShellAppInputs,
+        ShellAppOutputs,
+        ShellInputs,
+        ShellOutputs,
+    )
+    from apolo_app_types.protocols.spark_job import SparkJobInputs, SparkJobOutputs
+    from apolo_app_types.protocols.stable_diffusion import (
+        SDModel,
+        SDOutputs,
+        StableDiffusionInputs,
+        StableDiffusionOutputs,
+        TextToImgAPI,
+    )
+    from apolo_app_types.protocols.text_embeddings import (
+        TextEmbeddingsInferenceAppInputs,
+        TextEmbeddingsInferenceAppOutputs,
+    )
+    from apolo_app_types.protocols.vscode import (
+        VSCodeAppInputs,
+        VSCodeAppOutputs,
+        VSCodeInputs,
+        VSCodeOutputs,
+    )
+    from apolo_app_types.protocols.weaviate import WeaviateInputs, WeaviateOutputs
+
+
+_LAZY_IMPORTS: dict[str, str] = {
+    "BaseModelFilter": "apolo_app_types.dynamic_outputs",
+    "DynamicAppBasicResponse": "apolo_app_types.dynamic_outputs",
+    "DynamicAppFilterParams": "apolo_app_types.dynamic_outputs",
+    "DynamicAppIdResponse": "apolo_app_types.dynamic_outputs",
+    "DynamicAppListResponse": "apolo_app_types.dynamic_outputs",
+    "FilterCondition": "apolo_app_types.dynamic_outputs",
+    "FilterOperator": "apolo_app_types.dynamic_outputs",
+    "compare_equal": "apolo_app_types.dynamic_outputs",
+    "compare_like": "apolo_app_types.dynamic_outputs",
+    "parse_filter_string": "apolo_app_types.dynamic_outputs",
+    "JobRunParams": "apolo_app_types.job_utils",
+    "prepare_job_run_params": "apolo_app_types.job_utils",
+    "ApoloDeployInputs": "apolo_app_types.protocols.apolo_deploy",
+    "ApoloDeployOutputs": "apolo_app_types.protocols.apolo_deploy",
+    "DeepSeekR1Inputs": "apolo_app_types.protocols.bundles",
+    "GptOssInputs": "apolo_app_types.protocols.bundles",
+    "LLama4Inputs": "apolo_app_types.protocols.bundles",
+    "MistralInputs": "apolo_app_types.protocols.bundles",
+    "ApoloFilesMount": "apolo_app_types.protocols.common",
+    "ApoloSecret": "apolo_app_types.protocols.common",
+    "AppInputs": "apolo_app_types.protocols.common",
+    "AppInputsDeployer": "apolo_app_types.protocols.common",
+    "AppOutputs": "apolo_app_types.protocols.common",
+    "AppOutputsDeployer": "apolo_app_types.protocols.common",
+    "BasicAuth": "apolo_app_types.protocols.common",
+    "Bucket": "apolo_app_types.protocols.common",
+    "Env": "apolo_app_types.protocols.common",
+    "HttpApi": "apolo_app_types.protocols.common",
+    "HuggingFaceModel": "apolo_app_types.protocols.common",
+    "HuggingFaceToken": "apolo_app_types.protocols.common",
+    "OpenAICompatChatAPI": "apolo_app_types.protocols.common",
+    "OpenAICompatEmbeddingsAPI": "apolo_app_types.protocols.common",
+    "OptionalSecret": "apolo_app_types.protocols.common",
+    "ServiceAPI": "apolo_app_types.protocols.common",
+    "Container": "apolo_app_types.protocols.custom_deployment",
+    "ContainerImage": "apolo_app_types.protocols.custom_deployment",
+    "CustomDeploymentInputs": "apolo_app_types.protocols.custom_deployment",
+    "CustomDeploymentOutputs": "apolo_app_types.protocols.custom_deployment",
+    "InitContainer": "apolo_app_types.protocols.custom_deployment",
+    "DockerConfigModel": "apolo_app_types.protocols.dockerhub",
+    "DockerHubInputs": "apolo_app_types.protocols.dockerhub",
+    "DockerHubOutputs": "apolo_app_types.protocols.dockerhub",
+    "FooocusAppInputs": "apolo_app_types.protocols.fooocus",
+    "FooocusAppOutputs": "apolo_app_types.protocols.fooocus",
+    "FooocusInputs": "apolo_app_types.protocols.fooocus",
+    "FooocusOutputs": "apolo_app_types.protocols.fooocus",
+    "GithubAppInputs": "apolo_app_types.protocols.github",
+    "GithubAppOutputs": "apolo_app_types.protocols.github",
+    "GithubAuth": "apolo_app_types.protocols.github",
+    "GithubImageRegistryAuth": "apolo_app_types.protocols.github",
+    "HuggingFaceAppInputs": "apolo_app_types.protocols.hugging_face",
+    "HuggingFaceAppOutputs": "apolo_app_types.protocols.hugging_face",
+    "HuggingFaceCacheInputs": "apolo_app_types.protocols.hugging_face",
+    "HuggingFaceCacheOutputs": "apolo_app_types.protocols.hugging_face",
+    "ContainerHTTPServer": "apolo_app_types.protocols.job",
+    "DiskVolume": "apolo_app_types.protocols.job",
+    "JobAdvancedConfig": "apolo_app_types.protocols.job",
+    "JobAppInput": "apolo_app_types.protocols.job",
+    "JobAppOutput": "apolo_app_types.protocols.job",
+    "JobImageConfig": "apolo_app_types.protocols.job",
+    "JobMetadataConfig": "apolo_app_types.protocols.job",
+    "JobNetworkingConfig": "apolo_app_types.protocols.job",
+    "JobPriority": "apolo_app_types.protocols.job",
+    "JobResourcesConfig": "apolo_app_types.protocols.job",
+    "JobRestartPolicy": "apolo_app_types.protocols.job",
+    "JobSchedulingConfig": "apolo_app_types.protocols.job",
+    "SecretVolume": "apolo_app_types.protocols.job",
+    "JupyterAppInputs": "apolo_app_types.protocols.jupyter",
+    "JupyterAppOutputs": "apolo_app_types.protocols.jupyter",
+    "JupyterInputs": "apolo_app_types.protocols.jupyter",
+    "JupyterOutputs": "apolo_app_types.protocols.jupyter",
+    "JupyterTypes": "apolo_app_types.protocols.jupyter",
+    "AnthropicLLMProvider": "apolo_app_types.protocols.lightrag",
+    "EmbeddingProvider": "apolo_app_types.protocols.lightrag",
+    "GeminiLLMProvider": "apolo_app_types.protocols.lightrag",
+    "LightRAGAppInputs": "apolo_app_types.protocols.lightrag",
+    "LightRAGAppOutputs": "apolo_app_types.protocols.lightrag",
+    "LightRAGEmbeddingConfig": "apolo_app_types.protocols.lightrag",
+    "LightRAGLLMConfig": "apolo_app_types.protocols.lightrag",
+    "LightRAGPersistence": "apolo_app_types.protocols.lightrag",
+    "LLMProvider": "apolo_app_types.protocols.lightrag",
+    "OllamaEmbeddingProvider": "apolo_app_types.protocols.lightrag",
+    "OllamaLLMProvider": "apolo_app_types.protocols.lightrag",
+    "OpenAIEmbeddingProvider": "apolo_app_types.protocols.lightrag",
+    "OpenAILLMProvider": "apolo_app_types.protocols.lightrag",
+    "LLMInputs": "apolo_app_types.protocols.llm",
+    "LLMModelConfig": "apolo_app_types.protocols.llm",
+    "OpenAICompatibleAPI": "apolo_app_types.protocols.llm",
+    "OpenAICompatibleChatAPI": "apolo_app_types.protocols.llm",
+    "OpenAICompatibleCompletionsAPI": "apolo_app_types.protocols.llm",
+    "OpenAICompatibleEmbeddingsAPI": "apolo_app_types.protocols.llm",
+    "VLLMOutputs": "apolo_app_types.protocols.llm",
+    "VLLMOutputsV2": "apolo_app_types.protocols.llm",
+    "MLFlowAppOutputs": "apolo_app_types.protocols.mlflow",
+    "MLFlowTrackingServerURL": "apolo_app_types.protocols.mlflow",
+    "OpenWebUIAppInputs": "apolo_app_types.protocols.openwebui",
+    "OpenWebUIAppOutputs": "apolo_app_types.protocols.openwebui",
+    "CrunchyPostgresOutputs": "apolo_app_types.protocols.postgres",
+    "CrunchyPostgresUserCredentials": "apolo_app_types.protocols.postgres",
+    "PGBouncer": "apolo_app_types.protocols.postgres",
+    "PostgresConfig": "apolo_app_types.protocols.postgres",
+    "PostgresInputs": "apolo_app_types.protocols.postgres",
+    "PostgresOutputs": "apolo_app_types.protocols.postgres",
+    "PrivateGPTInputs": "apolo_app_types.protocols.private_gpt",
+    "PrivateGPTOutputs": "apolo_app_types.protocols.private_gpt",
+    "PycharmInputs": "apolo_app_types.protocols.pycharm",
+    "PycharmOutputs": "apolo_app_types.protocols.pycharm",
+    "ShellAppInputs": "apolo_app_types.protocols.shell",
+    "ShellAppOutputs": "apolo_app_types.protocols.shell",
+    "ShellInputs": "apolo_app_types.protocols.shell",
+    "ShellOutputs": "apolo_app_types.protocols.shell",
+    "SparkJobInputs": "apolo_app_types.protocols.spark_job",
+    "SparkJobOutputs": "apolo_app_types.protocols.spark_job",
+    "SDModel": "apolo_app_types.protocols.stable_diffusion",
+    "SDOutputs": "apolo_app_types.protocols.stable_diffusion",
+    "StableDiffusionInputs": "apolo_app_types.protocols.stable_diffusion",
+    "StableDiffusionOutputs": "apolo_app_types.protocols.stable_diffusion",
+    "TextToImgAPI": "apolo_app_types.protocols.stable_diffusion",
+    "TextEmbeddingsInferenceAppInputs": "apolo_app_types.protocols.text_embeddings",
+    "TextEmbeddingsInferenceAppOutputs": "apolo_app_types.protocols.text_embeddings",
+    "VSCodeAppInputs": "apolo_app_types.protocols.vscode",
+    "VSCodeAppOutputs": "apolo_app_types.protocols.vscode",
+    "VSCodeInputs": "apolo_app_types.protocols.vscode",
+    "VSCodeOutputs": "apolo_app_types.protocols.vscode",
+    "WeaviateInputs": "apolo_app_types.protocols.weaviate",
+    "WeaviateOutputs": "apolo_app_types.protocols.weaviate",
+}
+
+# Submodules that used to be loaded as a side effect of importing the package.
+_LAZY_SUBMODULES = frozenset({"dynamic_outputs", "job_utils", "protocols"})
+
+
+def __getattr__(name: str) -> t.Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is not None:
+        value = getattr(importlib.import_module(module_name), name)
+    elif name in _LAZY_SUBMODULES:
+        value = importlib.import_module(f"{__name__}.{name}")
+    else:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_IMPORTS})
 
 
 __all__ = [
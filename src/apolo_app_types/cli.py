@@ -2,23 +2,32 @@ import asyncio
 import json
 import logging
 import os
-import re
 import sys
 import typing as t
 from pathlib import Path
 
-import apolo_sdk
 import click
-from yarl import URL
-
-from apolo_app_types.outputs.update_outputs import update_app_outputs
-from apolo_app_types.outputs.utils.cleanup import cleanup_secrets
-from apolo_app_types.outputs.utils.discovery import (
-    load_app_inputs,
-    load_app_outputs,
-    load_app_preprocessor,
+
+from apolo_app_types.clients.apolo_session import SessionParams, apolo_session
+from apolo_app_types.clients.offline import (
+    OfflineClient,
+    RecordedClusterConfig,
+    record_cluster_config,
+)
+from apolo_app_types.operations import (
+    _redact,
+    cleanup_app,
+    generate_helm_values,
+    load_outputs_class,
+    load_preprocessor,
 )
-from apolo_app_types.schema.schema_dumper import dump_schema_type
+from apolo_app_types.outputs.update_outputs import (
+    DEFAULT_POST_CONCURRENCY,
+    update_app_outputs,
+    update_apps_outputs,
+)
+from apolo_app_types.outputs.utils.cleanup import DEFAULT_CLEANUP_CONCURRENCY
+from apolo_app_types.schema.schema_dumper import dump_schema_type, dump_schema_types
 from apolo_app_types.utils.auth_validator import validate_auth_params
 
 
@@ -32,30 +41,12 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
-_SENSITIVE_RE = re.compile(
-    r"token|password|secret|api[_-]?key|credential|authorization", re.IGNORECASE
-)
-_REDACTED = "***REDACTED***"
-
-
-def _redact(obj: t.Any) -> t.Any:
-    """Recursively mask sensitive values so tokens/passwords never reach logs."""
-    if isinstance(obj, dict):
-        # env-var entries: {"name": "APOLO_API_TOKEN", "value": "<token>"}
-        name = obj.get("name")
-        if isinstance(name, str) and "value" in obj and _SENSITIVE_RE.search(name):
-            return {**obj, "value": _REDACTED}
-        return {
-            k: (
-                _REDACTED
-                if isinstance(k, str) and _SENSITIVE_RE.search(k)
-                else _redact(v)
-            )
-            for k, v in obj.items()
-        }
-    if isinstance(obj, list):
-        return [_redact(item) for item in obj]
-    return obj
+
+def _log_to_stderr() -> None:
+    """Move logs off stdout, for commands that print their result there."""
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, logging.StreamHandler) and handler.stream is sys.stdout:
+            handler.setStream(sys.stderr)
 
 
 @click.group()
@@ -88,7 +79,7 @@ def update_outputs(
             helm_outputs_json = helm_outputs_json[1:-1]
         helm_outputs_dict = json.loads(helm_outputs_json)
         logger.info("Helm input: %s", _redact(helm_outputs_dict))
-        asyncio.run(
+        result = asyncio.run(
             update_app_outputs(
                 helm_outputs_dict,
                 app_output_processor_type=app_output_processor_type,
@@ -104,6 +95,56 @@ def update_outputs(
     except Exception as e:
         logger.error("An error occurred: %s", e)
         sys.exit(1)
+    if not result.ok:
+        logger.error(
+            "Failed to post outputs after %d attempt(s): %s",
+            result.attempts,
+            result.error,
+        )
+        sys.exit(result.exit_code)
+
+
+@cli.command("update-outputs-batch")
+@click.argument("instances_json_path", type=Path)
+@click.option(
+    "--max-concurrency",
+    type=click.IntRange(min=1),
+    envvar="APOLO_OUTPUTS_MAX_CONCURRENCY",
+    default=DEFAULT_POST_CONCURRENCY,
+    show_default=True,
+)
+def update_outputs_batch(instances_json_path: Path, max_concurrency: int) -> None:
+    """Update the outputs of many app instances of the current namespace.
+
+    INSTANCES_JSON_PATH is a JSON object mapping app instance ids to their
+    helm values.
+    """
+    try:
+        instances = json.loads(instances_json_path.read_text())
+        results = asyncio.run(
+            update_apps_outputs(instances, max_concurrency=max_concurrency)
+        )
+    except json.JSONDecodeError as e:
+        logger.error("Failed to parse JSON input: %s", e)
+        sys.exit(1)
+    except Exception as e:
+        logger.error("An error occurred: %s", e)
+        sys.exit(1)
+    failed = {
+        instance_id: result for instance_id, result in results.items() if not result.ok
+    }
+    for instance_id, result in failed.items():
+        logger.error(
+            "Failed to update outputs of %s after %d attempt(s): %s",
+            instance_id,
+            result.attempts,
+            result.error,
+        )
+    logger.info(
+        "Updated outputs of %d/%d instances", len(results) - len(failed), len(results)
+    )
+    if failed:
+        sys.exit(1)
 
 
 @cli.command("run-preprocessor", context_settings={"ignore_unknown_options": True})
@@ -154,44 +195,32 @@ def run_preprocessor(
             else:
                 # for backwards compatibility
                 inputs_dict = json.loads(inputs_json)
-            inputs_class = load_app_inputs(app_type, package_name, inputs_type)
-            if not inputs_class:
-                err_msg = f"Unable to find inputs type for {app_type=}, {inputs_type=}"
-                raise ValueError(err_msg)
-
-            loaded_inputs = inputs_class.model_validate(inputs_dict)
-            logger.info("Loaded inputs: %s", _redact(loaded_inputs.model_dump()))
-
-            preprocessor_class = load_app_preprocessor(
-                app_type, package_name, preprocessor_type
+            loaded_inputs, preprocessor_class = load_preprocessor(
+                app_type,
+                package_name,
+                inputs_dict,
+                inputs_type=inputs_type,
+                preprocessor_type=preprocessor_type,
             )
-            if not preprocessor_class:
-                err_msg = (
-                    f"Unable to find preprocessor {app_type=}, {preprocessor_type=},"
-                    f" Package: {package_name}"
-                )
-                raise ValueError(err_msg)
 
-            await apolo_sdk.login_with_token(
-                token=apolo_api_token,
-                url=URL(apolo_api_url),
+            session = SessionParams.resolve(
+                api_url=apolo_api_url,
+                api_token=apolo_api_token,
+                org=apolo_org,
+                cluster=apolo_cluster,
+                project=apolo_project,
             )
-            async with apolo_sdk.get() as client:
-                await client.config.switch_org(apolo_org)
-                await client.config.switch_cluster(apolo_cluster)
-                await client.config.switch_project(apolo_project)
-
-                chart_processor = preprocessor_class(client)
-                extra_helm_args = await chart_processor.gen_extra_helm_args()
-                extra_vals = await chart_processor.gen_extra_values(
-                    input_=loaded_inputs,
+            async with apolo_session(session) as client:
+                extra_helm_args, extra_vals = await generate_helm_values(
+                    client,
+                    loaded_inputs,
+                    preprocessor_class,
                     app_name=app_name,
                     namespace=namespace,
-                    app_secrets_name=apps_secret_name,
                     app_id=app_id,
+                    apps_secret_name=apps_secret_name,
+                    apolo_passed_config=apolo_passed_config,
                 )
-                if apolo_passed_config:
-                    extra_vals["APOLO_PASSED_CONFIG"] = apolo_passed_config
                 with helm_values_path.open("w") as f:  # noqa: ASYNC230
                     json.dump(extra_vals, f)
                 with helm_args_path.open("w") as f:  # noqa: ASYNC230
@@ -206,23 +235,163 @@ def run_preprocessor(
     asyncio.run(_run_preprocessor())
 
 
+@cli.command("render-values")
+@click.argument("app_type", type=str)
+@click.argument("inputs_json_path", type=Path)
+@click.argument("cluster_config_path", type=Path)
+@click.option(
+    "--output",
+    "output_path",
+    type=Path,
+    default=None,
+    help="Write the result to this file instead of stdout.",
+)
+@click.option("--app-name", type=str, default="app", show_default=True)
+@click.option("--namespace", type=str, default="default", show_default=True)
+@click.option("--app-id", type=str, default="offline", show_default=True)
+@click.option("--apps-secret-name", type=str, default="apps-secrets", show_default=True)
+@click.option("--inputs-type", type=str, envvar="APOLO_APP_INPUTS_TYPE")
+@click.option("--preprocessor-type", type=str, envvar="APOLO_APP_PREPROCESSOR_TYPE")
+@click.option("--package-name", type=str, default="apolo_app_types")
+def render_values(
+    app_type: str,
+    inputs_json_path: Path,
+    cluster_config_path: Path,
+    output_path: Path | None,
+    app_name: str,
+    namespace: str,
+    app_id: str,
+    apps_secret_name: str,
+    inputs_type: str | None,
+    preprocessor_type: str | None,
+    package_name: str,
+) -> None:
+    """Render helm args and values offline, from a recorded cluster config.
+
+    INPUTS_JSON_PATH holds one inputs object, or a list of them to render
+    several variants, in which case the output is a list as well.
+    CLUSTER_CONFIG_PATH is a cluster config saved by record-cluster-config.
+    """
+    if output_path is None:
+        _log_to_stderr()
+
+    async def _render(variants: list[dict[str, t.Any]]) -> list[dict[str, t.Any]]:
+        client = OfflineClient.from_file(cluster_config_path).as_client()
+        rendered = []
+        for inputs_dict in variants:
+            loaded_inputs, preprocessor_class = load_preprocessor(
+                app_type,
+                package_name,
+                inputs_dict,
+                inputs_type=inputs_type,
+                preprocessor_type=preprocessor_type,
+            )
+            helm_args, helm_values = await generate_helm_values(
+                client,
+                loaded_inputs,
+                preprocessor_class,
+                app_name=app_name,
+                namespace=namespace,
+                app_id=app_id,
+                apps_secret_name=apps_secret_name,
+            )
+            rendered.append({"helm_args": helm_args, "helm_values": helm_values})
+        return rendered
+
+    try:
+        inputs = json.loads(inputs_json_path.read_text())
+        rendered = asyncio.run(
+            _render(inputs if isinstance(inputs, list) else [inputs])
+        )
+    except json.JSONDecodeError as e:
+        logger.error("Failed to parse JSON input: %s", e)
+        sys.exit(1)
+    except Exception as e:
+        logger.error("An error occurred: %s", e)
+        sys.exit(1)
+    result = json.dumps(rendered if isinstance(inputs, list) else rendered[0])
+    if output_path is not None:
+        output_path.write_text(result)
+    else:
+        click.echo(result)
+
+
+@cli.command("record-cluster-config")
+@click.argument("output_path", type=Path)
+@click.option("--apolo-api-url", type=str, envvar="APOLO_API_URL")
+@click.option("--apolo-api-token", type=str, envvar="APOLO_API_TOKEN")
+@click.option("--apolo-org", type=str, envvar="APOLO_ORG")
+@click.option("--apolo-cluster", type=str, envvar="APOLO_CLUSTER")
+@click.option("--apolo-project", type=str, envvar="APOLO_PROJECT")
+@click.option("--apolo-passed-config", type=str, envvar="APOLO_PASSED_CONFIG")
+def record_cluster_config_command(
+    output_path: Path,
+    apolo_api_url: str | None,
+    apolo_api_token: str | None,
+    apolo_org: str | None,
+    apolo_cluster: str | None,
+    apolo_project: str | None,
+    apolo_passed_config: str | None,
+) -> None:
+    """Save the cluster config render-values needs to OUTPUT_PATH."""
+
+    async def _record() -> RecordedClusterConfig:
+        session = SessionParams.resolve(
+            api_url=apolo_api_url,
+            api_token=apolo_api_token,
+            passed_config=apolo_passed_config,
+            org=apolo_org,
+            cluster=apolo_cluster,
+            project=apolo_project,
+        )
+        async with apolo_session(session) as client:
+            return await record_cluster_config(client)
+
+    try:
+        recorded = asyncio.run(_record())
+    except Exception as e:
+        logger.error("An error occurred: %s", e)
+        sys.exit(1)
+    output_path.write_text(recorded.model_dump_json(indent=2))
+
+
 @cli.command("dump-types-schema")
 @click.argument("app_package_path", type=Path)
-@click.argument("exact_type_name", type=str)
-@click.argument("output_path", type=Path)
+@click.argument("exact_type_name", type=str, required=False)
+@click.argument("output_path", type=Path, required=False)
+@click.option(
+    "--output-dir",
+    type=Path,
+    default=None,
+    help="Dump every input/output type of the package into this directory.",
+)
+@click.option(
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Worker processes for --output-dir, one per CPU by default.",
+)
 def dump_types_schema(
     app_package_path: Path,
-    exact_type_name: str,
-    output_path: Path,
+    exact_type_name: str | None,
+    output_path: Path | None,
+    output_dir: Path | None,
+    jobs: int | None,
 ) -> None:
     """Dump the schema of the given application input/output type
     from the given app package.
 
+    With --output-dir, dump the schemas of all input/output types of the
+    package instead, as <TypeName>.json files; files whose content is
+    unchanged are not rewritten.
+
     Args:
         app_package_path (Path): The path to the application package,
         absolute or relative to the current working directory.
         exact_type_name (str): The exact type name to dump the schema for.
         output_path (Path): The path to the output file.
+        output_dir (Path): The directory to dump all schemas into.
+        jobs (int): The number of worker processes for the bulk mode.
 
     Raises:
         ValueError: If the package path does not exist or does not contain __init__.py.
@@ -230,6 +399,19 @@ def dump_types_schema(
             application type name.
         ValueError: If the exact type name is not found in the application package.
     """
+    if output_dir is not None:
+        if exact_type_name or output_path:
+            msg = "EXACT_TYPE_NAME and OUTPUT_PATH can't be used with --output-dir"
+            raise click.UsageError(msg)
+        dump_schema_types(
+            app_package_path=app_package_path,
+            output_dir=output_dir,
+            jobs=jobs,
+        )
+        return
+    if not exact_type_name or not output_path:
+        msg = "EXACT_TYPE_NAME and OUTPUT_PATH are required without --output-dir"
+        raise click.UsageError(msg)
     dump_schema_type(
         app_package_path=app_package_path,
         exact_type_name=exact_type_name,
@@ -248,6 +430,13 @@ def dump_types_schema(
 @click.option("--apolo-project", type=str, envvar="APOLO_PROJECT")
 @click.option("--package-name", type=str, default="apolo_app_types")
 @click.option("--apolo-passed-config", type=str, envvar="APOLO_PASSED_CONFIG")
+@click.option(
+    "--max-concurrency",
+    type=click.IntRange(min=1),
+    envvar="APOLO_CLEANUP_MAX_CONCURRENCY",
+    default=DEFAULT_CLEANUP_CONCURRENCY,
+    show_default=True,
+)
 def cleanup(
     app_type: str,
     app_id: str,
@@ -259,32 +448,27 @@ def cleanup(
     apolo_project: str,
     package_name: str,
     apolo_passed_config: str | None,
+    max_concurrency: int,
 ) -> None:
     async def _cleanup_secrets() -> None:
         await validate_auth_params(apolo_api_token, apolo_api_url, apolo_passed_config)
         logging.basicConfig(level=logging.DEBUG)
         try:
-            output_class = load_app_outputs(app_type, package_name, output_type)
-            if not output_class:
-                err_msg = (
-                    f"Unable to find Output Type {app_type=}, {output_type=},"
-                    f" Package: {package_name}"
-                )
-                raise ValueError(err_msg)
-            if apolo_api_token:
-                await apolo_sdk.login_with_token(
-                    token=apolo_api_token,
-                    url=URL(apolo_api_url),
-                )
-            async with apolo_sdk.get() as client:
-                if apolo_org:
-                    await client.config.switch_org(apolo_org)
-                if apolo_cluster:
-                    await client.config.switch_cluster(apolo_cluster)
-                if apolo_project:
-                    await client.config.switch_project(apolo_project)
-                await cleanup_secrets(
-                    app_id=app_id, output_class=output_class, client=client
+            output_class = load_outputs_class(app_type, package_name, output_type)
+            session = SessionParams.resolve(
+                api_url=apolo_api_url,
+                api_token=apolo_api_token,
+                passed_config=apolo_passed_config,
+                org=apolo_org,
+                cluster=apolo_cluster,
+                project=apolo_project,
+            )
+            async with apolo_session(session) as client:
+                await cleanup_app(
+                    client,
+                    app_id=app_id,
+                    output_class=output_class,
+                    max_concurrency=max_concurrency,
                 )
         except Exception as e:
             logger.error("An error occurred: %s", e)
@@ -293,5 +477,82 @@ def cleanup(
     asyncio.run(_cleanup_secrets())
 
 
+@cli.command("serve")
+@click.option("--host", type=str, default="127.0.0.1", show_default=True)
+@click.option("--port", type=int, default=8085, show_default=True)
+@click.option(
+    "--unix-socket",
+    type=Path,
+    default=None,
+    help="Listen on this Unix socket, only usable by the current user, "
+    "instead of --host/--port.",
+)
+@click.option(
+    "--auth-token",
+    type=str,
+    envvar="APOLO_APP_TYPES_SERVE_TOKEN",
+    help="Bearer token requests must send. Required unless --unix-socket is set.",
+)
+@click.option(
+    "--no-preload",
+    is_flag=True,
+    help="Don't import the protocol models and outputs generators on start.",
+)
+@click.option(
+    "--cache-ttl",
+    type=click.FloatRange(min=0),
+    default=300.0,
+    show_default=True,
+    help="Seconds to keep API clients and resolved app packages.",
+)
+@click.option("--apolo-api-url", type=str, envvar="APOLO_API_URL")
+@click.option("--apolo-org", type=str, envvar="APOLO_ORG")
+@click.option("--apolo-cluster", type=str, envvar="APOLO_CLUSTER")
+@click.option("--apolo-project", type=str, envvar="APOLO_PROJECT")
+def serve(
+    host: str,
+    port: int,
+    unix_socket: Path | None,
+    auth_token: str | None,
+    no_preload: bool,  # noqa: FBT001
+    cache_ttl: float,
+    apolo_api_url: str | None,
+    apolo_org: str | None,
+    apolo_cluster: str | None,
+    apolo_project: str | None,
+) -> None:
+    """Serve run-preprocessor, update-outputs and cleanup requests.
+
+    Keeps one interpreter warm, with the protocol models preloaded and one
+    logged-in API client per set of credentials. Requests carry their own
+    credentials; the --apolo-* options fill in the API URL and the
+    org/cluster/project they don't give.
+    """
+    if unix_socket is None and not auth_token:
+        msg = "--auth-token is required when listening on --host/--port"
+        raise click.UsageError(msg)
+
+    from aiohttp import web
+
+    from apolo_app_types.server import ApoloAuth, bind_unix_socket, create_app
+
+    default_auth = ApoloAuth(
+        api_url=apolo_api_url,
+        org=apolo_org,
+        cluster=apolo_cluster,
+        project=apolo_project,
+    )
+    app = create_app(
+        default_auth,
+        auth_token=auth_token,
+        preload_models=not no_preload,
+        cache_ttl=cache_ttl,
+    )
+    if unix_socket is not None:
+        web.run_app(app, sock=bind_unix_socket(unix_socket))
+    else:
+        web.run_app(app, host=host, port=port)
+
+
 if __name__ == "__main__":
     cli()
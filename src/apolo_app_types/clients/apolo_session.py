@@ -0,0 +1,207 @@
+"""Process-wide apolo_sdk sessions.
+
+Logging in with ``apolo_sdk.login_with_token`` and switching org, cluster
+and project rewrites the client config and, for the login, fetches the
+server config. bootstrap_config() does this once per set of parameters,
+into a directory private to this process, and every later client opened
+for the same parameters reuses that config. Only the MAX_SESSIONS most
+recently used configs are kept.
+"""
+
+import asyncio
+import atexit
+import base64
+import binascii
+import collections
+import contextlib
+import dataclasses
+import json
+import logging
+import shutil
+import tempfile
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import apolo_sdk
+from yarl import URL
+
+
+logger = logging.getLogger(__name__)
+
+# Configs kept on disk, twice the clients the serve pool holds by default
+MAX_SESSIONS = 32
+
+_config_paths: collections.OrderedDict["SessionParams", Path] = (
+    collections.OrderedDict()
+)
+_config_locks: dict["SessionParams", asyncio.Lock] = {}
+_root: Path | None = None
+
+
+@dataclasses.dataclass(frozen=True)
+class SessionParams:
+    """Credentials and the org/cluster/project a session works in."""
+
+    api_url: str | None = None
+    api_token: str | None = dataclasses.field(default=None, repr=False)
+    org: str | None = None
+    cluster: str | None = None
+    project: str | None = None
+
+    @classmethod
+    def resolve(
+        cls,
+        *,
+        api_url: str | None = None,
+        api_token: str | None = None,
+        passed_config: str | None = None,
+        org: str | None = None,
+        cluster: str | None = None,
+        project: str | None = None,
+    ) -> "SessionParams":
+        """
+        Combine explicit parameters with a base64 ``APOLO_PASSED_CONFIG``.
+
+        Explicit parameters win over the ones carried by the passed config.
+        """
+        if passed_config:
+            data = _decode_passed_config(passed_config)
+            api_url = api_url or data["url"]
+            api_token = api_token or data["token"]
+            cluster = cluster or data["cluster"]
+            org = org or data.get("org_name")
+            project = project or data.get("project_name")
+        if api_token and not api_url:
+            msg = "api_url is required together with api_token"
+            raise ValueError(msg)
+        return cls(
+            api_url=api_url,
+            api_token=api_token,
+            org=org,
+            cluster=cluster,
+            project=project,
+        )
+
+
+def _decode_passed_config(passed_config: str) -> dict[str, str]:
+    try:
+        data = json.loads(base64.b64decode(passed_config).decode())
+        if not all(key in data for key in ("token", "cluster", "url")):
+            raise KeyError
+    except (binascii.Error, UnicodeDecodeError, ValueError, KeyError) as e:
+        msg = "Passed config is malformed"
+        raise ValueError(msg) from e
+    return data
+
+
+def _session_root() -> Path:
+    global _root
+    if _root is None:
+        _root = Path(tempfile.mkdtemp(prefix="apolo-app-types-"))
+        atexit.register(shutil.rmtree, _root, ignore_errors=True)
+    return _root
+
+
+async def _switch_targets(client: apolo_sdk.Client, params: SessionParams) -> None:
+    """Switch to the org, cluster and project given in ``params``.
+
+    Names that are not given are left to the SDK, which keeps the current
+    ones while they are still valid.
+    """
+    if params.org:
+        await client.config.switch_org(params.org)
+    if params.cluster:
+        await client.config.switch_cluster(params.cluster)
+    if params.project:
+        await client.config.switch_project(params.project)
+
+
+async def bootstrap_config(params: SessionParams) -> Path | None:
+    """
+    Log in and switch to the targets of ``params`` once per process.
+
+    Returns the config directory to open clients from, or None when
+    ``params`` carry no token and the default user config applies.
+    """
+    if not params.api_token or not params.api_url:
+        return None
+    path = _config_paths.get(params)
+    if path is not None:
+        _config_paths.move_to_end(params)
+        return path
+    lock = _config_locks.setdefault(params, asyncio.Lock())
+    try:
+        async with lock:
+            path = _config_paths.get(params)
+            if path is None:
+                path = Path(tempfile.mkdtemp(dir=_session_root()))
+                try:
+                    await apolo_sdk.login_with_token(
+                        params.api_token, url=URL(params.api_url), path=path
+                    )
+                    async with await apolo_sdk.Factory(path).get() as client:
+                        await _switch_targets(client, params)
+                        config = client.config
+                        logger.info(
+                            "Apolo session for %s/%s/%s",
+                            config.cluster_name,
+                            config.org_name,
+                            config.project_name,
+                        )
+                except BaseException:
+                    # start from scratch on the next attempt
+                    shutil.rmtree(path, ignore_errors=True)
+                    raise
+                if params in _config_paths:
+                    # bootstrapped concurrently behind a dropped lock, keep one
+                    shutil.rmtree(path, ignore_errors=True)
+                    path = _config_paths[params]
+                else:
+                    _config_paths[params] = path
+                    _evict_sessions()
+    finally:
+        if not lock.locked():
+            # locks only guard the bootstrap, drop them once nobody waits
+            _config_locks.pop(params, None)
+    return path
+
+
+def _evict_sessions() -> None:
+    """Remove the least recently used configs beyond MAX_SESSIONS."""
+    while len(_config_paths) > MAX_SESSIONS:
+        _, path = _config_paths.popitem(last=False)
+        logger.debug("Removing the Apolo session config %s", path)
+        shutil.rmtree(path, ignore_errors=True)
+
+
+async def open_client(params: SessionParams) -> apolo_sdk.Client:
+    """Open a client for ``params``; the caller closes it."""
+    path = await bootstrap_config(params)
+    client = await apolo_sdk.Factory(path).get()
+    if path is not None:
+        return client
+    # the default user config is shared, switch it the regular way
+    try:
+        await _switch_targets(client, params)
+    except BaseException:
+        await client.close()
+        raise
+    return client
+
+
+@contextlib.asynccontextmanager
+async def apolo_session(params: SessionParams) -> AsyncIterator[apolo_sdk.Client]:
+    """Open a client for ``params`` and close it on exit."""
+    client = await open_client(params)
+    try:
+        yield client
+    finally:
+        await client.close()
+
+
+def reset_sessions() -> None:
+    """Remove the configs written so far, e.g. after the tokens changed."""
+    for path in _config_paths.values():
+        shutil.rmtree(path, ignore_errors=True)
+    _config_paths.clear()
+    _config_locks.clear()
@@ -1,3 +1,5 @@
+import asyncio
+import functools
 import logging
 import os
 import typing
@@ -6,11 +8,33 @@ from pathlib import Path
 from kubernetes import client, config  # type: ignore
 from kubernetes.client.rest import ApiException  # type: ignore
 
+from apolo_app_types.clients import snapshot as instance_snapshot
+
 
 logger = logging.getLogger(__name__)
 
 SERVICE_ACC_NAMESPACE_FILE = "/var/run/secrets/kubernetes.io/serviceaccount/namespace"
 NAMESPACE_ENV_VAR = "APOLO_APP_NAMESPACE"
+INSTANCE_LABEL = "app.kubernetes.io/instance"
+
+
+@functools.cache
+def get_api_client() -> client.ApiClient:
+    """
+    Return the process-wide ApiClient.
+
+    In-cluster config is loaded once and every API wrapper shares the same
+    urllib3 pool, so consecutive calls reuse keep-alive connections instead of
+    paying a TLS handshake each time.
+    """
+    config.load_incluster_config()
+    return client.ApiClient()
+
+
+def reset_api_client() -> None:
+    """Drop the cached ApiClient and namespace, e.g. after a config change."""
+    get_api_client.cache_clear()
+    _read_service_account_namespace.cache_clear()
 
 
 def get_current_namespace() -> str:
@@ -19,6 +43,11 @@ def get_current_namespace() -> str:
     """
     if NAMESPACE_ENV_VAR in os.environ:
         return os.environ[NAMESPACE_ENV_VAR]
+    return _read_service_account_namespace()
+
+
+@functools.cache
+def _read_service_account_namespace() -> str:
     try:
         with Path.open(Path(SERVICE_ACC_NAMESPACE_FILE)) as f:
             return f.read().strip()
@@ -33,15 +62,16 @@ def get_current_namespace() -> str:
 
 async def get_ingresses_as_dict(label_selectors: str) -> dict[str, typing.Any]:
     try:
-        config.load_incluster_config()
-
-        networking_v1 = client.NetworkingV1Api()
+        api_client = get_api_client()
+        networking_v1 = client.NetworkingV1Api(api_client)
         namespace = get_current_namespace()
-        ingresses = networking_v1.list_namespaced_ingress(
-            namespace=namespace, label_selector=label_selectors
+        ingresses = await asyncio.to_thread(
+            networking_v1.list_namespaced_ingress,
+            namespace=namespace,
+            label_selector=label_selectors,
         )
 
-        return client.ApiClient().sanitize_for_serialization(ingresses)
+        return api_client.sanitize_for_serialization(ingresses)
 
     except ApiException as e:
         err_msg = (
@@ -53,15 +83,16 @@ async def get_ingresses_as_dict(label_selectors: str) -> dict[str, typing.Any]:
 
 async def get_services_by_label(label_selectors: str) -> dict[str, typing.Any]:
     try:
-        config.load_incluster_config()
-
-        v1 = client.CoreV1Api()
+        api_client = get_api_client()
+        v1 = client.CoreV1Api(api_client)
         namespace = get_current_namespace()
-        services = v1.list_namespaced_service(
-            namespace=namespace, label_selector=label_selectors
+        services = await asyncio.to_thread(
+            v1.list_namespaced_service,
+            namespace=namespace,
+            label_selector=label_selectors,
         )
 
-        return client.ApiClient().sanitize_for_serialization(services)
+        return api_client.sanitize_for_serialization(services)
 
     except ApiException as e:
         err_msg = f"Exception when calling CoreV1Api->list_namespaced_service: {e}"
@@ -73,11 +104,11 @@ async def get_middleware_by_label(
     label_selectors: str, namespace: str | None = None
 ) -> dict[str, typing.Any]:
     try:
-        config.load_incluster_config()
-
-        api = client.CustomObjectsApi()
+        api_client = get_api_client()
+        api = client.CustomObjectsApi(api_client)
         namespace = namespace or get_current_namespace()
-        middlewares = api.list_namespaced_custom_object(
+        middlewares = await asyncio.to_thread(
+            api.list_namespaced_custom_object,
             group="traefik.io",
             version="v1alpha1",
             namespace=namespace,
@@ -85,7 +116,7 @@ async def get_middleware_by_label(
             label_selector=label_selectors,
         )
 
-        return client.ApiClient().sanitize_for_serialization(middlewares)
+        return api_client.sanitize_for_serialization(middlewares)
 
     except ApiException as e:
         err_msg = f"Exception when calling fetching middleware list: {e}"
@@ -94,6 +125,9 @@ async def get_middleware_by_label(
 
 
 async def get_services(match_labels: dict[str, str]) -> list[dict[str, typing.Any]]:
+    snapshot = instance_snapshot.get_active_snapshot(match_labels)
+    if snapshot is not None:
+        return await snapshot.find_services(match_labels)
     label_selectors = ",".join(f"{k}={v}" for k, v in match_labels.items())
     get_svc_stdout = await get_services_by_label(label_selectors)
 
@@ -103,6 +137,9 @@ async def get_services(match_labels: dict[str, str]) -> list[dict[str, typing.An
 async def get_middlewares(
     match_labels: dict[str, str], namespace: str | None = None
 ) -> list[dict[str, typing.Any]]:
+    snapshot = instance_snapshot.get_active_snapshot(match_labels)
+    if snapshot is not None and namespace is None:
+        return await snapshot.find_middlewares(match_labels)
     label_selectors = ",".join(f"{k}={v}" for k, v in match_labels.items())
     get_middleware_stdout = await get_middleware_by_label(label_selectors, namespace)
 
@@ -127,12 +164,12 @@ async def get_service_host_port(match_labels: dict[str, str]) -> tuple[str, str]
 
 async def get_secret(label: str) -> typing.Any:
     try:
-        config.load_incluster_config()
-
-        v1 = client.CoreV1Api()
+        api_client = get_api_client()
+        v1 = client.CoreV1Api(api_client)
         namespace = get_current_namespace()
 
-        return v1.list_namespaced_secret(
+        return await asyncio.to_thread(
+            v1.list_namespaced_secret,
             namespace=namespace,
             label_selector=label,
         )
@@ -150,10 +187,8 @@ def get_crd_objects(
     crd_plural_name: str,
     label_selector: str | None = None,
 ) -> dict[str, typing.Any]:
-    config.load_incluster_config()
-
     namespace = get_current_namespace()
-    api = client.CustomObjectsApi()
+    api = client.CustomObjectsApi(get_api_client())
     return api.list_namespaced_custom_object(
         group=api_group,
         version=api_version,
@@ -0,0 +1,196 @@
+"""Offline stand-in for apolo_sdk.Client.
+
+Chart value processors read presets, resource pools, hostname templates
+and job capacity from the client. OfflineClient answers these from a
+recorded cluster config, so values can be rendered with no network, e.g.
+for many input variants in CI or to measure processor throughput::
+
+    {
+      "cluster_name": "default",
+      "org_name": "my-org",
+      "project_name": "my-project",
+      "username": "me",
+      "registry_url": "https://registry.default.org.apolo.us",
+      "hostname_templates": ["{app_name}.apps.default.org.apolo.us"],
+      "presets": {
+        "cpu-small": {
+          "credits_per_hour": "0.05", "cpu": 1.0, "memory": 4294967296,
+          "available_resource_pool_names": ["cpu-pool"]
+        }
+      },
+      "resource_pools": {
+        "cpu-pool": {
+          "min_size": 1, "max_size": 4, "cpu": 8.0,
+          "memory": 34359738368, "disk_size": 107374182400
+        }
+      },
+      "capacity": {"cpu-small": 10}
+    }
+
+Presets and resource pools use the field names of apolo_sdk.Preset and
+apolo_sdk.ResourcePool. Secrets live in memory for the lifetime of the
+client; other client APIs (buckets, service accounts, ...) are not
+available offline.
+"""
+
+import json
+import typing as t
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import apolo_sdk
+from pydantic import BaseModel
+from yarl import URL
+
+
+class RecordedClusterConfig(BaseModel):
+    """The part of a cluster config chart value processors read."""
+
+    cluster_name: str
+    org_name: str
+    project_name: str | None = None
+    username: str = "offline"
+    api_url: str = "https://api.apolo.us/api/v1"
+    registry_url: str | None = None
+    hostname_templates: list[str] = []
+    presets: dict[str, apolo_sdk.Preset] = {}
+    resource_pools: dict[str, apolo_sdk.ResourcePool] = {}
+    capacity: dict[str, int] = {}
+
+    @classmethod
+    def from_file(cls, path: Path) -> "RecordedClusterConfig":
+        return cls.model_validate(json.loads(path.read_text()))
+
+
+async def record_cluster_config(client: apolo_sdk.Client) -> RecordedClusterConfig:
+    """Record the cluster config of a live client for offline use."""
+    config = client.config
+    cluster = config.get_cluster(config.cluster_name)
+    return RecordedClusterConfig(
+        cluster_name=config.cluster_name,
+        org_name=config.org_name,
+        project_name=config.project_name,
+        username=config.username,
+        api_url=str(config.api_url),
+        registry_url=str(config.registry_url),
+        hostname_templates=list(cluster.apps.hostname_templates),
+        presets=dict(config.presets),
+        resource_pools=dict(config.resource_pools),
+        capacity=dict(await client.jobs.get_capacity()),
+    )
+
+
+@dataclass(frozen=True)
+class OfflineCluster:
+    name: str
+    registry_url: URL
+    apps: apolo_sdk.AppsConfig
+    orgs: list[str] = field(default_factory=list)
+
+
+class OfflineConfig:
+    """The subset of apolo_sdk.Config read by processors and the parser."""
+
+    def __init__(self, recorded: RecordedClusterConfig) -> None:
+        self.cluster_name = recorded.cluster_name
+        self.org_name = recorded.org_name
+        self.project_name = recorded.project_name
+        self.username = recorded.username
+        self.api_url = URL(recorded.api_url)
+        self.registry_url = URL(
+            recorded.registry_url
+            or f"https://registry.{recorded.cluster_name}.org.apolo.us"
+        )
+        self.presets = recorded.presets
+        self.resource_pools = recorded.resource_pools
+        self.clusters = {
+            self.cluster_name: OfflineCluster(
+                name=self.cluster_name,
+                registry_url=self.registry_url,
+                apps=apolo_sdk.AppsConfig(
+                    hostname_templates=tuple(recorded.hostname_templates)
+                ),
+                orgs=[self.org_name],
+            )
+        }
+
+    @property
+    def project_name_or_raise(self) -> str:
+        if not self.project_name:
+            msg = "The recorded cluster config has no project_name"
+            raise apolo_sdk.ConfigError(msg)
+        return self.project_name
+
+    def get_cluster(self, name: str) -> OfflineCluster:
+        try:
+            return self.clusters[name]
+        except KeyError:
+            msg = f"Cluster {name} is not recorded, only {self.cluster_name} is"
+            raise RuntimeError(msg) from None
+
+
+class OfflineJobs:
+    def __init__(self, capacity: dict[str, int]) -> None:
+        self._capacity = capacity
+
+    async def get_capacity(self, *, cluster_name: str | None = None) -> dict[str, int]:
+        return dict(self._capacity)
+
+
+class OfflineSecrets:
+    """Secrets kept in memory, keyed by name."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, bytes] = {}
+
+    async def add(self, key: str, value: bytes, **kwargs: t.Any) -> None:
+        self.values[key] = value
+
+    async def get(self, key: str, **kwargs: t.Any) -> bytes:
+        try:
+            return self.values[key]
+        except KeyError:
+            msg = f"Secret {key} not found"
+            raise apolo_sdk.ResourceNotFound(msg) from None
+
+    async def rm(self, key: str, **kwargs: t.Any) -> None:
+        if self.values.pop(key, None) is None:
+            msg = f"Secret {key} not found"
+            raise apolo_sdk.ResourceNotFound(msg)
+
+
+class OfflineClient:
+    """
+    Answers the apolo_sdk.Client calls of chart value processors from a
+    recorded cluster config; pass it where a client is expected.
+    """
+
+    def __init__(self, recorded: RecordedClusterConfig) -> None:
+        self.recorded = recorded
+        self.config = OfflineConfig(recorded)
+        # the real parser only reads names and registry urls from the config
+        self.parse: apolo_sdk.Parser = apolo_sdk.Parser._create(self.config)
+        self.jobs = OfflineJobs(recorded.capacity)
+        self.secrets = OfflineSecrets()
+
+    @classmethod
+    def from_file(cls, path: Path) -> "OfflineClient":
+        return cls(RecordedClusterConfig.from_file(path))
+
+    @property
+    def cluster_name(self) -> str:
+        return self.config.cluster_name
+
+    @property
+    def username(self) -> str:
+        return self.config.username
+
+    def __getattr__(self, name: str) -> t.Any:
+        msg = f"Client.{name} is not available offline"
+        raise AttributeError(msg)
+
+    async def close(self) -> None:
+        pass
+
+    def as_client(self) -> apolo_sdk.Client:
+        return t.cast(apolo_sdk.Client, self)
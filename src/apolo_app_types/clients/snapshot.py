@@ -0,0 +1,236 @@
+import asyncio
+import contextlib
+import contextvars
+import itertools
+import logging
+import re
+import typing as t
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+
+from apolo_app_types.clients import kube
+
+
+logger = logging.getLogger(__name__)
+
+ResourceKind = t.Literal["services", "ingresses", "middlewares"]
+
+# Kubernetes label value syntax
+_LABEL_VALUE = re.compile(r"(([A-Za-z0-9][-A-Za-z0-9_.]*)?[A-Za-z0-9])?")
+MAX_LABEL_VALUE_LENGTH = 63
+# Instance ids per "in (...)" selector, keeping list request URLs short
+SELECTOR_CHUNK_SIZE = 50
+
+_active_snapshot: contextvars.ContextVar["InstanceResourceSnapshot | None"] = (
+    contextvars.ContextVar("apolo_instance_snapshot", default=None)
+)
+
+
+class ResourceIndex:
+    """Kubernetes objects of one kind, indexed by name and by label pairs."""
+
+    def __init__(self, items: Iterable[dict[str, t.Any]]) -> None:
+        self.items = list(items)
+        self._by_name: dict[str, dict[str, t.Any]] = {}
+        self._by_label: dict[tuple[str, str], list[int]] = {}
+        for idx, item in enumerate(self.items):
+            metadata = item.get("metadata") or {}
+            name = metadata.get("name")
+            if name is not None:
+                self._by_name.setdefault(name, item)
+            for label in (metadata.get("labels") or {}).items():
+                self._by_label.setdefault(label, []).append(idx)
+
+    def get(self, name: str) -> dict[str, t.Any] | None:
+        return self._by_name.get(name)
+
+    def find(self, match_labels: dict[str, str]) -> list[dict[str, t.Any]]:
+        """Return items carrying every label in match_labels, in listing order."""
+        if not match_labels:
+            return list(self.items)
+        postings = [self._by_label.get(label, []) for label in match_labels.items()]
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates.intersection_update(posting)
+            if not candidates:
+                return []
+        return [self.items[idx] for idx in sorted(candidates)]
+
+
+async def _list_resources(kind: ResourceKind, label_selector: str) -> ResourceIndex:
+    return ResourceIndex(await _list_items(kind, label_selector))
+
+
+async def _list_items(kind: ResourceKind, label_selector: str) -> list[t.Any]:
+    fetchers: dict[ResourceKind, Callable[[str], Awaitable[dict[str, t.Any]]]] = {
+        "services": kube.get_services_by_label,
+        "ingresses": kube.get_ingresses_as_dict,
+        "middlewares": kube.get_middleware_by_label,
+    }
+    logger.debug("Listing %s for %s", kind, label_selector)
+    listing = await fetchers[kind](label_selector)
+    return listing["items"]
+
+
+class InstanceResourceSnapshot:
+    """
+    In-memory view of the kube objects labelled with one app instance.
+
+    Each resource kind is listed at most once, on first use, with the
+    ``app.kubernetes.io/instance=<id>`` selector; every later lookup for that
+    instance is answered from the index. Kinds that are never asked for are
+    never listed, so a snapshot is free for apps that don't touch kube.
+    """
+
+    def __init__(self, instance_id: str) -> None:
+        self.instance_id = instance_id
+        self.label_selector = f"{kube.INSTANCE_LABEL}={instance_id}"
+        self._indexes: dict[ResourceKind, ResourceIndex] = {}
+        self._pending: dict[ResourceKind, asyncio.Task[ResourceIndex]] = {}
+
+    @classmethod
+    def from_items(
+        cls,
+        instance_id: str,
+        *,
+        services: Iterable[dict[str, t.Any]] | None = None,
+        ingresses: Iterable[dict[str, t.Any]] | None = None,
+        middlewares: Iterable[dict[str, t.Any]] | None = None,
+    ) -> "InstanceResourceSnapshot":
+        """Build a snapshot from already listed objects."""
+        snapshot = cls(instance_id)
+        for kind, items in (
+            ("services", services),
+            ("ingresses", ingresses),
+            ("middlewares", middlewares),
+        ):
+            if items is not None:
+                snapshot._indexes[t.cast(ResourceKind, kind)] = ResourceIndex(items)
+        return snapshot
+
+    def covers(self, match_labels: dict[str, str]) -> bool:
+        return match_labels.get(kube.INSTANCE_LABEL) == self.instance_id
+
+    async def prefetch(self, *kinds: ResourceKind) -> None:
+        """List the given kinds (services and ingresses by default) concurrently."""
+        await asyncio.gather(
+            *(self.index(kind) for kind in kinds or ("services", "ingresses"))
+        )
+
+    async def index(self, kind: ResourceKind) -> ResourceIndex:
+        if kind in self._indexes:
+            return self._indexes[kind]
+        task = self._pending.get(kind)
+        if task is None:
+            task = asyncio.ensure_future(self._list(kind))
+            self._pending[kind] = task
+        try:
+            index = await task
+        finally:
+            self._pending.pop(kind, None)
+        self._indexes[kind] = index
+        return index
+
+    async def find_services(
+        self, match_labels: dict[str, str]
+    ) -> list[dict[str, t.Any]]:
+        return (await self.index("services")).find(match_labels)
+
+    async def find_ingresses(
+        self, match_labels: dict[str, str]
+    ) -> list[dict[str, t.Any]]:
+        return (await self.index("ingresses")).find(match_labels)
+
+    async def get_service(self, name: str) -> dict[str, t.Any] | None:
+        return (await self.index("services")).get(name)
+
+    async def get_ingress(self, name: str) -> dict[str, t.Any] | None:
+        return (await self.index("ingresses")).get(name)
+
+    async def find_middlewares(
+        self, match_labels: dict[str, str]
+    ) -> list[dict[str, t.Any]]:
+        return (await self.index("middlewares")).find(match_labels)
+
+    async def _list(self, kind: ResourceKind) -> ResourceIndex:
+        return await _list_resources(kind, self.label_selector)
+
+
+class NamespaceResourceSnapshot:
+    """
+    Kube objects of many app instances, listed once per kind for all of them.
+
+    Used when outputs are computed for a batch of instances: instead of one
+    listing per instance and kind, each kind is listed with
+    ``app.kubernetes.io/instance in (...)`` selectors of up to
+    SELECTOR_CHUNK_SIZE instances each, and every instance gets an
+    InstanceResourceSnapshot over its share of the listing.
+    """
+
+    def __init__(self, instance_ids: Iterable[str]) -> None:
+        self.instance_ids = sorted(set(instance_ids))
+        for instance_id in self.instance_ids:
+            if (
+                not instance_id
+                or len(instance_id) > MAX_LABEL_VALUE_LENGTH
+                or not _LABEL_VALUE.fullmatch(instance_id)
+            ):
+                msg = f"Instance id {instance_id!r} is not a valid label value"
+                raise ValueError(msg)
+        ids = self.instance_ids
+        self.label_selectors = [
+            f"{kube.INSTANCE_LABEL} in ({','.join(ids[i : i + SELECTOR_CHUNK_SIZE])})"
+            for i in range(0, len(ids), SELECTOR_CHUNK_SIZE)
+        ]
+        self._indexes: dict[ResourceKind, ResourceIndex] = {}
+
+    async def prefetch(self, *kinds: ResourceKind) -> None:
+        """List the given kinds (services and ingresses by default) concurrently."""
+        kinds = kinds or ("services", "ingresses")
+        missing = [kind for kind in kinds if kind not in self._indexes]
+        if not missing or not self.instance_ids:
+            return
+        listings = await asyncio.gather(*(self._list(kind) for kind in missing))
+        self._indexes.update(zip(missing, listings, strict=True))
+
+    def for_instance(self, instance_id: str) -> InstanceResourceSnapshot:
+        """
+        Snapshot of one instance's objects. Kinds that were prefetched are
+        answered from the shared listing; other kinds are listed on first use.
+        """
+        labels = {kube.INSTANCE_LABEL: instance_id}
+        items = {kind: index.find(labels) for kind, index in self._indexes.items()}
+        return InstanceResourceSnapshot.from_items(
+            instance_id,
+            services=items.get("services"),
+            ingresses=items.get("ingresses"),
+            middlewares=items.get("middlewares"),
+        )
+
+    async def _list(self, kind: ResourceKind) -> ResourceIndex:
+        listings = await asyncio.gather(
+            *(_list_items(kind, selector) for selector in self.label_selectors)
+        )
+        return ResourceIndex(itertools.chain.from_iterable(listings))
+
+
+@contextlib.contextmanager
+def use_instance_snapshot(
+    snapshot: InstanceResourceSnapshot,
+) -> Iterator[InstanceResourceSnapshot]:
+    """Route kube label lookups for the snapshot's instance through it."""
+    token = _active_snapshot.set(snapshot)
+    try:
+        yield snapshot
+    finally:
+        _active_snapshot.reset(token)
+
+
+def get_active_snapshot(
+    match_labels: dict[str, str],
+) -> InstanceResourceSnapshot | None:
+    """Return the active snapshot if it can answer a lookup for match_labels."""
+    snapshot = _active_snapshot.get()
+    if snapshot is not None and snapshot.covers(match_labels):
+        return snapshot
+    return None
@@ -1,9 +1,20 @@
+from .collection import IndexedModelCollection
 from .filters import (
     BaseModelFilter,
+    FieldValueCache,
     FilterCondition,
+    FilterExpression,
     FilterOperator,
+    ParsedCondition,
+    ParsedFilter,
+    ParsedSortKey,
+    SortKey,
     compare_equal,
     compare_like,
+    compare_order,
+    compare_prefix,
+    parse_filter,
+    parse_filter_expression,
     parse_filter_string,
 )
 from .outputs import (
@@ -21,8 +32,19 @@ __all__ = [
     "DynamicAppFilterParams",
     "FilterOperator",
     "FilterCondition",
+    "FilterExpression",
+    "SortKey",
+    "ParsedCondition",
+    "ParsedSortKey",
+    "ParsedFilter",
     "BaseModelFilter",
+    "IndexedModelCollection",
+    "FieldValueCache",
     "parse_filter_string",
+    "parse_filter",
+    "parse_filter_expression",
     "compare_equal",
     "compare_like",
+    "compare_prefix",
+    "compare_order",
 ]
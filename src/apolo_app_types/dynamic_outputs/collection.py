@@ -0,0 +1,203 @@
+"""Indexed model collections for dynamic outputs.
+
+Dynamic list endpoints filter the same model catalog on every request.
+IndexedModelCollection indexes the catalog once and answers each query by
+narrowing it to candidates through inverted indexes, then checking only those
+candidates with the filter and stopping as soon as the requested page is full.
+
+Indexes only ever narrow the candidate set; every candidate is still checked
+against the filter, so results are identical to BaseModelFilter.apply().
+
+Example usage::
+
+    catalog = IndexedModelCollection(
+        models,
+        ModelFilter,
+        eq_fields=["name", "pipeline_tag"],
+        in_fields=["tags"],
+        like_fields=["name"],
+    )
+    page = catalog.page(DynamicAppFilterParams(filter="tags:in:chat", limit=20))
+"""
+
+import itertools
+import logging
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from typing import Any, Generic, TypeVar
+
+from .filters import AnyCondition, BaseModelFilter, FilterOperator
+from .outputs import DynamicAppFilterParams
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+TRIGRAM_SIZE = 3
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i : i + TRIGRAM_SIZE] for i in range(len(text) - TRIGRAM_SIZE + 1)}
+
+
+def _eq_keys(value: Any) -> Iterable[str] | None:
+    # numbers compare numerically in compare_equal, so they can't be keyed
+    return (str(value).lower(),) if isinstance(value, str | bool) else None
+
+
+def _in_keys(value: Any) -> Iterable[str] | None:
+    if isinstance(value, list | tuple | set | frozenset):
+        return [str(item).lower() for item in value]
+    return None
+
+
+def _like_keys(value: Any) -> Iterable[str] | None:
+    return _trigrams(value.lower()) if isinstance(value, str) else None
+
+
+class _FieldIndex:
+    """Positions of the models holding each (lowercased) key of one field.
+
+    Models whose value cannot be keyed (numbers for eq, non-lists for in,
+    non-strings for like) are kept aside and returned as candidates for any
+    key, since only the filter itself can decide whether they match.
+    """
+
+    def __init__(self, keys: Callable[[Any], Iterable[str] | None]) -> None:
+        self.keys = keys
+        self.postings: dict[str, set[int]] = {}
+        self.unkeyed: set[int] = set()
+
+    def add(self, position: int, value: Any) -> None:
+        if value is None:
+            return
+        keys = self.keys(value)
+        if keys is None:
+            self.unkeyed.add(position)
+            return
+        for key in keys:
+            self.postings.setdefault(key, set()).add(position)
+
+    def lookup(self, key: str) -> set[int]:
+        return self.postings.get(key, set()) | self.unkeyed
+
+    def lookup_all(self, keys: Iterable[str]) -> set[int]:
+        """Positions holding every key, plus the unkeyed ones."""
+        postings = sorted((self.postings.get(key, set()) for key in keys), key=len)
+        positions = set(postings[0]) if postings else set()
+        for posting in postings[1:]:
+            positions &= posting
+            if not positions:
+                break
+        return positions | self.unkeyed
+
+
+class IndexedModelCollection(Generic[T]):
+    """A model catalog indexed for repeated filtering and lazy pagination.
+
+    Args:
+        models: The catalog; its order is the order results are returned in
+        filter_type: BaseModelFilter subclass (or factory) used for queries;
+            ``filter_type(None)`` provides the field access for indexing
+        eq_fields: Fields indexed by exact lowercased value (eq conditions)
+        in_fields: List fields indexed by lowercased element (in conditions);
+            only for filters whose in operator is case-insensitive element
+            equality, as in the BaseModelFilter example
+        like_fields: String fields indexed by trigrams (like conditions)
+    """
+
+    def __init__(
+        self,
+        models: Iterable[T],
+        filter_type: Callable[[str | None], BaseModelFilter],
+        *,
+        eq_fields: Iterable[str] = (),
+        in_fields: Iterable[str] = (),
+        like_fields: Iterable[str] = (),
+    ) -> None:
+        self.models = list(models)
+        self.filter_type = filter_type
+        accessor = filter_type(None)
+        self._eq = {field.lower(): _FieldIndex(_eq_keys) for field in eq_fields}
+        self._in = {field.lower(): _FieldIndex(_in_keys) for field in in_fields}
+        self._like = {field.lower(): _FieldIndex(_like_keys) for field in like_fields}
+        for indexes in (self._eq, self._in, self._like):
+            for field, index in indexes.items():
+                for position, model in enumerate(self.models):
+                    index.add(position, accessor._get_field_value(model, field))
+
+    def __len__(self) -> int:
+        return len(self.models)
+
+    def candidates(self, model_filter: BaseModelFilter) -> Sequence[int]:
+        """Positions of the models that may match, in catalog order."""
+        everything = range(len(self.models))
+        if type(model_filter)._matches is not BaseModelFilter._matches:
+            # custom matching may not agree with what the indexes assume
+            return everything
+        union: set[int] = set()
+        for conditions in model_filter.condition_groups():
+            narrowed = self._narrow(conditions)
+            if narrowed is None:
+                # a group no index can narrow may match anything
+                return everything
+            union |= narrowed
+        return sorted(union)
+
+    def iter_matches(
+        self,
+        model_filter: BaseModelFilter | str | None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> Iterator[T]:
+        """Lazily yield matching models, skipping ``offset`` and up to ``limit``.
+
+        Only candidates up to the end of the requested page are checked,
+        unless the filter has sort keys: then all matches are sorted first.
+        """
+        if not isinstance(model_filter, BaseModelFilter):
+            model_filter = self.filter_type(model_filter)
+        if not model_filter.has_conditions():
+            matches: Iterator[T] = iter(self.models)
+        else:
+            matcher = model_filter.matcher()
+            matches = (
+                model
+                for model in map(self.models.__getitem__, self.candidates(model_filter))
+                if matcher(model)
+            )
+        if model_filter.sort_keys:
+            matches = iter(model_filter.sort(matches))
+        stop = None if limit is None else offset + limit
+        return itertools.islice(matches, offset, stop)
+
+    def page(self, params: DynamicAppFilterParams) -> list[T]:
+        """Return one page of models for the given query parameters."""
+        return list(self.iter_matches(params.filter, params.offset, params.limit))
+
+    def _narrow(self, conditions: list[AnyCondition]) -> set[int] | None:
+        """Candidate positions for AND-ed conditions, or None if none narrows."""
+        narrowed: set[int] | None = None
+        for condition in conditions:
+            positions = self._lookup(condition)
+            if positions is None:
+                continue
+            narrowed = positions if narrowed is None else narrowed & positions
+            if not narrowed:
+                return narrowed
+        return narrowed
+
+    def _lookup(self, condition: AnyCondition) -> set[int] | None:
+        """Candidate positions for one condition, or None if it can't narrow."""
+        lowered = condition.value.lower()
+        match condition.operator:
+            case FilterOperator.EQ if condition.field in self._eq:
+                return self._eq[condition.field].lookup(lowered)
+            case FilterOperator.IN if condition.field in self._in:
+                return self._in[condition.field].lookup(lowered)
+            # a string starting with the prefix also contains it
+            case FilterOperator.LIKE | FilterOperator.PREFIX if (
+                condition.field in self._like and len(lowered) >= TRIGRAM_SIZE
+            ):
+                return self._like[condition.field].lookup_all(_trigrams(lowered))
+        return None
@@ -6,22 +6,42 @@ filtering logic.
 
 Filter syntax: field:operator:value,field2:operator2:value2
 
+Comma-separated conditions are AND-ed, and ``sort:field`` terms
+(``sort:-field`` or ``sort:field:desc`` for descending order) order the
+result; they may appear anywhere in the string and apply to the whole result.
+
+Filters that opt in with ``or_groups`` also OR groups of conditions separated
+by ``|``; ``\\|`` stands for a literal ``|`` in their values. Without it ``|``
+is an ordinary character, as it always was.
+
 Supported operators:
     - eq: Exact match (case-insensitive)
     - ne: Not equal (case-insensitive)
     - like: Contains substring (case-insensitive)
     - in: Value exists in list field
+    - prefix: Starts with (case-insensitive)
+    - gt, ge, lt, le: Ordering comparisons; numbers compare numerically,
+      dates and datetimes as ISO 8601, anything else as lowercased strings
+      (values can't contain ``:``; write times in basic format, e.g.
+      ``20240101T120000``)
 
 Examples:
     - name:eq:my-model
     - name:like:llama
     - tags:in:production
+    - downloads:ge:1000,name:prefix:meta-llama
+    - tags:in:chat|tags:in:instruct,sort:-downloads (with or_groups)
 """
 
+import datetime as dt
+import functools
 import logging
+import re
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable
 from enum import Enum
-from typing import Any, TypeVar
+from operator import itemgetter
+from typing import Any, ClassVar, NamedTuple, TypeVar
 
 from pydantic import BaseModel
 
@@ -38,6 +58,27 @@ class FilterOperator(Enum):
     NE = "ne"
     LIKE = "like"
     IN = "in"
+    PREFIX = "prefix"
+    GT = "gt"
+    GE = "ge"
+    LT = "lt"
+    LE = "le"
+
+
+# Ordering operators and the comparison results (-1, 0, 1) each accepts
+_ORDER_OPERATORS: dict[FilterOperator, frozenset[int]] = {
+    FilterOperator.GT: frozenset({1}),
+    FilterOperator.GE: frozenset({0, 1}),
+    FilterOperator.LT: frozenset({-1}),
+    FilterOperator.LE: frozenset({-1, 0}),
+}
+
+_OPERATOR_VALUES = frozenset(operator.value for operator in FilterOperator)
+
+SORT_TERM = "sort"
+OR_SEPARATOR = "|"
+# "|" not preceded by a backslash
+_OR_SPLIT = re.compile(r"(?<!\\)\|")
 
 
 class FilterCondition(BaseModel):
@@ -48,29 +89,164 @@ class FilterCondition(BaseModel):
     value: str
 
 
+class SortKey(BaseModel):
+    """A single sort key; None values always sort last."""
+
+    field: str
+    descending: bool = False
+
+
+class FilterExpression(BaseModel):
+    """A parsed filter string: OR-ed groups of AND-ed conditions and sort keys."""
+
+    groups: list[list[FilterCondition]]
+    sort: list[SortKey]
+
+
+class ParsedCondition(NamedTuple):
+    """Immutable filter condition, as returned by the cached parser."""
+
+    field: str
+    operator: FilterOperator
+    value: str
+
+
+class ParsedSortKey(NamedTuple):
+    """Immutable sort key, as returned by the cached parser."""
+
+    field: str
+    descending: bool = False
+
+
+class ParsedFilter(NamedTuple):
+    """Immutable parsed filter string, shared by every caller of parse_filter()."""
+
+    groups: tuple[tuple[ParsedCondition, ...], ...]
+    sort: tuple[ParsedSortKey, ...]
+
+
+# Conditions BaseModelFilter evaluates; both expose field, operator and value
+AnyCondition = FilterCondition | ParsedCondition
+
+PARSE_CACHE_SIZE = 1024
+
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_filter(filter_string: str, *, or_groups: bool = False) -> ParsedFilter:
+    """Parse filter string into OR groups and sort keys, with an LRU cache.
+
+    Repeated filter strings return the same immutable ParsedFilter without
+    parsing again; no pydantic models are built. Warnings about invalid
+    terms are only logged the first time a string is parsed.
+
+    Args:
+        filter_string: Filter string in format field:op:value,field:op:value,
+            with optional ``sort:field`` terms
+        or_groups: Split OR groups on ``|``; ``\\|`` is a literal ``|``.
+            Otherwise the whole string is a single group
+
+    Returns:
+        ParsedFilter; groups left without valid conditions are dropped
+    """
+    groups: list[tuple[ParsedCondition, ...]] = []
+    sort: list[ParsedSortKey] = []
+    for group_string in _split_groups(filter_string, or_groups=or_groups):
+        conditions = _parse_conditions(group_string, sort)
+        if conditions:
+            groups.append(tuple(conditions))
+    return ParsedFilter(tuple(groups), tuple(sort))
+
+
+def _split_groups(filter_string: str, *, or_groups: bool) -> list[str]:
+    if not or_groups:
+        return [filter_string]
+    return [
+        group.replace("\\" + OR_SEPARATOR, OR_SEPARATOR)
+        for group in _OR_SPLIT.split(filter_string)
+    ]
+
+
+def parse_filter_expression(
+    filter_string: str, *, or_groups: bool = False
+) -> FilterExpression:
+    """Parse filter string into OR groups and sort keys.
+
+    Args:
+        filter_string: Filter string in format field:op:value,field:op:value,
+            with optional ``sort:field`` terms
+        or_groups: Split OR groups on ``|``, see parse_filter()
+
+    Returns:
+        FilterExpression; groups left without valid conditions are dropped
+    """
+    parsed = parse_filter(filter_string, or_groups=or_groups)
+    return FilterExpression(
+        groups=[
+            [FilterCondition(**condition._asdict()) for condition in group]
+            for group in parsed.groups
+        ],
+        sort=[SortKey(**sort_key._asdict()) for sort_key in parsed.sort],
+    )
+
+
 def parse_filter_string(filter_string: str) -> list[FilterCondition]:
     """Parse filter string into conditions.
 
+    Sort terms are skipped and ``|`` is not treated as a separator; use
+    parse_filter_expression() for sort keys and OR groups.
+
     Args:
         filter_string: Filter string in format field:op:value,field:op:value
 
     Returns:
         List of parsed FilterCondition objects
     """
-    conditions: list[FilterCondition] = []
+    return [
+        FilterCondition(**condition._asdict())
+        for condition in _parse_conditions(filter_string, [])
+    ]
+
+
+def _parse_sort_key(parts: list[str]) -> ParsedSortKey | None:
+    """Parse ``sort:field``, ``sort:-field`` or ``sort:field:asc|desc``.
+
+    Returns None if the term is a regular condition on a field named sort.
+    """
+    if parts[0].strip().lower() != SORT_TERM or len(parts) not in (2, 3):
+        return None
+    field = parts[1].strip().lower()
+    descending = False
+    if len(parts) == 3:
+        direction = parts[2].strip().lower()
+        if direction not in ("asc", "desc") or field in _OPERATOR_VALUES:
+            return None
+        descending = direction == "desc"
+    if field.startswith("-"):
+        field = field[1:]
+        descending = True
+    if not field:
+        return None
+    return ParsedSortKey(field, descending)
+
+
+def _parse_conditions(
+    filter_string: str, sort: list[ParsedSortKey]
+) -> list[ParsedCondition]:
+    conditions: list[ParsedCondition] = []
     for part in filter_string.split(","):
         part = part.strip()
         if not part:
             continue
 
         parts = part.split(":")
-        if len(parts) == 3:
+        sort_key = _parse_sort_key(parts)
+        if sort_key is not None:
+            sort.append(sort_key)
+        elif len(parts) == 3:
             field, op, value = parts
             try:
                 operator = FilterOperator(op.lower())
-                conditions.append(
-                    FilterCondition(field=field.lower(), operator=operator, value=value)
-                )
+                conditions.append(ParsedCondition(field.lower(), operator, value))
             except ValueError:
                 err_msg = f"Unknown filter operator: {op}"
                 logger.warning(err_msg)
@@ -113,6 +289,118 @@ def compare_like(value: Any, filter_value: str) -> bool:
     return filter_value.lower() in str(value).lower()
 
 
+def compare_prefix(value: Any, filter_value: str) -> bool:
+    """Check if value starts with filter_value (case-insensitive)."""
+    return str(value).lower().startswith(filter_value.lower())
+
+
+def compare_order(value: Any, filter_value: str) -> int | None:
+    """Compare value with filter_value for the ordering operators.
+
+    Numbers compare numerically, dates and datetimes against an ISO 8601
+    filter value, anything else as lowercased strings.
+
+    Args:
+        value: Model field value
+        filter_value: Filter value (string)
+
+    Returns:
+        -1, 0 or 1 as value is below, equal to or above filter_value, or
+        None if filter_value can't be compared with value
+    """
+    operand: Any
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int | float):
+        operand = _to_number(float, filter_value)
+    elif isinstance(value, dt.datetime):
+        operand = _to_datetime(value, filter_value)
+    elif isinstance(value, dt.date):
+        operand = _to_date(filter_value)
+    else:
+        value = str(value).lower()
+        operand = filter_value.lower()
+    if operand is _NOT_A_NUMBER:
+        return None
+    return (value > operand) - (value < operand)
+
+
+def _to_datetime(value: dt.datetime, filter_value: str) -> Any:
+    try:
+        operand = dt.datetime.fromisoformat(filter_value)
+    except ValueError:
+        return _NOT_A_NUMBER
+    if (operand.tzinfo is None) != (value.tzinfo is None):
+        # naive and aware datetimes don't compare; read the operand in the
+        # value's timezone
+        operand = operand.replace(tzinfo=value.tzinfo)
+    return operand
+
+
+def _to_date(filter_value: str) -> Any:
+    try:
+        return dt.date.fromisoformat(filter_value)
+    except ValueError:
+        return _NOT_A_NUMBER
+
+
+def _sort_value(value: Any) -> tuple[int, Any]:
+    """Sort key keeping mixed-type values comparable: numbers before text."""
+    if isinstance(value, int | float) and not isinstance(value, bool):
+        return (0, value)
+    if isinstance(value, dt.datetime | dt.date):
+        return (1, value.isoformat())
+    return (2, str(value).lower())
+
+
+_NOT_A_NUMBER = object()
+
+# (model, field, value) -> lowercased string form of value
+LowerValue = Callable[[Any, str, Any], str]
+ConditionCheck = Callable[[Any], bool]
+
+
+def _lower_value(model: Any, field: str, value: Any) -> str:
+    return str(value).lower()
+
+
+def _to_number(number_type: type[Any], filter_value: str) -> Any:
+    try:
+        return number_type(filter_value)
+    except (ValueError, TypeError):
+        return _NOT_A_NUMBER
+
+
+class FieldValueCache:
+    """Lowercased string forms of model field values, kept across apply() calls.
+
+    Keep one cache next to a model catalog that is filtered repeatedly, so
+    each field of each model is stringified and lowercased only once. It pays
+    off for values with a costly str(), e.g. nested models or long texts;
+    for short plain strings lowering on the fly is as fast. Entries
+    hold a reference to their model; drop or clear() the cache together with
+    the catalog, and after mutating models in place.
+    """
+
+    def __init__(self) -> None:
+        self._values: dict[tuple[int, str], tuple[Any, str]] = {}
+
+    def lower(self, model: Any, field: str, value: Any) -> str:
+        key = (id(model), field)
+        entry = self._values.get(key)
+        if entry is not None and entry[0] is model:
+            return entry[1]
+        lowered = str(value).lower()
+        self._values[key] = (model, lowered)
+        return lowered
+
+    def clear(self) -> None:
+        self._values.clear()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
 class BaseModelFilter(ABC):
     """Base filter class with common parsing and comparison logic.
 
@@ -120,6 +408,9 @@ class BaseModelFilter(ABC):
     - _get_field_value(): How to extract field values from model
     - _matches_in_operator(): How to handle IN operator for list fields
 
+    Subclasses setting ``or_groups = True`` accept ``|``-separated OR groups;
+    by default ``|`` is part of the filter values.
+
     Example usage::
 
         class ModelFilter(BaseModelFilter):
@@ -136,41 +427,142 @@ class BaseModelFilter(ABC):
         filtered = model_filter.apply(models)
     """
 
+    or_groups: ClassVar[bool] = False
+
     def __init__(self, filter_string: str | None) -> None:
         """Initialize filter from filter string.
 
         Args:
-            filter_string: Filter string in format field:op:value,field:op:value
+            filter_string: Filter string in format field:op:value,field:op:value,
+                with optional ``sort:field`` terms, and ``|`` between OR
+                groups if the class enables or_groups
         """
-        self.conditions: list[FilterCondition] = []
+        self._conditions: list[AnyCondition] = []
+        self.groups: list[list[AnyCondition]] = []
+        self.sort_keys: list[ParsedSortKey] = []
         self._raw_filter = filter_string
 
         if filter_string:
-            self.conditions = parse_filter_string(filter_string)
-
-    def apply(self, models: list[T]) -> list[T]:
-        """Apply all filter conditions to a list of models.
+            parsed = parse_filter(filter_string, or_groups=self.or_groups)
+            self.groups = [list(group) for group in parsed.groups]
+            self.sort_keys = list(parsed.sort)
+            self._conditions = [
+                condition for group in self.groups for condition in group
+            ]
+
+    @property
+    def conditions(self) -> list[AnyCondition]:
+        """All conditions of all groups.
+
+        With a single group this is the list that is matched, so changes to
+        it apply; with OR groups it is a copy, assign to replace them.
+        """
+        if len(self.groups) > 1:
+            return [condition for group in self.groups for condition in group]
+        return self._conditions
+
+    @conditions.setter
+    def conditions(self, conditions: list[AnyCondition]) -> None:
+        """Replace all conditions and OR groups with a single AND group."""
+        self._conditions = conditions
+        self.groups = [list(conditions)] if conditions else []
+
+    def condition_groups(self) -> list[list[AnyCondition]]:
+        """OR-ed groups of AND-ed conditions; a single group without OR."""
+        if len(self.groups) > 1:
+            return self.groups
+        return [self.conditions] if self.conditions else []
+
+    def apply(
+        self, models: list[T], value_cache: FieldValueCache | None = None
+    ) -> list[T]:
+        """Apply all filter conditions and sort keys to a list of models.
+
+        Conditions are compiled once per call and checked in a single pass,
+        stopping at the first condition a model fails.
 
         Args:
             models: List of models to filter
+            value_cache: Optional cache of lowercased field values, reused
+                across calls over the same models
 
         Returns:
-            Filtered list of models matching all conditions (AND logic)
+            Filtered list of models matching all conditions of any group,
+            sorted by the sort keys if there are any
         """
-        if not self.conditions:
+        if not self.conditions and not self.sort_keys:
             return models
 
         result = models
-        for condition in self.conditions:
-            result = [m for m in result if self._matches(m, condition)]
+        if self.conditions:
+            result = list(filter(self.matcher(value_cache), models))
+        if self.sort_keys:
+            result = self.sort(result)
         debug_msg = f"Filter applied: {len(models)} -> {len(result)} models"
         logger.debug(
             debug_msg,
-            extra={"conditions": len(self.conditions)},
+            extra={"conditions": len(self.conditions), "groups": len(self.groups)},
         )
         return result
 
-    def _matches(self, model: T, condition: FilterCondition) -> bool:
+    def matcher(
+        self, value_cache: FieldValueCache | None = None
+    ) -> Callable[[T], bool]:
+        """Compile the conditions into one predicate over a single model.
+
+        Condition values are lowercased once here rather than per model, and
+        the predicate stops at the first condition a model fails, or at the
+        first group it matches.
+
+        Args:
+            value_cache: Optional cache of lowercased field values
+
+        Returns:
+            Predicate returning True for models matching all conditions of
+            any group
+        """
+        lower = value_cache.lower if value_cache is not None else _lower_value
+        groups = [
+            _match_all(self._compile_conditions(conditions, lower))
+            for conditions in self.condition_groups()
+        ]
+        if not groups:
+            return lambda model: True
+        if len(groups) == 1:
+            return groups[0]
+
+        def matches_any(model: T) -> bool:
+            for group in groups:
+                if group(model):
+                    return True
+            return False
+
+        return matches_any
+
+    def sort(self, models: Iterable[T]) -> list[T]:
+        """Sort models by the sort keys; models missing a field sort last.
+
+        Args:
+            models: Models to sort
+
+        Returns:
+            New list in sort key order, stable for ties
+        """
+        result = list(models)
+        get_value = self._get_field_value
+        for key in reversed(self.sort_keys):
+            values = [(get_value(model, key.field), model) for model in result]
+            present = [
+                (_sort_value(value), model)
+                for value, model in values
+                if value is not None
+            ]
+            present.sort(key=itemgetter(0), reverse=key.descending)
+            result = [model for _, model in present]
+            result.extend(model for value, model in values if value is None)
+        return result
+
+    def _matches(self, model: T, condition: AnyCondition) -> bool:
         """Check if a model matches a single filter condition.
 
         Args:
@@ -194,9 +586,123 @@ class BaseModelFilter(ABC):
                 return compare_like(value, condition.value)
             case FilterOperator.IN:
                 return self._matches_in_operator(value, condition.value)
+            case FilterOperator.PREFIX:
+                return compare_prefix(value, condition.value)
+            case (
+                FilterOperator.GT
+                | FilterOperator.GE
+                | FilterOperator.LT
+                | (FilterOperator.LE)
+            ):
+                order = compare_order(value, condition.value)
+                return order in _ORDER_OPERATORS[condition.operator]
 
         return False
 
+    def _compile_conditions(
+        self, conditions: list[AnyCondition], lower: LowerValue
+    ) -> list[ConditionCheck]:
+        """Turn conditions into checks with their operands pre-lowered."""
+        if type(self)._matches is not BaseModelFilter._matches:
+            # a subclass customised matching; honour it condition by condition
+            return [self._matches_check(condition) for condition in conditions]
+        return [self._compile_condition(condition, lower) for condition in conditions]
+
+    def _matches_check(self, condition: AnyCondition) -> ConditionCheck:
+        def check(model: Any) -> bool:
+            return self._matches(model, condition)
+
+        return check
+
+    def _compile_condition(  # noqa: C901
+        self, condition: AnyCondition, lower: LowerValue
+    ) -> ConditionCheck:
+        """Compile one condition into a check equivalent to _matches()."""
+        field = condition.field
+        filter_value = condition.value
+        lowered = filter_value.lower()
+        get_value = self._get_field_value
+
+        if condition.operator is FilterOperator.IN:
+            matches_in = self._matches_in_operator
+
+            def check_in(model: Any) -> bool:
+                value = get_value(model, field)
+                return value is not None and matches_in(value, filter_value)
+
+            return check_in
+
+        if condition.operator is FilterOperator.LIKE:
+            if lower is _lower_value:
+
+                def check_like(model: Any) -> bool:
+                    value = get_value(model, field)
+                    if value.__class__ is str:
+                        return lowered in value.lower()
+                    return value is not None and lowered in str(value).lower()
+
+            else:
+
+                def check_like(model: Any) -> bool:
+                    value = get_value(model, field)
+                    return value is not None and lowered in lower(model, field, value)
+
+            return check_like
+
+        if condition.operator is FilterOperator.PREFIX:
+
+            def check_prefix(model: Any) -> bool:
+                value = get_value(model, field)
+                if value.__class__ is str and lower is _lower_value:
+                    return value.lower().startswith(lowered)
+                return value is not None and lower(model, field, value).startswith(
+                    lowered
+                )
+
+            return check_prefix
+
+        accepted = _ORDER_OPERATORS.get(condition.operator)
+        if accepted is not None:
+            number = _to_number(float, filter_value)
+
+            def check_order(model: Any) -> bool:
+                value = get_value(model, field)
+                if value is None:
+                    return False
+                if value.__class__ is str:
+                    value = value.lower()
+                    return ((value > lowered) - (value < lowered)) in accepted
+                if value.__class__ in (int, float) and number is not _NOT_A_NUMBER:
+                    return ((value > number) - (value < number)) in accepted
+                return compare_order(value, filter_value) in accepted
+
+            return check_order
+
+        negate = condition.operator is FilterOperator.NE
+        numbers = {
+            int: _to_number(int, filter_value),
+            float: _to_number(float, filter_value),
+        }
+
+        def check_equal(model: Any) -> bool:
+            value = get_value(model, field)
+            if value is None:
+                return negate
+            if value.__class__ is str and lower is _lower_value:
+                return (value.lower() == lowered) is not negate
+            if isinstance(value, bool):
+                equal = lower(model, field, value) == lowered
+            elif isinstance(value, int | float):
+                number = numbers.get(type(value))
+                if number is None:
+                    number = _to_number(type(value), filter_value)
+                equal = number is not _NOT_A_NUMBER and value == number
+            else:
+                equal = lower(model, field, value) == lowered
+            return equal is not negate
+
+        return check_equal
+
     @abstractmethod
     def _get_field_value(self, model: T, field: str) -> Any:
         """Get field value from model. Override for app-specific access.
@@ -233,4 +739,20 @@ class BaseModelFilter(ABC):
 
     def __repr__(self) -> str:
         """String representation of filter."""
-        return f"{self.__class__.__name__}(conditions={len(self.conditions)})"
+        return (
+            f"{self.__class__.__name__}(conditions={len(self.conditions)}, "
+            f"groups={len(self.groups)}, sort_keys={len(self.sort_keys)})"
+        )
+
+
+def _match_all(checks: list[ConditionCheck]) -> ConditionCheck:
+    if len(checks) == 1:
+        return checks[0]
+
+    def matches_all(model: Any) -> bool:
+        for check in checks:
+            if not check(model):
+                return False
+        return True
+
+    return matches_all
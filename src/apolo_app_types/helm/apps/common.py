@@ -3,6 +3,7 @@ import logging
 import os
 import re
 import typing as t
+import weakref
 from copy import deepcopy
 from decimal import Decimal
 
@@ -55,6 +56,12 @@ def get_resource_pools_for_preset(
     client: apolo_sdk.Client, preset_name: str
 ) -> list[apolo_sdk.ResourcePool]:
     preset = get_preset(client, preset_name)
+    return _get_resource_pools(client, preset)
+
+
+def _get_resource_pools(
+    client: apolo_sdk.Client, preset: apolo_sdk.Preset
+) -> list[apolo_sdk.ResourcePool]:
     result = []
     for resource_pool_name in (
         *preset.resource_pool_names,
@@ -110,6 +117,61 @@ async def get_component_values(
     }
 
 
+class PresetResolver:
+    """
+    Memoizes preset lookups of one apolo_sdk.Client.
+
+    Bundles and multi-component apps generate values for the same preset
+    several times per run-preprocessor call; the resolver looks a preset and
+    its resource pools up once and builds its ComponentValues once. Every
+    caller gets its own copy of the values, so they are free to mutate them.
+    Use get_preset_resolver() to share one resolver per client.
+    """
+
+    def __init__(self, client: apolo_sdk.Client) -> None:
+        self.client = client
+        self._presets: dict[str, apolo_sdk.Preset] = {}
+        self._resource_pools: dict[str, list[apolo_sdk.ResourcePool]] = {}
+        self._component_values: dict[str, ComponentValues] = {}
+
+    def get_preset(self, preset_name: str) -> apolo_sdk.Preset:
+        preset = self._presets.get(preset_name)
+        if preset is None:
+            preset = self._presets[preset_name] = get_preset(self.client, preset_name)
+        return preset
+
+    def get_resource_pools(self, preset_name: str) -> list[apolo_sdk.ResourcePool]:
+        pools = self._resource_pools.get(preset_name)
+        if pools is None:
+            pools = _get_resource_pools(self.client, self.get_preset(preset_name))
+            self._resource_pools[preset_name] = pools
+        return list(pools)
+
+    async def get_component_values(self, preset_name: str) -> ComponentValues:
+        values = self._component_values.get(preset_name)
+        if values is None:
+            values = await get_component_values(
+                self.get_preset(preset_name),
+                preset_name,
+                self.get_resource_pools(preset_name),
+            )
+            self._component_values[preset_name] = values
+        return deepcopy(values)
+
+
+_preset_resolvers: weakref.WeakKeyDictionary[apolo_sdk.Client, PresetResolver] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_preset_resolver(client: apolo_sdk.Client) -> PresetResolver:
+    """Return the resolver shared by everything using this client."""
+    resolver = _preset_resolvers.get(client)
+    if resolver is None:
+        resolver = _preset_resolvers[client] = PresetResolver(client)
+    return resolver
+
+
 def _get_match_expressions(pool_names: list[str]) -> list[dict[str, t.Any]]:
     return [
         {
@@ -326,11 +388,9 @@ async def gen_extra_values(
         logger.warning("No preset_name found in helm args.")
         return {}
 
-    preset = get_preset(apolo_client, preset_name)
-    resource_pools = get_resource_pools_for_preset(apolo_client, preset_name)
-    tolerations_vals = await preset_to_tolerations(preset, resource_pools)
-    affinity_vals = preset_to_affinity(preset)
-    resources_vals = preset_to_resources(preset)
+    component_vals = await get_preset_resolver(apolo_client).get_component_values(
+        preset_name
+    )
     ingress_vals: dict[str, t.Any] = {}
     http_ingress_conf: dict[str, t.Any] | None = None
     grpc_ingress_conf: dict[str, t.Any] | None = None
@@ -376,9 +436,9 @@ async def gen_extra_values(
 
     return {
         "preset_name": preset_name,
-        "resources": resources_vals,
-        "tolerations": tolerations_vals,
-        "affinity": affinity_vals,
+        "resources": component_vals["resources"],
+        "tolerations": component_vals["tolerations"],
+        "affinity": component_vals["affinity"],
         "podLabels": {
             "platform.apolo.us/component": component_name or "app",
             "platform.apolo.us/preset": preset_name,
@@ -1,6 +1,8 @@
+import functools
 import re
 import typing as t
 from copy import deepcopy
+from dataclasses import dataclass
 
 import apolo_sdk
 
@@ -51,25 +53,90 @@ def is_production_cluster(client: apolo_sdk.Client) -> bool:
     return DEV_API_URL_DOMAIN not in str(client.config.api_url)
 
 
-async def _get_ingress_name_template(client: apolo_sdk.Client) -> str:
+@dataclass(frozen=True)
+class IngressHostnameTemplate:
+    """
+    A cluster hostname template split around its app name placeholder.
+
+    The limits of every DNS label are computed once at compile time, so
+    rendering a hostname only has to check the length of the app name.
+    """
+
+    prefix: str
+    suffix: str
+    # Longest app name that keeps the label holding the placeholder within
+    # DOMAIN_SECTION_MAX_LENGTH; -1 if a fixed label is already too long.
+    max_app_name_length: int
+
+    @classmethod
+    def compile(cls, template: str) -> "IngressHostnameTemplate":
+        if template.endswith("."):
+            template = template[:-1]
+        prefix, placeholder, suffix = template.partition(APP_NAME_F_STRING_EXPRESSION)
+        if not placeholder:
+            msg = f"Hostname template {template!r} has no app name placeholder"
+            raise ValueError(msg)
+        prefix_labels = prefix.split(".")
+        suffix_labels = suffix.split(".")
+        # the placeholder shares a label with the tail of the prefix and the
+        # head of the suffix, e.g. "{app_name}-apps" in "{app_name}-apps.x.y"
+        fixed_labels = prefix_labels[:-1] + suffix_labels[1:]
+        max_length = (
+            DOMAIN_SECTION_MAX_LENGTH - len(prefix_labels[-1]) - len(suffix_labels[0])
+        )
+        if any(len(label) > DOMAIN_SECTION_MAX_LENGTH for label in fixed_labels):
+            max_length = -1
+        return cls(prefix=prefix, suffix=suffix, max_app_name_length=max_length)
+
+    @property
+    def template(self) -> str:
+        return f"{self.prefix}{APP_NAME_F_STRING_EXPRESSION}{self.suffix}"
+
+    def render(self, app_name: str) -> str:
+        hostname = f"{self.prefix}{app_name}{self.suffix}"
+        if "." in app_name:
+            too_long = any(
+                len(part) > DOMAIN_SECTION_MAX_LENGTH for part in hostname.split(".")
+            )
+        else:
+            too_long = len(app_name) > self.max_app_name_length
+        if too_long:
+            msg = (
+                f"Generated hostname {hostname} is too long. "
+                f"If your app name is long, consider using shorter app name."
+            )
+            raise Exception(msg)
+        return hostname
+
+
+@functools.cache
+def compile_hostname_template(raw_template: str) -> IngressHostnameTemplate:
+    """Compile a hostname template as found in the cluster apps config."""
+    # any single f-string style placeholder stands for the app name
+    assert len(re.findall(F_STRING_EXPRESSION_RE, raw_template)) == 1, (
+        "Invalid template"
+    )
+    return IngressHostnameTemplate.compile(
+        re.sub(F_STRING_EXPRESSION_RE, APP_NAME_F_STRING_EXPRESSION, raw_template)
+    )
+
+
+async def _get_ingress_hostname_template(
+    client: apolo_sdk.Client,
+) -> IngressHostnameTemplate:
     cluster = client.config.get_cluster(client.config.cluster_name)
     apps_config = cluster.apps
 
-    template = f"{APP_NAME_F_STRING_EXPRESSION}.apps.{client.cluster_name}.org.neu.ro"
     if apps_config.hostname_templates:
         # multi-domain clusters are not supported on the backend yet
-        template = apps_config.hostname_templates[0]
-        assert len(re.findall(F_STRING_EXPRESSION_RE, template)) == 1, (
-            "Invalid template"
-        )
+        return compile_hostname_template(apps_config.hostname_templates[0])
+    return compile_hostname_template(
+        f"{APP_NAME_F_STRING_EXPRESSION}.apps.{client.cluster_name}.org.neu.ro"
+    )
 
-        template = re.sub(
-            F_STRING_EXPRESSION_RE, APP_NAME_F_STRING_EXPRESSION, template
-        )
 
-    if template.endswith("."):
-        template = template[:-1]
-    return template
+async def _get_ingress_name_template(client: apolo_sdk.Client) -> str:
+    return (await _get_ingress_hostname_template(client)).template
 
 
 async def _generate_ingress_config(
@@ -79,20 +146,8 @@ async def _generate_ingress_config(
     port_configurations: list[Port] | None = None,
     namespace_suffix: str = "",
 ) -> dict[str, t.Any]:
-    ingress_hostname = await _get_ingress_name_template(apolo_client)
-    hostname = ingress_hostname.format(
-        **{APP_NAME_PLACEHOLDER: f"{app_type.value}--{app_id}{namespace_suffix}"}
-    )
-
-    if any(
-        len(hostname_part) > DOMAIN_SECTION_MAX_LENGTH
-        for hostname_part in hostname.split(".")
-    ):
-        msg = (
-            f"Generated hostname {hostname} is too long. "
-            f"If your app name is long, consider using shorter app name."
-        )
-        raise Exception(msg)
+    hostname_template = await _get_ingress_hostname_template(apolo_client)
+    hostname = hostname_template.render(f"{app_type.value}--{app_id}{namespace_suffix}")
     if not port_configurations:
         paths = [{"path": "/", "pathType": "Prefix", "portName": "http"}]
     else:
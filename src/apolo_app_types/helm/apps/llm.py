@@ -9,7 +9,7 @@ from apolo_app_types.helm.apps.common import (
     append_apolo_storage_integration_annotations,
     gen_apolo_storage_integration_labels,
     gen_extra_values,
-    get_preset,
+    get_preset_resolver,
 )
 from apolo_app_types.helm.utils.deep_merging import merge_list_of_dicts
 from apolo_app_types.protocols.common import (
@@ -201,7 +201,7 @@ class LLMChartValueProcessor(BaseChartValueProcessor[LLMInputs]):
         values.update(self._configure_model_download(input_))
 
         preset_name = input_.preset.name
-        preset: Preset = get_preset(self.client, preset_name)
+        preset: Preset = get_preset_resolver(self.client).get_preset(preset_name)
         nvidia_gpus = preset.nvidia_gpu.count if preset.nvidia_gpu else 0
         amd_gpus = preset.amd_gpu.count if preset.amd_gpu else 0
 
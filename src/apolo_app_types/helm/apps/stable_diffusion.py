@@ -6,9 +6,7 @@ from apolo_app_types.app_types import AppType
 from apolo_app_types.helm.apps.base import BaseChartValueProcessor
 from apolo_app_types.helm.apps.common import (
     gen_extra_values,
-    get_component_values,
-    get_preset,
-    get_resource_pools_for_preset,
+    get_preset_resolver,
 )
 from apolo_app_types.helm.utils.deep_merging import merge_list_of_dicts
 from apolo_app_types.protocols.common.secrets_ import serialize_optional_secret
@@ -70,9 +68,9 @@ class StableDiffusionChartValueProcessor(
             namespace,
         )
 
-        preset = get_preset(self.client, preset_name)
-        resource_pools = get_resource_pools_for_preset(self.client, preset_name)
-        component_vals = await get_component_values(preset, preset_name, resource_pools)
+        preset_resolver = get_preset_resolver(self.client)
+        preset = preset_resolver.get_preset(preset_name)
+        component_vals = await preset_resolver.get_component_values(preset_name)
         api_vars = self._get_env_vars(input_, preset, app_secrets_name)
         img_repository = self._get_image_repository(preset)
 
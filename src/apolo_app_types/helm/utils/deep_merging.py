@@ -1,24 +1,54 @@
-import copy
 import typing as t
-from functools import reduce
 
 
-def deep_merge(dict1: dict[str, t.Any], dict2: dict[str, t.Any]) -> dict[str, t.Any]:
-    """Recursively merges two dictionaries."""
-    merged = copy.deepcopy(dict1)
-    for key, value in dict2.items():
-        if key in merged:
-            if isinstance(merged[key], dict) and isinstance(value, dict):
-                merged[key] = deep_merge(merged[key], value)
-            elif isinstance(merged[key], list) and isinstance(value, list):
-                merged[key].extend(value)
-            else:
-                merged[key] = value
+def _merge_into(
+    target: dict[str, t.Any], source: dict[str, t.Any], owned: dict[int, t.Any]
+) -> None:
+    """
+    Merge ``source`` into ``target`` in place, copying on write.
+
+    ``owned`` holds the containers created by the current merge. Any other
+    dict or list reached through ``target`` belongs to one of the inputs and
+    is shallow-copied before it is modified, so only the modified paths are
+    copied and the inputs are never mutated.
+    """
+    for key, value in source.items():
+        current = target.get(key)
+        if isinstance(current, dict) and isinstance(value, dict):
+            if id(current) not in owned:
+                current = target[key] = dict(current)
+                owned[id(current)] = current
+            _merge_into(current, value, owned)
+        elif isinstance(current, list) and isinstance(value, list):
+            if id(current) not in owned:
+                current = target[key] = list(current)
+                owned[id(current)] = current
+            current.extend(value)
         else:
-            merged[key] = value
-    return merged
+            target[key] = value
+
+
+def deep_merge(dict1: dict[str, t.Any], dict2: dict[str, t.Any]) -> dict[str, t.Any]:
+    """
+    Recursively merges two dictionaries.
+
+    Nested dicts are merged, lists are concatenated and any other value from
+    dict2 wins. Neither input is modified, but the result is not a deep copy:
+    dicts and lists the merge leaves untouched are the inputs' own objects
+    (this used to deep-copy dict1). Copy the result before mutating nested
+    values in place.
+    """
+    return merge_list_of_dicts([dict1, dict2])
 
 
 def merge_list_of_dicts(dict_list: list[dict[str, t.Any]]) -> dict[str, t.Any]:
-    """Merges a list of dictionaries using deep_merge."""
-    return reduce(deep_merge, dict_list, {})
+    """
+    Merges a list of dictionaries in one pass, with deep_merge semantics.
+
+    As with deep_merge, untouched subtrees alias the input dictionaries.
+    """
+    merged: dict[str, t.Any] = {}
+    owned: dict[int, t.Any] = {id(merged): merged}
+    for item in dict_list:
+        _merge_into(merged, item, owned)
+    return merged
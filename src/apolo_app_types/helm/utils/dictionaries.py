@@ -1,7 +1,6 @@
-from functools import reduce
 from typing import Any
 
-from apolo_app_types.helm.utils.deep_merging import deep_merge
+from apolo_app_types.helm.utils.deep_merging import merge_list_of_dicts
 
 
 def get_value_from_nested_key(dictionary: dict[str, Any], key: str) -> Any:
@@ -29,4 +28,4 @@ def get_nested_values(dictionary: dict[str, Any], keys: list[str]) -> dict[str,
     for key in keys:
         dicts.append(get_value_from_nested_key(dictionary, key))
 
-    return reduce(deep_merge, dicts, {})
+    return merge_list_of_dicts(dicts)
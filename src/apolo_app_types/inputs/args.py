@@ -55,6 +55,54 @@ from apolo_app_types.protocols.text_embeddings import TextEmbeddingsInferenceApp
 from apolo_app_types.protocols.vscode import VSCodeAppInputs
 
 
+# Chart value processors of the built-in app types
+PROCESSOR_MAP: dict[AppType, type[BaseChartValueProcessor[t.Any]]] = {
+    AppType.LLMInference: LLMChartValueProcessor,
+    AppType.StableDiffusion: StableDiffusionChartValueProcessor,
+    AppType.Weaviate: WeaviateChartValueProcessor,
+    AppType.DockerHub: DockerHubModelChartValueProcessor,
+    AppType.CustomDeployment: CustomDeploymentChartValueProcessor,
+    AppType.SparkJob: SparkJobValueProcessor,
+    AppType.Fooocus: FooocusChartValueProcessor,
+    AppType.LightRAG: LightRAGChartValueProcessor,
+    AppType.Jupyter: JupyterChartValueProcessor,
+    AppType.TextEmbeddingsInference: TextEmbeddingsChartValueProcessor,
+    AppType.PrivateGPT: PrivateGptChartValueProcessor,
+    AppType.VSCode: VSCodeChartValueProcessor,
+    AppType.Shell: ShellChartValueProcessor,
+    AppType.Superset: SupersetChartValueProcessor,
+    AppType.OpenWebUI: OpenWebUIChartValueProcessor,
+    AppType.Llama4: Llama4ValueProcessor,
+    AppType.DeepSeek: DeepSeekValueProcessor,
+    AppType.Mistral: MistralValueProcessor,
+    AppType.GptOss: GPTOSSValueProcessor,
+}
+
+# Inputs types of the built-in app types
+INPUT_TYPE_MAP: dict[AppType, type[AppInputs]] = {
+    AppType.LLMInference: LLMInputs,
+    AppType.StableDiffusion: StableDiffusionInputs,
+    AppType.Weaviate: WeaviateInputs,
+    AppType.DockerHub: DockerHubInputs,
+    AppType.PostgreSQL: PostgresInputs,
+    AppType.CustomDeployment: CustomDeploymentInputs,
+    AppType.SparkJob: SparkJobInputs,
+    AppType.Fooocus: FooocusAppInputs,
+    AppType.LightRAG: LightRAGAppInputs,
+    AppType.Jupyter: JupyterAppInputs,
+    AppType.TextEmbeddingsInference: TextEmbeddingsInferenceAppInputs,
+    AppType.PrivateGPT: PrivateGPTAppInputs,
+    AppType.VSCode: VSCodeAppInputs,
+    AppType.Shell: ShellAppInputs,
+    AppType.Superset: SupersetInputs,
+    AppType.OpenWebUI: OpenWebUIAppInputs,
+    AppType.Llama4: LLama4Inputs,
+    AppType.DeepSeek: DeepSeekR1Inputs,
+    AppType.Mistral: MistralInputs,
+    AppType.GptOss: GptOssInputs,
+}
+
+
 async def app_type_to_vals(
     input_: AppInputs,
     apolo_client: apolo_sdk.Client,
@@ -64,30 +112,7 @@ async def app_type_to_vals(
     app_id: str,
     app_secrets_name: str,
 ) -> tuple[list[str], dict[str, t.Any]]:
-    # Mapping AppType to their respective processor classes
-    processor_map: dict[AppType, type[BaseChartValueProcessor[t.Any]]] = {
-        AppType.LLMInference: LLMChartValueProcessor,
-        AppType.StableDiffusion: StableDiffusionChartValueProcessor,
-        AppType.Weaviate: WeaviateChartValueProcessor,
-        AppType.DockerHub: DockerHubModelChartValueProcessor,
-        AppType.CustomDeployment: CustomDeploymentChartValueProcessor,
-        AppType.SparkJob: SparkJobValueProcessor,
-        AppType.Fooocus: FooocusChartValueProcessor,
-        AppType.LightRAG: LightRAGChartValueProcessor,
-        AppType.Jupyter: JupyterChartValueProcessor,
-        AppType.TextEmbeddingsInference: TextEmbeddingsChartValueProcessor,
-        AppType.PrivateGPT: PrivateGptChartValueProcessor,
-        AppType.VSCode: VSCodeChartValueProcessor,
-        AppType.Shell: ShellChartValueProcessor,
-        AppType.Superset: SupersetChartValueProcessor,
-        AppType.OpenWebUI: OpenWebUIChartValueProcessor,
-        AppType.Llama4: Llama4ValueProcessor,
-        AppType.DeepSeek: DeepSeekValueProcessor,
-        AppType.Mistral: MistralValueProcessor,
-        AppType.GptOss: GPTOSSValueProcessor,
-    }
-
-    processor_class = processor_map.get(app_type)
+    processor_class = PROCESSOR_MAP.get(app_type)
 
     if not processor_class:
         err_msg = f"App type {app_type} is not supported"
@@ -125,33 +150,10 @@ async def get_installation_vals(
     namespace: str = "default",
     app_secrets_name: str = "apps-secrets",
 ) -> dict[str, t.Any]:
-    input_type_map: dict[AppType, type[AppInputs]] = {
-        AppType.LLMInference: LLMInputs,
-        AppType.StableDiffusion: StableDiffusionInputs,
-        AppType.Weaviate: WeaviateInputs,
-        AppType.DockerHub: DockerHubInputs,
-        AppType.PostgreSQL: PostgresInputs,
-        AppType.CustomDeployment: CustomDeploymentInputs,
-        AppType.SparkJob: SparkJobInputs,
-        AppType.Fooocus: FooocusAppInputs,
-        AppType.LightRAG: LightRAGAppInputs,
-        AppType.Jupyter: JupyterAppInputs,
-        AppType.TextEmbeddingsInference: TextEmbeddingsInferenceAppInputs,
-        AppType.PrivateGPT: PrivateGPTAppInputs,
-        AppType.VSCode: VSCodeAppInputs,
-        AppType.Shell: ShellAppInputs,
-        AppType.Superset: SupersetInputs,
-        AppType.OpenWebUI: OpenWebUIAppInputs,
-        AppType.Llama4: LLama4Inputs,
-        AppType.DeepSeek: DeepSeekR1Inputs,
-        AppType.Mistral: MistralInputs,
-        AppType.GptOss: GptOssInputs,
-    }
-
-    if app_type not in input_type_map:
+    if app_type not in INPUT_TYPE_MAP:
         err_msg = f"App type {app_type} is not supported"
         raise NotImplementedError(err_msg)
-    input_ = input_type_map[app_type].model_validate(input_dict)
+    input_ = INPUT_TYPE_MAP[app_type].model_validate(input_dict)
 
     _, extra_vals = await app_type_to_vals(
         input_,
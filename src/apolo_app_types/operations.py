@@ -0,0 +1,172 @@
+"""App operations shared by the CLI commands and the serve daemon."""
+
+import logging
+import re
+import typing as t
+
+import apolo_sdk
+
+from apolo_app_types.helm.apps.base import BaseChartValueProcessor
+from apolo_app_types.outputs.utils.cleanup import (
+    DEFAULT_CLEANUP_CONCURRENCY,
+    SecretCleanupSummary,
+    cleanup_secrets,
+)
+from apolo_app_types.outputs.utils.discovery import (
+    load_app_inputs,
+    load_app_outputs,
+    load_app_preprocessor,
+)
+from apolo_app_types.protocols.common import AppInputs, AppOutputs
+
+
+logger = logging.getLogger(__name__)
+
+_SENSITIVE_RE = re.compile(
+    r"token|password|secret|api[_-]?key|credential|authorization", re.IGNORECASE
+)
+_REDACTED = "***REDACTED***"
+
+
+def _redact(obj: t.Any) -> t.Any:
+    """Recursively mask sensitive values so tokens/passwords never reach logs."""
+    if isinstance(obj, dict):
+        # env-var entries: {"name": "APOLO_API_TOKEN", "value": "<token>"}
+        name = obj.get("name")
+        if isinstance(name, str) and "value" in obj and _SENSITIVE_RE.search(name):
+            return {**obj, "value": _REDACTED}
+        return {
+            k: (
+                _REDACTED
+                if isinstance(k, str) and _SENSITIVE_RE.search(k)
+                else _redact(v)
+            )
+            for k, v in obj.items()
+        }
+    if isinstance(obj, list):
+        return [_redact(item) for item in obj]
+    return obj
+
+
+BUILTIN_PACKAGE = "apolo_app_types"
+
+
+def _builtin_components(
+    app_type: str,
+    inputs_type: str | None = None,
+    preprocessor_type: str | None = None,
+) -> tuple[type[AppInputs], type[BaseChartValueProcessor[t.Any]]]:
+    """The inputs and preprocessor classes of a built-in app type.
+
+    apolo_app_types exports no chart value processors, so built-in app
+    types are resolved by their AppType rather than by package discovery.
+    """
+    from apolo_app_types.app_types import AppType
+    from apolo_app_types.inputs.args import INPUT_TYPE_MAP, PROCESSOR_MAP
+
+    try:
+        builtin = AppType(app_type)
+        inputs_class = INPUT_TYPE_MAP[builtin]
+        preprocessor_class = PROCESSOR_MAP[builtin]
+    except (ValueError, KeyError):
+        err_msg = f"Unable to find preprocessor for built-in {app_type=}"
+        raise ValueError(err_msg) from None
+    for requested, found in (
+        (inputs_type, inputs_class),
+        (preprocessor_type, preprocessor_class),
+    ):
+        if requested and requested != found.__name__:
+            err_msg = f"{requested} is not a type of built-in {app_type=}"
+            raise ValueError(err_msg)
+    return inputs_class, preprocessor_class
+
+
+def load_preprocessor(
+    app_type: str,
+    package_name: str,
+    inputs_dict: dict[str, t.Any],
+    inputs_type: str | None = None,
+    preprocessor_type: str | None = None,
+) -> tuple[AppInputs, type[BaseChartValueProcessor[t.Any]]]:
+    """Validate app inputs and find the preprocessor that turns them into values."""
+    if package_name == BUILTIN_PACKAGE:
+        inputs_class, preprocessor_class = _builtin_components(
+            app_type, inputs_type, preprocessor_type
+        )
+    else:
+        found_inputs = load_app_inputs(app_type, package_name, inputs_type)
+        if not found_inputs:
+            err_msg = f"Unable to find inputs type for {app_type=}, {inputs_type=}"
+            raise ValueError(err_msg)
+        found_preprocessor = load_app_preprocessor(
+            app_type, package_name, preprocessor_type
+        )
+        if not found_preprocessor:
+            err_msg = (
+                f"Unable to find preprocessor {app_type=}, {preprocessor_type=},"
+                f" Package: {package_name}"
+            )
+            raise ValueError(err_msg)
+        inputs_class, preprocessor_class = found_inputs, found_preprocessor
+
+    loaded_inputs = inputs_class.model_validate(inputs_dict)
+    logger.info("Loaded inputs: %s", _redact(loaded_inputs.model_dump()))
+    return loaded_inputs, preprocessor_class
+
+
+async def generate_helm_values(
+    client: apolo_sdk.Client,
+    inputs: AppInputs,
+    preprocessor_class: type[BaseChartValueProcessor[t.Any]],
+    app_name: str,
+    namespace: str,
+    app_id: str,
+    apps_secret_name: str,
+    apolo_passed_config: str | None = None,
+) -> tuple[list[str], dict[str, t.Any]]:
+    """Run a preprocessor; return the extra helm args and values."""
+    chart_processor = preprocessor_class(client)
+    extra_helm_args = await chart_processor.gen_extra_helm_args()
+    extra_vals = await chart_processor.gen_extra_values(
+        input_=inputs,
+        app_name=app_name,
+        namespace=namespace,
+        app_secrets_name=apps_secret_name,
+        app_id=app_id,
+    )
+    if apolo_passed_config:
+        extra_vals["APOLO_PASSED_CONFIG"] = apolo_passed_config
+    return extra_helm_args, extra_vals
+
+
+def load_outputs_class(
+    app_type: str,
+    package_name: str,
+    output_type: str | None = None,
+) -> type[AppOutputs]:
+    output_class = load_app_outputs(app_type, package_name, output_type)
+    if not output_class:
+        err_msg = (
+            f"Unable to find Output Type {app_type=}, {output_type=},"
+            f" Package: {package_name}"
+        )
+        raise ValueError(err_msg)
+    return output_class
+
+
+async def cleanup_app(
+    client: apolo_sdk.Client,
+    app_id: str,
+    output_class: type[AppOutputs],
+    max_concurrency: int = DEFAULT_CLEANUP_CONCURRENCY,
+) -> SecretCleanupSummary:
+    """Delete the secrets referenced by an app's outputs."""
+    summary = await cleanup_secrets(
+        app_id=app_id,
+        output_class=output_class,
+        client=client,
+        max_concurrency=max_concurrency,
+    )
+    if summary.failed:
+        logger.warning("Secrets left after cleanup: %s", sorted(summary.failed))
+    return summary
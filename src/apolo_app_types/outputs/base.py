@@ -3,6 +3,7 @@ import logging
 import typing as t
 
 from apolo_app_types import AppOutputs
+from apolo_app_types.outputs.utils.apolo_secrets import apolo_secrets_session
 
 
 logger = logging.getLogger(__name__)
@@ -18,7 +19,9 @@ class BaseAppOutputsProcessor(abc.ABC, t.Generic[AppOutputsT]):
     ) -> dict[str, t.Any]:
         msg = f"Generating outputs for {helm_values}"
         logger.info(msg)
-        return (await self._generate_outputs(helm_values, app_instance_id)).model_dump()
+        async with apolo_secrets_session():
+            outputs = await self._generate_outputs(helm_values, app_instance_id)
+        return outputs.model_dump()
 
     @abc.abstractmethod
     async def _generate_outputs(
@@ -1,15 +1,29 @@
-from apolo_app_types.clients.kube import get_service_host_port
+import asyncio
+
+from apolo_app_types.clients.kube import (
+    INSTANCE_LABEL as INSTANCE_LABEL,
+    get_service_host_port,
+)
 from apolo_app_types.outputs.utils.ingress import get_ingress_host_port
 from apolo_app_types.protocols.common.networking import WebApp
 
 
-INSTANCE_LABEL = "app.kubernetes.io/instance"
+async def get_service_ingress_host_ports(
+    labels: dict[str, str],
+) -> tuple[tuple[str, str], tuple[str, int] | None]:
+    """Look up the service and ingress host and port of ``labels`` concurrently."""
+    return await asyncio.gather(
+        get_service_host_port(match_labels=labels),
+        get_ingress_host_port(match_labels=labels),
+    )
 
 
-async def get_internal_external_web_urls(
-    labels: dict[str, str],
+def web_app_urls(
+    service_host_port: tuple[str, str],
+    ingress_host_port: tuple[str, int] | None,
 ) -> tuple[WebApp | None, WebApp | None]:
-    internal_host, internal_port = await get_service_host_port(match_labels=labels)
+    """Internal and external web app URLs of a looked up service and ingress."""
+    internal_host, internal_port = service_host_port
     internal_web_app_url = None
     if internal_host:
         internal_web_app_url = WebApp(
@@ -19,10 +33,9 @@ async def get_internal_external_web_urls(
             protocol="http",
         )
 
-    host_port = await get_ingress_host_port(match_labels=labels)
     external_web_app_url = None
-    if host_port:
-        host, port = host_port
+    if ingress_host_port:
+        host, port = ingress_host_port
         external_web_app_url = WebApp(
             host=host,
             port=int(port),
@@ -30,3 +43,9 @@ async def get_internal_external_web_urls(
             protocol="https",
         )
     return internal_web_app_url, external_web_app_url
+
+
+async def get_internal_external_web_urls(
+    labels: dict[str, str],
+) -> tuple[WebApp | None, WebApp | None]:
+    return web_app_urls(*await get_service_ingress_host_ports(labels))
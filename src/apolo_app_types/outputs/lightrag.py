@@ -1,12 +1,11 @@
 import typing as t
 
 from apolo_app_types import LightRAGAppOutputs
-from apolo_app_types.clients.kube import get_service_host_port
 from apolo_app_types.outputs.common import (
     INSTANCE_LABEL,
-    get_internal_external_web_urls,
+    get_service_ingress_host_ports,
+    web_app_urls,
 )
-from apolo_app_types.outputs.utils.ingress import get_ingress_host_port
 from apolo_app_types.protocols.common.networking import HttpApi, ServiceAPI, WebApp
 
 
@@ -19,13 +18,15 @@ async def get_lightrag_outputs(
     # and instance label for the deployed app
     labels = {"app.kubernetes.io/name": "lightrag", INSTANCE_LABEL: app_instance_id}
 
-    # Get internal and external web app URLs using the common utility
-    internal_web_app_url, external_web_app_url = await get_internal_external_web_urls(
-        labels
+    # One service and one ingress lookup serve both the web app and the
+    # server URLs
+    service_host_port, ingress_host_port = await get_service_ingress_host_ports(labels)
+    internal_web_app_url, external_web_app_url = web_app_urls(
+        service_host_port, ingress_host_port
     )
+    internal_host, internal_port = service_host_port
 
     # Get internal server URL (same as web app for LightRAG since it's a single service)
-    internal_host, internal_port = await get_service_host_port(match_labels=labels)
     internal_server_url = None
     if internal_host:
         internal_server_url = HttpApi(
@@ -36,7 +37,6 @@ async def get_lightrag_outputs(
 
     # Get external server URL (same as web app for LightRAG)
     external_server_url = None
-    ingress_host_port = await get_ingress_host_port(match_labels=labels)
     if ingress_host_port:
         external_server_url = HttpApi(
             host=ingress_host_port[0],
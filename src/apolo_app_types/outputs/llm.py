@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import typing as t
 
@@ -22,10 +23,10 @@ logger = logging.getLogger()
 async def get_llm_inference_outputs(
     helm_values: dict[str, t.Any], app_instance_id: str
 ) -> dict[str, t.Any]:
-    internal_host, internal_port = await get_service_host_port(
-        match_labels={
-            INSTANCE_LABEL: app_instance_id,
-        }
+    match_labels = {INSTANCE_LABEL: app_instance_id}
+    (internal_host, internal_port), ingress_host_port = await asyncio.gather(
+        get_service_host_port(match_labels=match_labels),
+        get_ingress_host_port(match_labels=match_labels),
     )
     server_extra_args = helm_values.get("serverExtraArgs", [])
     cli_args = parse_cli_args(server_extra_args)
@@ -51,11 +52,6 @@ async def get_llm_inference_outputs(
         hf_model=hf_model,
     )
 
-    ingress_host_port = await get_ingress_host_port(
-        match_labels={
-            INSTANCE_LABEL: app_instance_id,
-        }
-    )
     chat_external_api = None
     embeddings_external_api = None
     if ingress_host_port:
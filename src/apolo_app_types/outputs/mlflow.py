@@ -1,12 +1,11 @@
 import typing as t
 
 from apolo_app_types import MLFlowAppOutputs, MLFlowTrackingServerURL
-from apolo_app_types.clients.kube import get_service_host_port
 from apolo_app_types.outputs.common import (
     INSTANCE_LABEL,
-    get_internal_external_web_urls,
+    get_service_ingress_host_ports,
+    web_app_urls,
 )
-from apolo_app_types.outputs.utils.ingress import get_ingress_host_port
 from apolo_app_types.protocols.common.networking import (
     RestAPI,
     ServiceAPI,
@@ -19,12 +18,13 @@ async def get_mlflow_outputs(
     app_instance_id: str,
 ) -> dict[str, t.Any]:
     labels = {"application": "mlflow", INSTANCE_LABEL: app_instance_id}
-    internal_web_app_url, external_web_app_url = await get_internal_external_web_urls(
-        labels
+    service_host_port, ingress_host_port = await get_service_ingress_host_ports(labels)
+    internal_web_app_url, external_web_app_url = web_app_urls(
+        service_host_port, ingress_host_port
     )
+    internal_host, internal_port = service_host_port
 
     # Get internal server URL
-    internal_host, internal_port = await get_service_host_port(match_labels=labels)
     internal_server_url = None
     if internal_host:
         internal_server_url = RestAPI(
@@ -35,7 +35,6 @@ async def get_mlflow_outputs(
 
     # Get external server URL
     external_server_url = None
-    ingress_host_port = await get_ingress_host_port(match_labels=labels)
     if ingress_host_port:
         external_server_url = RestAPI(
             host=ingress_host_port[0],
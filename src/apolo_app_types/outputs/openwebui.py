@@ -1,3 +1,4 @@
+import asyncio
 import typing as t
 
 from apolo_app_types.clients.kube import get_service_host_port
@@ -18,7 +19,10 @@ async def get_openwebui_outputs(
         "application": "openwebui",
         INSTANCE_LABEL: app_instance_id,
     }
-    internal_host, internal_port = await get_service_host_port(match_labels=labels)
+    (internal_host, internal_port), host_port = await asyncio.gather(
+        get_service_host_port(match_labels=labels),
+        get_ingress_host_port(match_labels=labels),
+    )
     internal_web_app_url = None
     if internal_host:
         internal_web_app_url = WebApp(
@@ -28,7 +32,6 @@ async def get_openwebui_outputs(
             protocol="http",
         )
 
-    host_port = await get_ingress_host_port(match_labels=labels)
     external_web_app_url = None
     if host_port:
         host, port = host_port
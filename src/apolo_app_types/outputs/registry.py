@@ -0,0 +1,115 @@
+import importlib
+import logging
+import typing as t
+from collections.abc import Awaitable, Callable
+from importlib.metadata import entry_points
+
+from apolo_app_types.app_types import AppType
+
+
+logger = logging.getLogger(__name__)
+
+OutputsGenerator = Callable[[dict[str, t.Any], str], Awaitable[dict[str, t.Any]]]
+
+# Entry point group third-party packages can use to ship generators, e.g.
+# [project.entry-points."apolo_app_types.outputs_generators"]
+# my-app = "my_package.outputs:get_my_app_outputs"
+ENTRY_POINT_GROUP = "apolo_app_types.outputs_generators"
+
+# Built-in generators as "module:attribute" references, imported on first use
+# so that a hook run only loads the outputs module of the app it serves.
+_BUILTIN_GENERATORS: dict[str, str] = {
+    AppType.LLMInference: "apolo_app_types.outputs.llm:get_llm_inference_outputs",
+    AppType.Llama4: "apolo_app_types.outputs.llm:get_llm_inference_outputs",
+    AppType.Mistral: "apolo_app_types.outputs.llm:get_llm_inference_outputs",
+    AppType.GptOss: "apolo_app_types.outputs.llm:get_llm_inference_outputs",
+    AppType.DeepSeek: "apolo_app_types.outputs.llm:get_llm_inference_outputs",
+    AppType.StableDiffusion: (
+        "apolo_app_types.outputs.stable_diffusion:get_stable_diffusion_outputs"
+    ),
+    AppType.Weaviate: "apolo_app_types.outputs.weaviate:get_weaviate_outputs",
+    AppType.DockerHub: "apolo_app_types.outputs.dockerhub:get_dockerhub_outputs",
+    AppType.CustomDeployment: (
+        "apolo_app_types.outputs.custom_deployment:get_custom_deployment_outputs"
+    ),
+    AppType.SparkJob: "apolo_app_types.outputs.spark_job:get_spark_job_outputs",
+    AppType.TextEmbeddingsInference: "apolo_app_types.outputs.tei:get_tei_outputs",
+    AppType.Fooocus: "apolo_app_types.outputs.fooocus:get_fooocus_outputs",
+    AppType.MLFlow: "apolo_app_types.outputs.mlflow:get_mlflow_outputs",
+    AppType.Jupyter: "apolo_app_types.outputs.jupyter:get_jupyter_outputs",
+    AppType.VSCode: "apolo_app_types.outputs.vscode:get_vscode_outputs",
+    AppType.PrivateGPT: "apolo_app_types.outputs.privategpt:get_privategpt_outputs",
+    AppType.Shell: "apolo_app_types.outputs.shell:get_shell_outputs",
+    AppType.Superset: "apolo_app_types.outputs.superset:get_superset_outputs",
+    AppType.LightRAG: "apolo_app_types.outputs.lightrag:get_lightrag_outputs",
+    AppType.OpenWebUI: "apolo_app_types.outputs.openwebui:get_openwebui_outputs",
+}
+
+_generators: dict[str, OutputsGenerator | str] = {
+    str(app_type): reference for app_type, reference in _BUILTIN_GENERATORS.items()
+}
+
+
+def register_outputs_generator(
+    app_type: str,
+    generator: OutputsGenerator | str,
+    *,
+    replace: bool = False,
+) -> None:
+    """
+    Register the outputs generator for an app type.
+
+    ``generator`` is either the coroutine function itself or a lazy
+    ``"module:attribute"`` reference that is imported on first use.
+    """
+    app_type = str(app_type)
+    if app_type in _generators and not replace:
+        msg = f"Outputs generator for app type {app_type!r} is already registered"
+        raise ValueError(msg)
+    _generators[app_type] = generator
+
+
+def unregister_outputs_generator(app_type: str) -> None:
+    _generators.pop(str(app_type), None)
+
+
+def get_outputs_generator(app_type: str) -> OutputsGenerator | None:
+    """
+    Return the outputs generator for an app type, importing it if needed.
+
+    App types without a registered generator are looked up in the
+    ``apolo_app_types.outputs_generators`` entry point group and cached.
+    """
+    app_type = str(app_type)
+    generator = _generators.get(app_type)
+    if generator is None:
+        generator = _load_entry_point(app_type)
+        if generator is None:
+            return None
+    if isinstance(generator, str):
+        generator = _import_reference(generator)
+    _generators[app_type] = generator
+    return generator
+
+
+def registered_app_types() -> list[str]:
+    return sorted(_generators)
+
+
+def _import_reference(reference: str) -> OutputsGenerator:
+    module_name, _, attribute = reference.partition(":")
+    if not attribute:
+        msg = (
+            f"Invalid outputs generator reference {reference!r}, "
+            "expected 'module:attribute'"
+        )
+        raise ValueError(msg)
+    module = importlib.import_module(module_name)
+    return t.cast(OutputsGenerator, getattr(module, attribute))
+
+
+def _load_entry_point(app_type: str) -> OutputsGenerator | None:
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP, name=app_type):
+        logger.info("Loading outputs generator for %s from %s", app_type, entry_point)
+        return t.cast(OutputsGenerator, entry_point.load())
+    return None
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import typing as t
 
@@ -20,10 +21,10 @@ async def get_stable_diffusion_outputs(
         "application": "stable-diffusion",
         INSTANCE_LABEL: app_instance_id,
     }
-    internal_host, internal_port = await get_service_host_port(
-        match_labels=match_labels
+    (internal_host, internal_port), ingress_host_port = await asyncio.gather(
+        get_service_host_port(match_labels=match_labels),
+        get_ingress_host_port(match_labels=match_labels),
     )
-    ingress_host_port = await get_ingress_host_port(match_labels=match_labels)
     if ingress_host_port:
         external_host = ingress_host_port[0]
     else:
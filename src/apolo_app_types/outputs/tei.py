@@ -1,3 +1,4 @@
+import asyncio
 import typing as t
 
 from apolo_app_types import HuggingFaceModel
@@ -16,7 +17,10 @@ async def get_tei_outputs(
         "application": "text-embeddings-inference",
         INSTANCE_LABEL: app_instance_id,
     }
-    internal_host, internal_port = await get_service_host_port(match_labels=labels)
+    (internal_host, internal_port), host_port = await asyncio.gather(
+        get_service_host_port(match_labels=labels),
+        get_ingress_host_port(match_labels=labels),
+    )
     internal_api = None
     model_prop = helm_values.get("model")
     if model_prop:
@@ -31,7 +35,6 @@ async def get_tei_outputs(
             hf_model=hf_model,
         )
 
-    host_port = await get_ingress_host_port(match_labels=labels)
     external_api = None
     if host_port:
         host, port = host_port
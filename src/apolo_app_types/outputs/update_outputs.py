@@ -1,42 +1,105 @@
 import asyncio
+import datetime as dt
+import email.utils
 import logging
 import os
-import sys
+import random
 import time
 import typing as t
+from collections.abc import Mapping
+from dataclasses import dataclass
 
 import httpx
 
-from apolo_app_types.app_types import AppType
-from apolo_app_types.outputs.custom_deployment import get_custom_deployment_outputs
-from apolo_app_types.outputs.dockerhub import get_dockerhub_outputs
-from apolo_app_types.outputs.fooocus import get_fooocus_outputs
-from apolo_app_types.outputs.jupyter import get_jupyter_outputs
-from apolo_app_types.outputs.lightrag import get_lightrag_outputs
-from apolo_app_types.outputs.llm import get_llm_inference_outputs
-from apolo_app_types.outputs.mlflow import get_mlflow_outputs
-from apolo_app_types.outputs.openwebui import get_openwebui_outputs
-from apolo_app_types.outputs.privategpt import get_privategpt_outputs
-from apolo_app_types.outputs.shell import get_shell_outputs
-from apolo_app_types.outputs.spark_job import get_spark_job_outputs
-from apolo_app_types.outputs.stable_diffusion import get_stable_diffusion_outputs
-from apolo_app_types.outputs.superset import get_superset_outputs
-from apolo_app_types.outputs.tei import get_tei_outputs
+from apolo_app_types.clients.snapshot import (
+    InstanceResourceSnapshot,
+    NamespaceResourceSnapshot,
+    use_instance_snapshot,
+)
+from apolo_app_types.outputs.registry import get_outputs_generator
 from apolo_app_types.outputs.utils.discovery import (
     APOLO_APP_PACKAGE_PREFIX,
     load_app_postprocessor,
 )
-from apolo_app_types.outputs.vscode import get_vscode_outputs
-from apolo_app_types.outputs.weaviate import get_weaviate_outputs
 
 
 logger = logging.getLogger()
 
 MAX_RETRIES = 5
-RETRY_DELAY = 10  # seconds
+RETRY_BASE_DELAY = 1.0  # seconds
+RETRY_MAX_DELAY = 10.0  # seconds
+POST_OUTPUTS_DEADLINE = 60.0  # seconds
+DEFAULT_POST_CONCURRENCY = 8
+
+# Statuses worth another attempt: timeouts, rate limiting and server errors.
+# Everything else outside 2xx (bad token, bad payload, unknown app) is final.
+RETRYABLE_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    How post_outputs retries: exponential backoff with jitter, bounded by both
+    an attempt count and a total deadline measured from the first attempt.
+    """
+
+    max_attempts: int = MAX_RETRIES
+    base_delay: float = RETRY_BASE_DELAY
+    max_delay: float = RETRY_MAX_DELAY
+    multiplier: float = 2.0
+    # Fraction of each delay that is randomised, so hooks of many instances
+    # restarted together don't retry in lockstep.
+    jitter: float = 0.5
+    deadline: float | None = POST_OUTPUTS_DEADLINE
+    retryable_status_codes: frozenset[int] = RETRYABLE_STATUS_CODES
+
+    def is_retryable(self, status_code: int) -> bool:
+        return status_code in self.retryable_status_codes
+
+    def backoff(self, attempt: int, retry_after: float | None = None) -> float:
+        """Delay before the attempt following ``attempt`` (1-based)."""
+        delay = min(self.max_delay, self.base_delay * self.multiplier ** (attempt - 1))
+        delay -= delay * self.jitter * random.random()
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+
+@dataclass(frozen=True)
+class PostOutputsResult:
+    ok: bool
+    attempts: int
+    status_code: int | None = None
+    error: str | None = None
+
+    @property
+    def exit_code(self) -> int:
+        return 0 if self.ok else 1
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header given either in seconds or as an HTTP date."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=dt.UTC)
+    return max(0.0, (retry_at - dt.datetime.now(dt.UTC)).total_seconds())
 
 
-async def post_outputs(api_url: str, api_token: str, outputs: dict[str, t.Any]) -> None:
+async def post_outputs(  # noqa: C901
+    api_url: str,
+    api_token: str,
+    outputs: dict[str, t.Any],
+    policy: RetryPolicy | None = None,
+) -> PostOutputsResult:
+    policy = policy or RetryPolicy()
     timeout = httpx.Timeout(
         connect=10.0,
         read=30.0,
@@ -45,15 +108,19 @@ async def post_outputs(api_url: str, api_token: str, outputs: dict[str, t.Any])
     )
     headers = {"Authorization": f"Bearer {api_token}"}
     payload = {"output": outputs}
+    started = time.monotonic()
+    status_code: int | None = None
+    error: str | None = None
 
     async with httpx.AsyncClient(timeout=timeout) as client:
-        for attempt in range(1, MAX_RETRIES + 1):
+        for attempt in range(1, policy.max_attempts + 1):
             start_time = time.perf_counter()
+            retry_after: float | None = None
             try:
                 logger.info(
                     "Attempt %d/%d: Sending POST request to %s",
                     attempt,
-                    MAX_RETRIES,
+                    policy.max_attempts,
                     api_url,
                 )
                 logger.debug("Request headers: %s", headers)
@@ -62,6 +129,7 @@ async def post_outputs(api_url: str, api_token: str, outputs: dict[str, t.Any])
                 response = await client.post(api_url, headers=headers, json=payload)
 
                 elapsed = time.perf_counter() - start_time
+                status_code = response.status_code
                 logger.info(
                     "Received response in %.2f seconds: status=%d, body=%s",
                     elapsed,
@@ -71,22 +139,39 @@ async def post_outputs(api_url: str, api_token: str, outputs: dict[str, t.Any])
 
                 if 200 <= response.status_code < 300:
                     logger.info("Successfully posted outputs.")
-                    return
+                    return PostOutputsResult(
+                        ok=True, attempts=attempt, status_code=status_code
+                    )
+
+                error = f"HTTP {response.status_code}: {response.text}"
+                if not policy.is_retryable(response.status_code):
+                    logger.error(
+                        "Non-retryable response on attempt %d/%d: status=%d, body=%s",
+                        attempt,
+                        policy.max_attempts,
+                        response.status_code,
+                        response.text,
+                    )
+                    return PostOutputsResult(
+                        ok=False, attempts=attempt, status_code=status_code, error=error
+                    )
 
                 logger.warning(
                     "Non-2xx response on attempt %d/%d: status=%d, body=%s",
                     attempt,
-                    MAX_RETRIES,
+                    policy.max_attempts,
                     response.status_code,
                     response.text,
                 )
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
 
             except httpx.TimeoutException as e:
                 elapsed = time.perf_counter() - start_time
+                error = f"{type(e).__name__}: {e}"
                 logger.error(
                     "TimeoutException on attempt %d/%d after %.2fs: %s [%s]",
                     attempt,
-                    MAX_RETRIES,
+                    policy.max_attempts,
                     elapsed,
                     str(e),
                     type(e).__name__,
@@ -94,11 +179,12 @@ async def post_outputs(api_url: str, api_token: str, outputs: dict[str, t.Any])
 
             except httpx.RequestError as e:
                 elapsed = time.perf_counter() - start_time
+                error = f"{type(e).__name__}: {e}"
                 request = getattr(e, "request", None)
                 logger.error(
                     "RequestError on attempt %d/%d after %.2fs: %s [%s]",
                     attempt,
-                    MAX_RETRIES,
+                    policy.max_attempts,
                     elapsed,
                     str(e),
                     type(e).__name__,
@@ -110,42 +196,137 @@ async def post_outputs(api_url: str, api_token: str, outputs: dict[str, t.Any])
 
             except Exception as e:
                 elapsed = time.perf_counter() - start_time
+                error = f"{type(e).__name__}: {e}"
                 logger.exception(
                     "Unexpected exception on attempt %d/%d after %.2fs: %s [%s]",
                     attempt,
-                    MAX_RETRIES,
+                    policy.max_attempts,
                     elapsed,
                     str(e),
                     type(e).__name__,
                 )
 
-            if attempt < MAX_RETRIES:
-                logger.info("Retrying after %ds...", RETRY_DELAY)
-                await asyncio.sleep(RETRY_DELAY)
+            if attempt == policy.max_attempts:
+                break
+            delay = policy.backoff(attempt, retry_after)
+            if policy.deadline is not None:
+                remaining = policy.deadline - (time.monotonic() - started)
+                if delay >= remaining:
+                    logger.error(
+                        "Next retry in %.2fs would pass the %.0fs deadline, giving up",
+                        delay,
+                        policy.deadline,
+                    )
+                    return PostOutputsResult(
+                        ok=False, attempts=attempt, status_code=status_code, error=error
+                    )
+            logger.info("Retrying after %.2fs...", delay)
+            await asyncio.sleep(delay)
 
-        # Final failure
-        logger.critical("Failed to post outputs after %d attempts", MAX_RETRIES)
-        sys.exit(1)
+    logger.critical("Failed to post outputs after %d attempts", policy.max_attempts)
+    return PostOutputsResult(
+        ok=False, attempts=policy.max_attempts, status_code=status_code, error=error
+    )
 
 
-async def update_app_outputs(  # noqa: C901
+async def update_app_outputs(
     helm_outputs: dict[str, t.Any],
     app_output_processor_type: str | None = None,
     apolo_app_outputs_endpoint: str | None = None,
     apolo_apps_token: str | None = None,
     apolo_app_type: str | None = None,
     app_package_name: str | None = None,
-) -> None:
+    retry_policy: RetryPolicy | None = None,
+    app_instance_id: str | None = None,
+) -> PostOutputsResult:
     app_type = apolo_app_type or helm_outputs["PLATFORM_APPS_APP_TYPE"]
     apolo_app_outputs_endpoint = (
         apolo_app_outputs_endpoint or helm_outputs["PLATFORM_APPS_URL"]
     )
     platform_apps_token = apolo_apps_token or helm_outputs["PLATFORM_APPS_TOKEN"]
-    app_instance_id = os.getenv("K8S_INSTANCE_ID", None)
+    app_instance_id = app_instance_id or os.getenv("K8S_INSTANCE_ID", None)
     if app_instance_id is None:
-        err = "K8S_INSTANCE_ID environment variable is not set."
+        err = "app_instance_id is not given and K8S_INSTANCE_ID is not set."
         raise ValueError(err)
 
+    # All service/ingress lookups for this instance share one listing per kind
+    with use_instance_snapshot(InstanceResourceSnapshot(app_instance_id)):
+        conv_outputs = await generate_app_outputs(
+            helm_outputs,
+            app_type=app_type,
+            app_instance_id=app_instance_id,
+            app_output_processor_type=app_output_processor_type,
+            app_package_name=app_package_name,
+        )
+
+    logger.info("Outputs: %s", conv_outputs)
+
+    return await post_outputs(
+        apolo_app_outputs_endpoint,
+        platform_apps_token,
+        conv_outputs,
+        policy=retry_policy,
+    )
+
+
+async def update_apps_outputs(
+    instances: Mapping[str, dict[str, t.Any]],
+    max_concurrency: int = DEFAULT_POST_CONCURRENCY,
+    retry_policy: RetryPolicy | None = None,
+) -> dict[str, PostOutputsResult]:
+    """
+    Generate and post the outputs of many app instances of one namespace.
+
+    ``instances`` maps instance ids to their helm values, which carry the app
+    type, outputs endpoint and token just as for update_app_outputs. Services
+    and ingresses of all instances are listed once, outputs are generated
+    concurrently and posted at most ``max_concurrency`` at a time. An instance
+    whose outputs can't be generated gets a failed result with no attempts
+    and does not stop the others.
+    """
+    if max_concurrency < 1:
+        msg = f"max_concurrency must be positive, got {max_concurrency}"
+        raise ValueError(msg)
+    namespace_snapshot = NamespaceResourceSnapshot(instances)
+    await namespace_snapshot.prefetch()
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _update(
+        instance_id: str, helm_outputs: dict[str, t.Any]
+    ) -> PostOutputsResult:
+        try:
+            api_url = helm_outputs["PLATFORM_APPS_URL"]
+            api_token = helm_outputs["PLATFORM_APPS_TOKEN"]
+            # each task runs in its own context, so snapshots don't leak across
+            with use_instance_snapshot(namespace_snapshot.for_instance(instance_id)):
+                conv_outputs = await generate_app_outputs(
+                    helm_outputs,
+                    app_type=helm_outputs["PLATFORM_APPS_APP_TYPE"],
+                    app_instance_id=instance_id,
+                )
+        except Exception as e:
+            logger.exception("Failed to generate outputs for %s", instance_id)
+            return PostOutputsResult(
+                ok=False, attempts=0, error=f"{type(e).__name__}: {e}"
+            )
+        async with semaphore:
+            return await post_outputs(
+                api_url, api_token, conv_outputs, policy=retry_policy
+            )
+
+    results = await asyncio.gather(
+        *(_update(instance_id, values) for instance_id, values in instances.items())
+    )
+    return dict(zip(instances, results, strict=True))
+
+
+async def generate_app_outputs(
+    helm_outputs: dict[str, t.Any],
+    app_type: str,
+    app_instance_id: str,
+    app_output_processor_type: str | None = None,
+    app_package_name: str | None = None,
+) -> dict[str, t.Any]:
     if not app_package_name:
         app_package_name = f"{APOLO_APP_PACKAGE_PREFIX}{app_type.replace('-', '_')}"
     # Try loading application postprocessor defined in the app repo
@@ -168,67 +349,10 @@ async def update_app_outputs(  # noqa: C901
         logger.warning(err_msg)
 
     if not conv_outputs:
-        match app_type:
-            case (
-                AppType.LLMInference
-                | AppType.Llama4
-                | AppType.Mistral
-                | AppType.GptOss
-                | AppType.DeepSeek
-            ):
-                conv_outputs = await get_llm_inference_outputs(
-                    helm_outputs, app_instance_id
-                )
-            case AppType.StableDiffusion:
-                conv_outputs = await get_stable_diffusion_outputs(
-                    helm_outputs, app_instance_id
-                )
-            case AppType.Weaviate:
-                conv_outputs = await get_weaviate_outputs(helm_outputs, app_instance_id)
-            case AppType.DockerHub:
-                conv_outputs = await get_dockerhub_outputs(
-                    helm_outputs, app_instance_id
-                )
-            case AppType.CustomDeployment:
-                conv_outputs = await get_custom_deployment_outputs(
-                    helm_outputs, app_instance_id
-                )
-            case AppType.SparkJob:
-                conv_outputs = await get_spark_job_outputs(
-                    helm_outputs, app_instance_id
-                )
-            case AppType.TextEmbeddingsInference:
-                conv_outputs = await get_tei_outputs(helm_outputs, app_instance_id)
-            case AppType.Fooocus:
-                conv_outputs = await get_fooocus_outputs(helm_outputs, app_instance_id)
-            case AppType.MLFlow:
-                conv_outputs = await get_mlflow_outputs(helm_outputs, app_instance_id)
-            case AppType.Jupyter:
-                conv_outputs = await get_jupyter_outputs(helm_outputs, app_instance_id)
-            case AppType.VSCode:
-                conv_outputs = await get_vscode_outputs(helm_outputs, app_instance_id)
-            case AppType.PrivateGPT:
-                conv_outputs = await get_privategpt_outputs(
-                    helm_outputs, app_instance_id
-                )
-            case AppType.Shell:
-                conv_outputs = await get_shell_outputs(helm_outputs, app_instance_id)
-            case AppType.Superset:
-                conv_outputs = await get_superset_outputs(helm_outputs, app_instance_id)
-            case AppType.LightRAG:
-                conv_outputs = await get_lightrag_outputs(helm_outputs, app_instance_id)
-            case AppType.OpenWebUI:
-                conv_outputs = await get_openwebui_outputs(
-                    helm_outputs, app_instance_id
-                )
-            case _:
-                err_msg = f"Unsupported app type: {app_type} for posting outputs"
-                raise ValueError(err_msg)
+        generator = get_outputs_generator(app_type)
+        if generator is None:
+            err_msg = f"Unsupported app type: {app_type} for posting outputs"
+            raise ValueError(err_msg)
+        conv_outputs = await generator(helm_outputs, app_instance_id)
 
-    logger.info("Outputs: %s", conv_outputs)
-
-    await post_outputs(
-        apolo_app_outputs_endpoint,
-        platform_apps_token,
-        conv_outputs,
-    )
+    return conv_outputs
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import contextvars
 import logging
+from collections.abc import AsyncIterator
 
 import apolo_sdk
 
@@ -16,12 +19,70 @@ DEFAULT_MAX_ATTEMPTS = 5
 DEFAULT_BASE_DELAY_SECONDS = 2
 
 
+class _SecretsSession:
+    """Lazily opened apolo_sdk client shared by secret operations."""
+
+    def __init__(self, client: apolo_sdk.Client | None = None) -> None:
+        self._client = client
+        self._stack = contextlib.AsyncExitStack()
+        self._lock = asyncio.Lock()
+
+    async def get_client(self) -> apolo_sdk.Client:
+        if self._client is None:
+            async with self._lock:
+                if self._client is None:
+                    self._client = await self._stack.enter_async_context(
+                        apolo_sdk.get()
+                    )
+        return self._client
+
+    async def aclose(self) -> None:
+        await self._stack.aclose()
+
+
+_active_session: contextvars.ContextVar[_SecretsSession | None] = (
+    contextvars.ContextVar("apolo_secrets_session", default=None)
+)
+
+
+@contextlib.asynccontextmanager
+async def apolo_secrets_session(
+    client: apolo_sdk.Client | None = None,
+) -> AsyncIterator[None]:
+    """
+    Share one apolo_sdk client between all secret helpers called in the block.
+
+    Without a client, one is opened via apolo_sdk.get() on first use and closed
+    on exit. Nested sessions reuse the outer one.
+    """
+    if client is None and _active_session.get() is not None:
+        yield
+        return
+    session = _SecretsSession(client)
+    token = _active_session.set(session)
+    try:
+        yield
+    finally:
+        _active_session.reset(token)
+        await session.aclose()
+
+
+@contextlib.asynccontextmanager
+async def _secrets_client() -> AsyncIterator[apolo_sdk.Client]:
+    session = _active_session.get()
+    if session is not None:
+        yield await session.get_client()
+        return
+    async with apolo_sdk.get() as client:
+        yield client
+
+
 async def create_apolo_secret(
     app_instance_id: str, key: str, value: str
 ) -> ApoloSecret:
     secret_key = SECRET_KEY_TEMPLATE.format(key=key, app_instance_id=app_instance_id)
     try:
-        async with apolo_sdk.get() as client:
+        async with _secrets_client() as client:
             bytes_value = value.encode("utf-8")
             await client.secrets.add(key=secret_key, value=bytes_value)
     except Exception:
@@ -74,12 +135,35 @@ async def create_apolo_secret_with_retry(
             await asyncio.sleep(delay)
 
 
+async def create_apolo_secrets(
+    app_instance_id: str,
+    values: dict[str, str],
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    base_delay_seconds: float = DEFAULT_BASE_DELAY_SECONDS,
+) -> dict[str, ApoloSecret]:
+    """Create several secrets concurrently over one client, retrying each."""
+    async with apolo_secrets_session():
+        secrets = await asyncio.gather(
+            *(
+                create_apolo_secret_with_retry(
+                    app_instance_id=app_instance_id,
+                    key=key,
+                    value=value,
+                    max_attempts=max_attempts,
+                    base_delay_seconds=base_delay_seconds,
+                )
+                for key, value in values.items()
+            )
+        )
+    return dict(zip(values, secrets, strict=True))
+
+
 async def delete_apolo_secret(
     app_instance_id: str, key: str, *, raise_not_found: bool = False
 ) -> None:
     secret_key = SECRET_KEY_TEMPLATE.format(key=key, app_instance_id=app_instance_id)
     try:
-        async with apolo_sdk.get() as client:
+        async with _secrets_client() as client:
             await client.secrets.rm(key=secret_key)
     except apolo_sdk.ResourceNotFound:
         logger.info("Secret not found")
@@ -93,7 +177,7 @@ async def delete_apolo_secret(
 async def get_apolo_secret(app_instance_id: str, key: str) -> str:
     secret_key = SECRET_KEY_TEMPLATE.format(key=key, app_instance_id=app_instance_id)
     try:
-        async with apolo_sdk.get() as client:
+        async with _secrets_client() as client:
             return (await client.secrets.get(key=secret_key)).decode()
     except Exception:
         logger.exception("Failed to get Apolo Secret")
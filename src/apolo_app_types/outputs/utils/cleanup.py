@@ -1,4 +1,6 @@
+import asyncio
 import logging
+from dataclasses import dataclass, field
 
 import apolo_sdk
 from tenacity import (
@@ -14,6 +16,18 @@ from apolo_app_types.protocols.common import ApoloSecret, AppOutputs
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_CLEANUP_CONCURRENCY = 8
+
+
+@dataclass
+class SecretCleanupSummary:
+    deleted: list[str] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
+
 
 @retry(
     stop=stop_after_attempt(5),
@@ -44,9 +58,44 @@ async def get_app_outputs(
     return None
 
 
+async def delete_secrets(
+    secret_keys: list[str],
+    client: apolo_sdk.Client,
+    max_concurrency: int = DEFAULT_CLEANUP_CONCURRENCY,
+) -> SecretCleanupSummary:
+    """
+    Delete secrets concurrently, at most max_concurrency at a time.
+    Every secret keeps its own retry schedule, so one slow or failing secret
+    does not hold back the others.
+    """
+    if max_concurrency < 1:
+        msg = f"max_concurrency must be positive, got {max_concurrency}"
+        raise ValueError(msg)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    summary = SecretCleanupSummary()
+
+    async def _delete(secret_key: str) -> None:
+        async with semaphore:
+            try:
+                await delete_secret_with_retry(secret_key=secret_key, client=client)
+            except Exception as e:
+                logger.error(
+                    'Failed to delete secret "%s" after all retries: %s', secret_key, e
+                )
+                summary.failed[secret_key] = str(e)
+            else:
+                summary.deleted.append(secret_key)
+
+    await asyncio.gather(*(_delete(key) for key in dict.fromkeys(secret_keys)))
+    return summary
+
+
 async def cleanup_secrets(
-    app_id: str, output_class: type[AppOutputs], client: apolo_sdk.Client
-) -> None:
+    app_id: str,
+    output_class: type[AppOutputs],
+    client: apolo_sdk.Client,
+    max_concurrency: int = DEFAULT_CLEANUP_CONCURRENCY,
+) -> SecretCleanupSummary:
     app_outputs = None
     try:
         app_outputs = await get_app_outputs(
@@ -56,14 +105,16 @@ async def cleanup_secrets(
         pass
     if not app_outputs:
         logger.info("No app outputs retrieved")
-        return
+        return SecretCleanupSummary()
 
     secrets = find_instances_recursive_simple(obj=app_outputs, target_type=ApoloSecret)
 
-    for secret in secrets:
-        try:
-            await delete_secret_with_retry(secret_key=secret.key, client=client)
-        except Exception as e:
-            logger.error(
-                'Failed to delete secret "%s" after all retries: %s', secret.key, e
-            )
+    summary = await delete_secrets(
+        [secret.key for secret in secrets], client, max_concurrency=max_concurrency
+    )
+    logger.info(
+        "Secret cleanup finished: %d deleted, %d failed",
+        len(summary.deleted),
+        len(summary.failed),
+    )
+    return summary
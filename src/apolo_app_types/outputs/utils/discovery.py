@@ -1,7 +1,9 @@
+import functools
 import importlib
+import importlib.util
 import inspect
 import logging
-import pkgutil
+import types
 import typing as t
 
 from apolo_app_types import AppInputs, AppOutputs
@@ -13,50 +15,91 @@ logger = logging.getLogger(__name__)
 APOLO_APP_PACKAGE_PREFIX = "apolo_apps_"
 
 
+@functools.cache
+def _import_app_package(package_name: str | None) -> types.ModuleType | None:
+    """Resolve an app package by name without scanning sys.path."""
+    if not package_name:
+        return None
+    try:
+        spec = importlib.util.find_spec(package_name)
+    except (ImportError, ValueError):
+        spec = None
+    if spec is None:
+        return None
+    try:
+        return importlib.import_module(package_name)
+    except (ImportError, AttributeError) as e:
+        msg = f"Failed to import {package_name}: {e}"
+        logger.warning(msg)
+        return None
+
+
+@functools.cache
+def _get_package_classes(package_name: str) -> tuple[tuple[str, type[t.Any]], ...]:
+    module = _import_app_package(package_name)
+    if module is None:
+        return ()
+    return tuple(inspect.getmembers(module, inspect.isclass))
+
+
+_ComponentKey = tuple[str, type[t.Any], str | None]
+_resolved_components: dict[_ComponentKey, tuple[type[t.Any], ...]] = {}
+
+
+def _resolve_components(
+    package_name: str,
+    component_base_type: type[t.Any],
+    exact_type_name: str | None,
+) -> tuple[type[t.Any], ...]:
+    key = (package_name, component_base_type, exact_type_name)
+    if key not in _resolved_components:
+        _resolved_components[key] = tuple(
+            obj
+            for name, obj in _get_package_classes(package_name)
+            if issubclass(obj, component_base_type)
+            and obj is not component_base_type
+            and (not exact_type_name or name == exact_type_name)
+        )
+    return _resolved_components[key]
+
+
+def clear_component_cache() -> None:
+    """Forget resolved packages and components, e.g. after installing a plugin."""
+    _import_app_package.cache_clear()
+    _get_package_classes.cache_clear()
+    _resolved_components.clear()
+
+
 def load_app_component(
     app_type: str,
-    package_name: str,
+    package_name: str | None,
     component_base_type: type[t.Any],
     exact_type_name: str | None = None,
 ) -> type[t.Any] | None:
-    discovered_plugins = {}
-    for _finder, name, _ispkg in pkgutil.iter_modules():
-        if name == package_name:
-            try:
-                candidate = importlib.import_module(name)
-                discovered_plugins[app_type] = candidate
-            except (ImportError, AttributeError) as e:
-                msg = f"Failed to import {name}: {e}"
-                logger.warning(msg)
-    module = discovered_plugins.get(app_type)
-
+    if not package_name:
+        return None
+    module = _import_app_package(package_name)
     if not module:
         return None
     msg = f"Found {module} at {module.__file__} for {app_type}"
     logging.info(msg)
 
-    results = []
-    for name, obj in inspect.getmembers(module, inspect.isclass):
-        if (
-            issubclass(obj, component_base_type)
-            and obj is not component_base_type
-            and (not exact_type_name or name == exact_type_name)
-        ):
-            msg = f"Found {obj} for {app_type}"
-            logging.info(msg)
-            results.append(obj)
+    results = _resolve_components(package_name, component_base_type, exact_type_name)
+    for obj in results:
+        msg = f"Found {obj} for {app_type}"
+        logging.info(msg)
 
     if not results:
         return None
     if len(results) > 1:
-        msg = f"Multiple components found for {app_type}: {results}"
+        msg = f"Multiple components found for {app_type}: {list(results)}"
         raise ValueError(msg)
     return results[0]
 
 
 def load_app_postprocessor(
     app_type: str,
-    package_name: str,
+    package_name: str | None,
     exact_type_name: str | None = None,
 ) -> type[BaseAppOutputsProcessor] | None:  # type: ignore
     return load_app_component(
@@ -66,7 +109,7 @@ def load_app_postprocessor(
 
 def load_app_preprocessor(
     app_type: str,
-    package_name: str,
+    package_name: str | None,
     exact_type_name: str | None = None,
 ) -> type[BaseChartValueProcessor] | None:  # type: ignore
     return load_app_component(
@@ -76,7 +119,7 @@ def load_app_preprocessor(
 
 def load_app_inputs(
     app_type: str,
-    package_name: str,
+    package_name: str | None,
     exact_type_name: str | None = None,
 ) -> type[AppInputs] | None:
     return load_app_component(app_type, package_name, AppInputs, exact_type_name)
@@ -84,7 +127,7 @@ def load_app_inputs(
 
 def load_app_outputs(
     app_type: str,
-    package_name: str,
+    package_name: str | None,
     exact_type_name: str | None = None,
 ) -> type[AppOutputs] | None:
     return load_app_component(app_type, package_name, AppOutputs, exact_type_name)
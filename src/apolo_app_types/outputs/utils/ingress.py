@@ -2,6 +2,7 @@ import logging
 import typing
 
 from apolo_app_types.clients.kube import get_ingresses_as_dict
+from apolo_app_types.clients.snapshot import get_active_snapshot
 
 
 logger = logging.getLogger(__name__)
@@ -11,7 +12,11 @@ async def get_ingresses(
     match_labels: dict[str, str],
 ) -> dict[str, list[dict[str, typing.Any]]] | None:
     label_selectors = ",".join(f"{k}={v}" for k, v in match_labels.items())
-    get_ing_stdout = await get_ingresses_as_dict(label_selectors)
+    snapshot = get_active_snapshot(match_labels)
+    if snapshot is not None:
+        get_ing_stdout = {"items": await snapshot.find_ingresses(match_labels)}
+    else:
+        get_ing_stdout = await get_ingresses_as_dict(label_selectors)
     if not get_ing_stdout["items"]:
         return None
     if len(get_ing_stdout["items"]) > 1:
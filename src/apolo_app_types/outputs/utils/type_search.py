@@ -1,3 +1,5 @@
+import types
+import typing as t
 from typing import Any, TypeVar
 
 from pydantic import BaseModel
@@ -5,6 +7,66 @@ from pydantic import BaseModel
 
 T = TypeVar("T")
 
+# (model class, target type) -> names of the fields whose annotation can hold
+# an instance of the target type, in declaration order.
+_field_locators: dict[tuple[type[BaseModel], type[Any]], tuple[str, ...]] = {}
+
+
+def _annotation_may_hold(annotation: Any, target_type: type[Any]) -> bool:  # noqa: C901
+    """
+    Tell whether a value validated against ``annotation`` can be, or contain,
+    an instance of ``target_type``.
+
+    The answer errs on the side of True: anything that is not a plain class,
+    a ``Literal`` or a container of those (``Any``, forward references,
+    type variables, ...) is assumed to possibly hold the target. Model-typed
+    annotations always return True, because the value may be a subclass with
+    extra fields; such values are narrowed by their own runtime class instead.
+    """
+    if annotation is Any or annotation is object or isinstance(annotation, TypeVar):
+        return True
+    origin = t.get_origin(annotation)
+    if origin is t.Literal:
+        return any(isinstance(arg, target_type) for arg in t.get_args(annotation))
+    if origin is t.Annotated:
+        return _annotation_may_hold(t.get_args(annotation)[0], target_type)
+    if origin is not None:
+        if isinstance(origin, type) and (
+            issubclass(origin, BaseModel)
+            or issubclass(origin, target_type)
+            or issubclass(target_type, origin)
+        ):
+            return True
+        args = [arg for arg in t.get_args(annotation) if arg is not Ellipsis]
+        if not args:
+            return True
+        return any(_annotation_may_hold(arg, target_type) for arg in args)
+    if annotation is None or annotation is types.NoneType:
+        return issubclass(types.NoneType, target_type)
+    if isinstance(annotation, type):
+        return (
+            issubclass(annotation, BaseModel)
+            or issubclass(annotation, target_type)
+            or issubclass(target_type, annotation)
+        )
+    return True
+
+
+def _get_field_locator(
+    model_cls: type[BaseModel], target_type: type[Any]
+) -> tuple[str, ...]:
+    """Return the fields of ``model_cls`` worth searching for ``target_type``."""
+    key = (model_cls, target_type)
+    locator = _field_locators.get(key)
+    if locator is None:
+        locator = tuple(
+            name
+            for name, field in model_cls.model_fields.items()
+            if _annotation_may_hold(field.annotation, target_type)
+        )
+        _field_locators[key] = locator
+    return locator
+
 
 def find_instances_recursive(  # noqa: C901
     obj: Any, target_type: type[T], visited: set[Any] | None = None, _path: str = ""
@@ -39,9 +101,18 @@ def find_instances_recursive(  # noqa: C901
     if isinstance(obj, target_type):
         results.append((_path or "root", obj))
 
-    # If it's a Pydantic model, iterate through its fields
+    # If it's a Pydantic model, iterate through the fields that can hold the
+    # target type; fields typed as scalars, enums, literals, ... are skipped.
     if isinstance(obj, BaseModel):
-        for field_name, field_value in obj:
+        values = obj.__dict__
+        fields: list[tuple[str, Any]] = [
+            (name, values[name])
+            for name in _get_field_locator(type(obj), target_type)
+            if name in values
+        ]
+        if obj.__pydantic_extra__:
+            fields.extend(obj.__pydantic_extra__.items())
+        for field_name, field_value in fields:
             field_path = f"{_path}.{field_name}" if _path else field_name
             results.extend(
                 find_instances_recursive(field_value, target_type, visited, field_path)
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import typing as t
 
@@ -47,19 +48,39 @@ async def _get_service_endpoints(
     return (http_host, http_port), (grpc_host, grpc_port)
 
 
+async def _get_external_host_port(
+    app_instance_id: str, *, ingress_enabled: bool
+) -> tuple[str, int] | None:
+    if not ingress_enabled:
+        return None
+    return await get_ingress_host_port(
+        match_labels={
+            "application": "weaviate",
+            INSTANCE_LABEL: app_instance_id,
+        }
+    )
+
+
 async def get_weaviate_outputs(
     helm_values: dict[str, t.Any], app_instance_id: str
 ) -> dict[str, t.Any]:
     release_name = "weaviate"
     cluster_api = helm_values.get("clusterApi", {})
+    ingress_config = helm_values.get("ingress", {})
 
-    try:
-        (http_host, http_port), (grpc_host, grpc_port) = await _get_service_endpoints(
-            release_name, app_instance_id
-        )
-    except Exception as e:
-        msg = f"Could not find Weaviate services: {e}"
-        raise Exception(msg) from e
+    service_endpoints, ingress_host_port = await asyncio.gather(
+        _get_service_endpoints(release_name, app_instance_id),
+        _get_external_host_port(
+            app_instance_id, ingress_enabled=bool(ingress_config.get("enabled"))
+        ),
+        return_exceptions=True,
+    )
+    if isinstance(service_endpoints, BaseException):
+        msg = f"Could not find Weaviate services: {service_endpoints}"
+        raise Exception(msg) from service_endpoints
+    if isinstance(ingress_host_port, BaseException):
+        raise ingress_host_port
+    (http_host, http_port), (grpc_host, grpc_port) = service_endpoints
 
     internal_http_host = http_host if http_host else ""
     graphql_internal = GraphQLAPI(
@@ -67,32 +88,23 @@ async def get_weaviate_outputs(
     )
     rest_internal = RestAPI(host=internal_http_host, base_path="/v1", protocol="http")
     grpc_internal = GrpcAPI(host=grpc_host, port=grpc_port, protocol="http")
-    ingress_config = helm_values.get("ingress", {})
     # grpc_external = None
     rest_external = None
     graphql_external = None
-    if ingress_config.get("enabled"):
-        ingress_host_port = await get_ingress_host_port(
-            match_labels={
-                "application": "weaviate",
-                INSTANCE_LABEL: app_instance_id,
-            }
+    if ingress_host_port:
+        base_external_host = ingress_host_port[0] if ingress_host_port[0] else ""
+        graphql_external = GraphQLAPI(
+            host=base_external_host,
+            base_path="/v1/graphql",
+            protocol="https",
+            port=ingress_host_port[1],
+        )
+        rest_external = RestAPI(
+            host=base_external_host,
+            base_path="/v1",
+            protocol="https",
+            port=ingress_host_port[1],
         )
-
-        if ingress_host_port:
-            base_external_host = ingress_host_port[0] if ingress_host_port[0] else ""
-            graphql_external = GraphQLAPI(
-                host=base_external_host,
-                base_path="/v1/graphql",
-                protocol="https",
-                port=ingress_host_port[1],
-            )
-            rest_external = RestAPI(
-                host=base_external_host,
-                base_path="/v1",
-                protocol="https",
-                port=ingress_host_port[1],
-            )
 
     auth = BasicAuth(
         username=cluster_api.get("username", ""),
@@ -1,23 +1,31 @@
 import contextlib
+import hashlib
 import importlib
-import inspect
 import json
 import logging
+import os
 import sys
+import types
 import typing as t
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 
-from apolo_app_types import AppInputs, AppOutputs
+from pydantic import BaseModel
+
+from apolo_app_types.schema_utils import app_schema_models
 
 
 logger = logging.getLogger(__name__)
 
 
-def dump_schema_type(
-    app_package_path: Path,
-    exact_type_name: str,
-    output_path: Path,
-) -> None:
+@dataclass
+class DumpSummary:
+    written: list[Path] = field(default_factory=list)
+    unchanged: list[Path] = field(default_factory=list)
+
+
+def _import_package(app_package_path: Path) -> types.ModuleType:
     if not app_package_path.exists():
         msg = f"Package path {app_package_path} does not exist"
         raise ValueError(msg)
@@ -35,21 +43,106 @@ def dump_schema_type(
             sys.path.remove(str(package_path.parent))
 
     with patch_path_maybe(app_package_path):
-        package = importlib.import_module(app_package_path.name)
-
-    cls = None
-    for cls_name, cls in inspect.getmembers(package, inspect.isclass):
-        if issubclass(cls, AppInputs | AppOutputs) and cls_name == exact_type_name:
-            msg = f"Found {cls_name} for {package}"
-            logger.info(msg)
-            break
-    if not cls:
+        return importlib.import_module(app_package_path.name)
+
+
+def _render_schema(cls: type[BaseModel]) -> str:
+    return json.dumps(cls.model_json_schema(), indent=2) + "\n"
+
+
+def _write_if_changed(output_path: Path, content: str) -> bool:
+    """Write ``content`` unless the file already holds it; True if written."""
+    new_hash = hashlib.sha256(content.encode()).hexdigest()
+    with contextlib.suppress(FileNotFoundError):
+        if hashlib.sha256(output_path.read_bytes()).hexdigest() == new_hash:
+            return False
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(content)
+    return True
+
+
+def dump_schema_type(
+    app_package_path: Path,
+    exact_type_name: str,
+    output_path: Path,
+) -> None:
+    package = _import_package(app_package_path)
+
+    cls = app_schema_models(package).get(exact_type_name)
+    if cls is None:
         msg = f"No {exact_type_name} found"
         logger.error(msg)
         raise ValueError(msg)
+    msg = f"Found {exact_type_name} for {package}"
+    logger.info(msg)
 
-    schema = cls.model_json_schema()
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(schema, indent=2) + "\n")
+    output_path.write_text(_render_schema(cls))
     msg = f"Wrote schema to {output_path}"
     logger.info(msg)
+
+
+# Package the pool workers render schemas from, imported once per worker
+_worker_models: dict[str, type[BaseModel]] = {}
+
+
+def _init_worker(app_package_path: Path) -> None:
+    _worker_models.update(app_schema_models(_import_package(app_package_path)))
+
+
+def _render_worker_schema(type_name: str) -> str:
+    return _render_schema(_worker_models[type_name])
+
+
+def dump_schema_types(
+    app_package_path: Path,
+    output_dir: Path,
+    *,
+    jobs: int | None = None,
+) -> DumpSummary:
+    """
+    Dump the schema of every AppInputs/AppOutputs type of an app package.
+
+    The package is imported once per process; schemas are generated by a
+    pool of ``jobs`` worker processes (one per CPU by default, in-process
+    for ``jobs=1``) and written to ``output_dir/<TypeName>.json``. Files
+    whose content hash already matches the new schema are left untouched.
+    """
+    models = app_schema_models(_import_package(app_package_path))
+    if not models:
+        msg = f"No app input/output types found in {app_package_path}"
+        raise ValueError(msg)
+    names = sorted(models)
+    jobs = min(jobs or os.cpu_count() or 1, len(names))
+
+    if jobs == 1:
+        contents: t.Iterable[str] = (_render_schema(models[name]) for name in names)
+        summary = _write_schemas(output_dir, names, contents)
+    else:
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_worker,
+            initargs=(app_package_path,),
+        ) as pool:
+            contents = pool.map(_render_worker_schema, names)
+            summary = _write_schemas(output_dir, names, contents)
+
+    msg = (
+        f"Wrote {len(summary.written)} schemas to {output_dir}, "
+        f"{len(summary.unchanged)} unchanged"
+    )
+    logger.info(msg)
+    return summary
+
+
+def _write_schemas(
+    output_dir: Path, names: list[str], contents: t.Iterable[str]
+) -> DumpSummary:
+    summary = DumpSummary()
+    for name, content in zip(names, contents, strict=True):
+        output_path = output_dir / f"{name}.json"
+        if _write_if_changed(output_path, content):
+            summary.written.append(output_path)
+        else:
+            summary.unchanged.append(output_path)
+    return summary
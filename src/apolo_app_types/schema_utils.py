@@ -1,8 +1,31 @@
+import copy
+import functools
+import hashlib
+import importlib.metadata
+import inspect
+import json
+import logging
+import os
+import types
+import weakref
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
 from typing import Any
 
 import jsonref
+import pydantic
 from pydantic import BaseModel
 
+import apolo_app_types
+from apolo_app_types.protocols.common.base import AppInputs, AppOutputs
+
+
+logger = logging.getLogger(__name__)
+
+# Directory for the on-disk inline schema cache; unset keeps it in memory only
+SCHEMA_CACHE_DIR_ENV = "APOLO_APP_TYPES_SCHEMA_CACHE_DIR"
+
 
 def _is_top_level_schema(schema: dict[str, Any]) -> bool:
     return (
@@ -13,12 +36,46 @@ def _is_top_level_schema(schema: dict[str, Any]) -> bool:
     )
 
 
+def _own(value: Any, owned: dict[int, Any]) -> Any:
+    """Return ``value`` if the transform created it, else a shallow copy of it."""
+    if id(value) in owned:
+        return value
+    copied = dict(value) if isinstance(value, dict) else list(value)
+    owned[id(copied)] = copied
+    return copied
+
+
+def _is_inert(node: dict[str, Any]) -> bool:
+    """True for leaf schemas without a default, which no defaults can change."""
+    if "default" in node:
+        return False
+    for value in node.values():
+        if isinstance(value, dict | list):
+            return False
+    return True
+
+
+_FINISH = object()
+
+# Deeper schemas are taken for a reference cycle, e.g. from a recursive model
+MAX_SCHEMA_DEPTH = 10_000
+
+
 def _replace_downstream_defaults(  # noqa: C901
     schema: dict[str, Any], defaults: dict[str, Any] | None = None
 ) -> dict[str, Any]:
     """
-    Recursively replace default values in a JSON schema with those from
-      a defaults dictionary.
+    Replace default values in a JSON schema with those from a defaults
+      dictionary, pushing object defaults down to their properties.
+
+    The schema is walked depth-first with an explicit worklist, so deeply
+    nested schemas can't hit the recursion limit. The input is never
+    modified: every node the walk changes or descends into is shallow-copied
+    once, while leaves it leaves alone stay shared with the input. Nodes
+    that jsonref shares between several places therefore get their defaults
+    per place rather than from whichever place was visited last. Defaults
+    consumed by a property are removed from the defaults they came from, so
+    a default reaches at most one schema.
 
     Args:
         schema (dict): The original JSON schema.
@@ -31,50 +88,282 @@ def _replace_downstream_defaults(  # noqa: C901
     if not isinstance(schema, dict):
         return schema
 
-    if defaults is None:
-        defaults = {}
-        if schema.get("type") == "object" and "default" in schema:
-            defaults = schema["default"]
-
-    if _is_top_level_schema(schema):
-        value_dict = schema["properties"]
-        for prop, prop_schema in value_dict.items():
-            new_defaults = None
-            if prop in defaults:
-                new_defaults = defaults[prop]
-                del defaults[prop]
-                if prop_schema.get("type") not in ["array", "object"]:
-                    prop_schema["default"] = new_defaults
-            _replace_downstream_defaults(prop_schema, new_defaults)
-    else:
-        for _, value in schema.items():
-            if isinstance(value, dict):
-                _replace_downstream_defaults(value, defaults)
-            elif isinstance(value, list):
-                for item in value:
-                    new_default = defaults
-                    if (
-                        "default" in schema
-                        and isinstance(schema["default"], dict)
-                        and schema["default"].get("__type__", "")
-                        == item.get("title", "")
-                    ):
-                        new_default = schema["default"]
-                    _replace_downstream_defaults(item, new_default)
-
-    if (
-        isinstance(schema.get("default"), dict)
-        and schema.get("type") == "object"
-        and schema["default"] == {}
-    ):
-        del schema["default"]
-    return schema
+    owned: dict[int, Any] = {}
+    result = _own(schema, owned)
+    worklist: list[tuple[dict[str, Any], Any, int]] = [(result, defaults, 0)]
+    while worklist:
+        node, node_defaults, depth = worklist.pop()
+        if node_defaults is _FINISH:
+            # after the subtree, which may have consumed this default
+            if (
+                isinstance(node.get("default"), dict)
+                and node.get("type") == "object"
+                and node["default"] == {}
+            ):
+                del node["default"]
+            continue
+        if depth > MAX_SCHEMA_DEPTH:
+            msg = (
+                f"Schema is nested deeper than {MAX_SCHEMA_DEPTH} levels, "
+                "it likely has a reference cycle"
+            )
+            raise ValueError(msg)
 
+        default = node.get("default")
+        if isinstance(default, dict):
+            default = node["default"] = _own(default, owned)
+            worklist.append((node, _FINISH, depth))
+        if node_defaults is None:
+            node_defaults = {}
+            if node.get("type") == "object" and "default" in node:
+                node_defaults = node["default"]
 
-def get_inline_schema(model: type[BaseModel]) -> dict[str, Any]:
+        children: list[tuple[dict[str, Any], Any, int]] = []
+        depth += 1
+        if _is_top_level_schema(node):
+            properties = node["properties"] = _own(node["properties"], owned)
+            for prop, prop_schema in properties.items():
+                new_defaults = None
+                if prop in node_defaults:
+                    if isinstance(prop_schema, dict):
+                        prop_schema = properties[prop] = _own(prop_schema, owned)
+                    new_defaults = node_defaults[prop]
+                    if isinstance(new_defaults, dict):
+                        new_defaults = _own(new_defaults, owned)
+                    del node_defaults[prop]
+                    if prop_schema.get("type") not in ["array", "object"]:
+                        prop_schema["default"] = new_defaults
+                elif not isinstance(prop_schema, dict) or _is_inert(prop_schema):
+                    continue
+                else:
+                    prop_schema = properties[prop] = _own(prop_schema, owned)
+                if isinstance(prop_schema, dict):
+                    children.append((prop_schema, new_defaults, depth))
+        else:
+            for key, value in node.items():
+                if isinstance(value, dict):
+                    if not _is_inert(value):
+                        child = node[key] = _own(value, owned)
+                        children.append((child, node_defaults, depth))
+                elif isinstance(value, list):
+                    items = value
+                    for index, item in enumerate(value):
+                        new_default = node_defaults
+                        if isinstance(default, dict) and default.get(
+                            "__type__", ""
+                        ) == item.get("title", ""):
+                            new_default = default
+                        if isinstance(item, dict) and not _is_inert(item):
+                            if items is value:
+                                items = node[key] = _own(value, owned)
+                            child = items[index] = _own(item, owned)
+                            children.append((child, new_default, depth))
+        # children are taken off the worklist in document order
+        children.reverse()
+        worklist.extend(children)
+    return result
+
+
+def build_inline_schema(model: type[BaseModel]) -> dict[str, Any]:
+    """Build the inline schema of a model, bypassing the cache."""
     schema = model.model_json_schema()
     new_schema = jsonref.replace_refs(schema, merge_props=True, proxies=False)
     new_schema = _replace_downstream_defaults(new_schema)
     if "$defs" in new_schema:
         del new_schema["$defs"]
     return new_schema
+
+
+def schema_content_hash(schema: dict[str, Any]) -> str:
+    return hashlib.sha256(
+        json.dumps(schema, sort_keys=True, separators=(",", ":")).encode()
+    ).hexdigest()
+
+
+@dataclass(frozen=True)
+class _CachedSchema:
+    schema: dict[str, Any]
+    content_hash: str
+
+
+@functools.cache
+def _packages_distributions() -> dict[str, list[str]]:
+    return dict(importlib.metadata.packages_distributions())
+
+
+@functools.cache
+def _package_distribution(
+    top_level_module: str,
+) -> importlib.metadata.Distribution | None:
+    # editable installs aren't listed; fall back to the conventional name
+    distributions = _packages_distributions().get(top_level_module) or [
+        top_level_module.replace("_", "-")
+    ]
+    for distribution in distributions:
+        try:
+            return importlib.metadata.distribution(distribution)
+        except importlib.metadata.PackageNotFoundError:
+            continue
+    return None
+
+
+@functools.cache
+def _is_editable(top_level_module: str) -> bool:
+    """Whether the package is installed in editable (development) mode."""
+    distribution = _package_distribution(top_level_module)
+    if distribution is None:
+        return False
+    try:
+        direct_url = json.loads(distribution.read_text("direct_url.json") or "{}")
+    except ValueError:
+        return False
+    dir_info = direct_url.get("dir_info") if isinstance(direct_url, dict) else None
+    return isinstance(dir_info, dict) and dir_info.get("editable") is True
+
+
+def _schema_cache_key(model: type[BaseModel]) -> str | None:
+    """Disk cache key of a model, or None if it can't be cached on disk.
+
+    Models defined in functions can't be told apart by name, and models from
+    packages without a version or installed in editable mode can change
+    without the key changing.
+    """
+    if "<locals>" in model.__qualname__:
+        return None
+    package = model.__module__.partition(".")[0]
+    distribution = _package_distribution(package)
+    if distribution is None or _is_editable(package):
+        return None
+    return (
+        f"{model.__module__}:{model.__qualname__}@{distribution.version};"
+        f"pydantic={pydantic.VERSION}"
+    )
+
+
+class InlineSchemaCache:
+    """
+    Inline schemas of models, built once per model class.
+
+    Entries are kept in memory for the life of the class and, if
+    ``cache_dir`` is set, on disk keyed by the model's qualified name, the
+    version of the package that defines it and the pydantic version; models
+    of editable installs are only cached in memory. Disk
+    entries carry the content hash of their schema and are rebuilt if it
+    doesn't match. Callers always get their own copy of a cached schema.
+    """
+
+    def __init__(self, cache_dir: str | Path | None = None) -> None:
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._entries: weakref.WeakKeyDictionary[type[BaseModel], _CachedSchema] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def get(self, model: type[BaseModel]) -> dict[str, Any]:
+        return copy.deepcopy(self._entry(model).schema)
+
+    def content_hash(self, model: type[BaseModel]) -> str:
+        return self._entry(model).content_hash
+
+    def warm(self, models: Iterable[type[BaseModel]]) -> dict[str, str]:
+        """Build the schemas of ``models``; return their content hashes by name."""
+        return {model.__name__: self.content_hash(model) for model in models}
+
+    def clear(self) -> None:
+        """Forget in-memory entries; files in ``cache_dir`` are kept."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _entry(self, model: type[BaseModel]) -> _CachedSchema:
+        entry = self._entries.get(model)
+        if entry is None:
+            path = self._path(model)
+            entry = self._load(path) if path else None
+            if entry is None:
+                schema = build_inline_schema(model)
+                entry = _CachedSchema(schema, schema_content_hash(schema))
+                if path:
+                    self._store(path, entry)
+            self._entries[model] = entry
+        return entry
+
+    def _path(self, model: type[BaseModel]) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        key = _schema_cache_key(model)
+        if key is None:
+            return None
+        digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+        return self.cache_dir / f"{model.__qualname__}-{digest}.json"
+
+    def _load(self, path: Path) -> _CachedSchema | None:
+        try:
+            data = json.loads(path.read_text())
+            entry = _CachedSchema(data["schema"], data["sha256"])
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("Ignoring unreadable schema cache file %s: %s", path, e)
+            return None
+        if schema_content_hash(entry.schema) != entry.content_hash:
+            logger.warning("Ignoring schema cache file %s: hash mismatch", path)
+            return None
+        return entry
+
+    def _store(self, path: Path, entry: _CachedSchema) -> None:
+        data = {"sha256": entry.content_hash, "schema": entry.schema}
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(data))
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.warning("Failed to write schema cache file %s: %s", path, e)
+
+
+_schema_cache = InlineSchemaCache(os.environ.get(SCHEMA_CACHE_DIR_ENV))
+
+
+def configure_inline_schema_cache(cache_dir: str | Path | None) -> InlineSchemaCache:
+    """Replace the process-wide schema cache, e.g. to enable the disk cache."""
+    global _schema_cache
+    _schema_cache = InlineSchemaCache(cache_dir)
+    return _schema_cache
+
+
+def get_inline_schema_cache() -> InlineSchemaCache:
+    return _schema_cache
+
+
+def get_inline_schema(model: type[BaseModel]) -> dict[str, Any]:
+    return _schema_cache.get(model)
+
+
+def get_inline_schema_hash(model: type[BaseModel]) -> str:
+    """Content hash of the inline schema of ``model``, e.g. for ETags."""
+    return _schema_cache.content_hash(model)
+
+
+def app_schema_models(package: types.ModuleType) -> dict[str, type[BaseModel]]:
+    """AppInputs and AppOutputs subclasses exported by an app package, by name."""
+    return {
+        name: cls
+        for name, cls in inspect.getmembers(package, inspect.isclass)
+        if issubclass(cls, AppInputs | AppOutputs)
+        and cls not in (AppInputs, AppOutputs)
+    }
+
+
+def warm_inline_schemas(
+    models: Iterable[type[BaseModel]] | None = None,
+) -> dict[str, str]:
+    """
+    Build inline schemas ahead of time, e.g. at service start.
+
+    Defaults to every app inputs and outputs type of apolo_app_types.
+    Returns the content hash of each schema by model name.
+    """
+    if models is None:
+        models = app_schema_models(apolo_app_types).values()
+    return _schema_cache.warm(models)
@@ -0,0 +1,452 @@
+"""Long-running server for app hooks.
+
+Every hook run through the CLI pays for a fresh interpreter: importing the
+protocol models, resolving the app package and logging in to the platform.
+``apolo-app-types serve`` pays these once and then answers run-preprocessor,
+update-outputs and cleanup requests over local HTTP or a Unix socket,
+reusing one open API client per set of credentials.
+
+Requests carry their own platform credentials; the server only fills in
+the API URL and org/cluster/project. If the server has a shared token,
+every route but /health requires ``Authorization: Bearer <token>``.
+
+Routes (JSON in, JSON out)::
+
+    POST /run-preprocessor  -> {"helm_args": [...], "helm_values": {...}}
+    POST /update-outputs    -> {"ok": ..., "attempts": ..., ...}
+    POST /cleanup           -> {"deleted": [...], "failed": {...}}
+    GET  /health            -> {"status": "ok"}
+"""
+
+import asyncio
+import collections
+import contextlib
+import dataclasses
+import hmac
+import logging
+import os
+import socket
+import time
+import typing as t
+from pathlib import Path
+
+import apolo_sdk
+from aiohttp import web
+from pydantic import BaseModel, ConfigDict, Field
+
+import apolo_app_types
+from apolo_app_types.clients.apolo_session import SessionParams, open_client
+from apolo_app_types.operations import (
+    _redact,
+    cleanup_app,
+    generate_helm_values,
+    load_outputs_class,
+    load_preprocessor,
+)
+from apolo_app_types.outputs.registry import (
+    get_outputs_generator,
+    registered_app_types,
+)
+from apolo_app_types.outputs.update_outputs import update_app_outputs
+from apolo_app_types.outputs.utils.cleanup import DEFAULT_CLEANUP_CONCURRENCY
+from apolo_app_types.outputs.utils.discovery import clear_component_cache
+from apolo_app_types.schema_utils import app_schema_models
+
+
+logger = logging.getLogger(__name__)
+
+
+class ApoloAuth(BaseModel):
+    """Platform credentials and the org/cluster/project to switch to."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    api_url: str | None = None
+    api_token: str | None = None
+    passed_config: str | None = None
+    org: str | None = None
+    cluster: str | None = None
+    project: str | None = None
+
+    def with_defaults(self, defaults: "ApoloAuth") -> "ApoloAuth":
+        """
+        Fill the API URL and targets not given in the request from defaults.
+
+        Credentials are never taken from the defaults, a request without
+        api_token or passed_config is rejected.
+        """
+        if not self.api_token and not self.passed_config:
+            msg = "auth.api_token or auth.passed_config is required"
+            raise ValueError(msg)
+        update = {
+            name: getattr(defaults, name)
+            for name in _DEFAULTED_FIELDS
+            if getattr(self, name) is None
+        }
+        return self.model_copy(update=update)
+
+
+_DEFAULTED_FIELDS = ("api_url", "org", "cluster", "project")
+
+
+class RunPreprocessorRequest(BaseModel):
+    app_type: str
+    app_id: str
+    app_name: str
+    namespace: str
+    inputs: dict[str, t.Any]
+    apps_secret_name: str
+    package_name: str = "apolo_app_types"
+    inputs_type: str | None = None
+    preprocessor_type: str | None = None
+    auth: ApoloAuth = Field(default_factory=ApoloAuth)
+
+
+class UpdateOutputsRequest(BaseModel):
+    helm_outputs: dict[str, t.Any]
+    app_instance_id: str
+    app_output_processor_type: str | None = None
+    app_outputs_endpoint: str | None = None
+    apps_token: str | None = None
+    app_type: str | None = None
+    package_name: str | None = None
+
+
+class CleanupRequest(BaseModel):
+    app_type: str
+    app_id: str
+    output_type: str | None = None
+    package_name: str = "apolo_app_types"
+    max_concurrency: int = Field(default=DEFAULT_CLEANUP_CONCURRENCY, ge=1)
+    auth: ApoloAuth = Field(default_factory=ApoloAuth)
+
+
+DEFAULT_CACHE_TTL = 300.0
+DEFAULT_POOL_SIZE = 16
+
+
+@dataclasses.dataclass
+class _PooledClient:
+    client: apolo_sdk.Client
+    opened_at: float
+    users: int = 0
+    retired: bool = False
+    closed: bool = False
+
+
+class ApoloClientPool:
+    """
+    Open apolo_sdk clients, one per distinct ApoloAuth.
+
+    Configs are bootstrapped once per process by the apolo_session module.
+    A client is replaced, with its cluster config fetched again, once it is
+    ``ttl`` seconds old, and the least recently used idle one is dropped
+    beyond ``max_size`` clients; clients in use are never dropped, so the
+    pool may exceed ``max_size`` while they are. Dropped clients are closed
+    when their last user is done with them.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = DEFAULT_CACHE_TTL,
+        max_size: int = DEFAULT_POOL_SIZE,
+        clock: t.Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_size < 1:
+            msg = "max_size must be at least 1"
+            raise ValueError(msg)
+        self.ttl = ttl
+        self.max_size = max_size
+        self._clock = clock
+        self._entries: collections.OrderedDict[ApoloAuth, _PooledClient] = (
+            collections.OrderedDict()
+        )
+        self._locks: dict[ApoloAuth, asyncio.Lock] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @contextlib.asynccontextmanager
+    async def client(self, auth: ApoloAuth) -> t.AsyncIterator[apolo_sdk.Client]:
+        """Lend the client for ``auth``, opening or refreshing it if needed."""
+        entry = await self._acquire(auth)
+        try:
+            yield entry.client
+        finally:
+            entry.users -= 1
+            if entry.retired:
+                await self._close([entry])
+            else:
+                await self._close(self._trim())
+
+    def _fresh(self, entry: _PooledClient | None) -> bool:
+        return entry is not None and self._clock() - entry.opened_at < self.ttl
+
+    async def _acquire(self, auth: ApoloAuth) -> _PooledClient:
+        """Return the entry for ``auth``, already leased to the caller."""
+        entry = self._entries.get(auth)
+        if entry is not None and self._fresh(entry):
+            self._entries.move_to_end(auth)
+            entry.users += 1
+            return entry
+        lock = self._locks.setdefault(auth, asyncio.Lock())
+        try:
+            async with lock:
+                entry = self._entries.get(auth)
+                if entry is not None and self._fresh(entry):
+                    self._entries.move_to_end(auth)
+                    entry.users += 1
+                    return entry
+                client = await self._open(auth, refresh=entry is not None)
+                # nothing is awaited until the new entry is leased, so
+                # concurrent requests can't drop it before it is lent out
+                entry = _PooledClient(client, self._clock(), users=1)
+                dropped = [self._detach(auth)]
+                self._entries[auth] = entry
+                dropped.extend(self._trim())
+        finally:
+            if not lock.locked():
+                self._locks.pop(auth, None)
+        await self._close(dropped)
+        return entry
+
+    async def _open(self, auth: ApoloAuth, *, refresh: bool) -> apolo_sdk.Client:
+        client = await open_client(
+            SessionParams.resolve(
+                api_url=auth.api_url,
+                api_token=auth.api_token,
+                passed_config=auth.passed_config,
+                org=auth.org,
+                cluster=auth.cluster,
+                project=auth.project,
+            )
+        )
+        if refresh:
+            try:
+                # presets and resource pools may have changed since login
+                await client.config.fetch()
+            except BaseException:
+                await client.close()
+                raise
+        return client
+
+    def _detach(self, auth: ApoloAuth) -> _PooledClient | None:
+        entry = self._entries.pop(auth, None)
+        if entry is not None:
+            entry.retired = True
+        return entry
+
+    def _trim(self) -> list[_PooledClient | None]:
+        """Detach the least recently used idle entries beyond max_size."""
+        excess = len(self._entries) - self.max_size
+        idle = [auth for auth, entry in self._entries.items() if not entry.users]
+        return [self._detach(auth) for auth in idle[: max(excess, 0)]]
+
+    async def _close(self, entries: list[_PooledClient | None]) -> None:
+        """Close the retired clients among ``entries`` nobody uses any more."""
+        for entry in entries:
+            if entry is None or entry.users or not entry.retired or entry.closed:
+                continue
+            entry.closed = True
+            try:
+                await entry.client.close()
+            except Exception:
+                logger.warning("Failed to close a pooled client", exc_info=True)
+
+    async def close(self) -> None:
+        await self._close([self._detach(auth) for auth in list(self._entries)])
+        self._locks.clear()
+
+
+POOL_KEY = web.AppKey("pool", ApoloClientPool)
+DEFAULT_AUTH_KEY = web.AppKey("default_auth", ApoloAuth)
+AUTH_TOKEN_KEY = web.AppKey("auth_token", str)
+
+_PUBLIC_PATHS = frozenset({"/health"})
+
+_Model = t.TypeVar("_Model", bound=BaseModel)
+
+
+async def _parse(request: web.Request, model: type[_Model]) -> _Model:
+    # malformed JSON and failed validation are both ValueErrors, answered 400
+    return model.model_validate(await request.json())
+
+
+@web.middleware
+async def error_middleware(
+    request: web.Request,
+    handler: t.Callable[[web.Request], t.Awaitable[web.StreamResponse]],
+) -> web.StreamResponse:
+    try:
+        return await handler(request)
+    except web.HTTPException:
+        raise
+    except ValueError as e:
+        logger.warning("Bad request to %s: %s", request.path, e)
+        return web.json_response({"error": str(e)}, status=400)
+    except Exception as e:
+        logger.exception("Request to %s failed", request.path)
+        return web.json_response({"error": f"{type(e).__name__}: {e}"}, status=500)
+
+
+@web.middleware
+async def auth_middleware(
+    request: web.Request,
+    handler: t.Callable[[web.Request], t.Awaitable[web.StreamResponse]],
+) -> web.StreamResponse:
+    token = request.app.get(AUTH_TOKEN_KEY)
+    if token is not None and request.path not in _PUBLIC_PATHS:
+        scheme, _, given = request.headers.get("Authorization", "").partition(" ")
+        if scheme.lower() != "bearer" or not hmac.compare_digest(
+            given.encode(), token.encode()
+        ):
+            return web.json_response({"error": "Unauthorized"}, status=401)
+    return await handler(request)
+
+
+async def health(request: web.Request) -> web.Response:
+    return web.json_response({"status": "ok"})
+
+
+async def run_preprocessor(request: web.Request) -> web.Response:
+    body = await _parse(request, RunPreprocessorRequest)
+    auth = body.auth.with_defaults(request.app[DEFAULT_AUTH_KEY])
+    inputs, preprocessor_class = load_preprocessor(
+        body.app_type,
+        body.package_name,
+        body.inputs,
+        inputs_type=body.inputs_type,
+        preprocessor_type=body.preprocessor_type,
+    )
+    async with request.app[POOL_KEY].client(auth) as client:
+        helm_args, helm_values = await generate_helm_values(
+            client,
+            inputs,
+            preprocessor_class,
+            app_name=body.app_name,
+            namespace=body.namespace,
+            app_id=body.app_id,
+            apps_secret_name=body.apps_secret_name,
+            apolo_passed_config=auth.passed_config,
+        )
+    return web.json_response({"helm_args": helm_args, "helm_values": helm_values})
+
+
+async def update_outputs(request: web.Request) -> web.Response:
+    body = await _parse(request, UpdateOutputsRequest)
+    logger.info("Helm input: %s", _redact(body.helm_outputs))
+    result = await update_app_outputs(
+        body.helm_outputs,
+        app_output_processor_type=body.app_output_processor_type,
+        apolo_app_outputs_endpoint=body.app_outputs_endpoint,
+        apolo_apps_token=body.apps_token,
+        apolo_app_type=body.app_type,
+        app_package_name=body.package_name,
+        app_instance_id=body.app_instance_id,
+    )
+    return web.json_response(
+        {
+            "ok": result.ok,
+            "attempts": result.attempts,
+            "status_code": result.status_code,
+            "error": result.error,
+        },
+        status=200 if result.ok else 502,
+    )
+
+
+async def cleanup(request: web.Request) -> web.Response:
+    body = await _parse(request, CleanupRequest)
+    auth = body.auth.with_defaults(request.app[DEFAULT_AUTH_KEY])
+    output_class = load_outputs_class(
+        body.app_type, body.package_name, body.output_type
+    )
+    async with request.app[POOL_KEY].client(auth) as client:
+        summary = await cleanup_app(
+            client,
+            app_id=body.app_id,
+            output_class=output_class,
+            max_concurrency=body.max_concurrency,
+        )
+    return web.json_response({"deleted": summary.deleted, "failed": summary.failed})
+
+
+def preload() -> None:
+    """Import the protocol models and built-in outputs generators up front."""
+    models = app_schema_models(apolo_app_types)
+    for app_type in registered_app_types():
+        get_outputs_generator(app_type)
+    logger.info("Preloaded %d protocol models", len(models))
+
+
+def bind_unix_socket(path: Path) -> socket.socket:
+    """Bind a Unix socket only the current user can connect to."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    umask = os.umask(0o177)
+    try:
+        sock.bind(str(path))
+    except BaseException:
+        sock.close()
+        raise
+    finally:
+        os.umask(umask)
+    path.chmod(0o600)
+    return sock
+
+
+def create_app(
+    default_auth: ApoloAuth | None = None,
+    *,
+    auth_token: str | None = None,
+    pool: ApoloClientPool | None = None,
+    preload_models: bool = True,
+    cache_ttl: float = DEFAULT_CACHE_TTL,
+) -> web.Application:
+    """
+    Build the server application.
+
+    ``default_auth`` fills in the API URL and org/cluster/project a request
+    does not carry; its credentials, if any, are not used. With
+    ``auth_token`` set, requests must send it as a bearer token. Resolved
+    app packages are forgotten every ``cache_ttl`` seconds, so packages
+    installed after start are found. Pooled clients are closed when the
+    application shuts down.
+    """
+    if preload_models:
+        preload()
+    refreshed_at = time.monotonic()
+
+    @web.middleware
+    async def refresh_middleware(
+        request: web.Request,
+        handler: t.Callable[[web.Request], t.Awaitable[web.StreamResponse]],
+    ) -> web.StreamResponse:
+        nonlocal refreshed_at
+        now = time.monotonic()
+        if now - refreshed_at >= cache_ttl:
+            clear_component_cache()
+            refreshed_at = now
+        return await handler(request)
+
+    app = web.Application(
+        middlewares=[auth_middleware, error_middleware, refresh_middleware]
+    )
+    app[POOL_KEY] = pool or ApoloClientPool(ttl=cache_ttl)
+    app[DEFAULT_AUTH_KEY] = default_auth or ApoloAuth()
+    if auth_token is not None:
+        app[AUTH_TOKEN_KEY] = auth_token
+    app.add_routes(
+        [
+            web.get("/health", health),
+            web.post("/run-preprocessor", run_preprocessor),
+            web.post("/update-outputs", update_outputs),
+            web.post("/cleanup", cleanup),
+        ]
+    )
+
+    async def _close_pool(app: web.Application) -> None:
+        await app[POOL_KEY].close()
+
+    app.on_cleanup.append(_close_pool)
+    return app
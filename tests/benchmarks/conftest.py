@@ -0,0 +1,23 @@
+import asyncio
+import typing as t
+from collections.abc import Awaitable, Callable, Iterator
+
+import pytest
+
+
+pytest_plugins = ["apolo_app_types_fixtures"]
+
+RunAsync = Callable[[Callable[[], Awaitable[t.Any]]], t.Any]
+
+
+@pytest.fixture
+def run_async() -> Iterator[RunAsync]:
+    """
+    Run a coroutine function to completion on a private event loop.
+
+    Benchmarks are sync tests, as pytest-benchmark times plain callables;
+    this turns an async call into one.
+    """
+    loop = asyncio.new_event_loop()
+    yield lambda function: loop.run_until_complete(function())
+    loop.close()
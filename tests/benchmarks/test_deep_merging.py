@@ -0,0 +1,49 @@
+import typing as t
+from functools import reduce
+
+import pytest
+
+from apolo_app_types.helm.utils.deep_merging import deep_merge, merge_list_of_dicts
+
+
+def _helm_fragments(count: int) -> list[dict[str, t.Any]]:
+    """Value fragments shaped like the ones the chart value processors merge."""
+    fragments: list[dict[str, t.Any]] = [
+        {
+            "image": {"repository": "vllm/vllm-openai", "tag": "v0.9.0"},
+            "resources": {"requests": {"cpu": "4000.0m", "memory": "16384M"}},
+            "tolerations": [
+                {"key": "platform.neuromation.io/job", "operator": "Exists"}
+            ],
+            "ingress": {"enabled": True, "hosts": [{"host": "app.example.com"}]},
+        }
+    ]
+    for idx in range(count - 1):
+        fragments.append(
+            {
+                "env": {f"VAR_{idx}": str(idx)},
+                "serverExtraArgs": [f"--arg-{idx}"],
+                "resources": {"limits": {f"nvidia.com/gpu-{idx % 4}": "1"}},
+                "tolerations": [{"key": f"taint-{idx}", "operator": "Exists"}],
+                "ingress": {"annotations": {f"annotation-{idx}": "on"}},
+                "replicaCount": idx,
+            }
+        )
+    return fragments
+
+
+MERGES: dict[str, t.Callable[[list[dict[str, t.Any]]], dict[str, t.Any]]] = {
+    "merge_list_of_dicts": merge_list_of_dicts,
+    "reduce_deep_merge": lambda fragments: reduce(deep_merge, fragments, {}),
+}
+
+
+@pytest.mark.parametrize("count", [10, 200])
+@pytest.mark.parametrize("merge", list(MERGES))
+def test_merge_fragments(benchmark, merge, count):
+    fragments = _helm_fragments(count)
+    benchmark.group = f"deep_merge[{count}]"
+
+    merged = benchmark(MERGES[merge], fragments)
+
+    assert len(merged["serverExtraArgs"]) == count - 1
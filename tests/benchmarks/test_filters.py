@@ -0,0 +1,91 @@
+from typing import Any
+
+import pytest
+
+from apolo_app_types.dynamic_outputs import (
+    BaseModelFilter,
+    DynamicAppFilterParams,
+    IndexedModelCollection,
+)
+from apolo_app_types.dynamic_outputs.filters import FieldValueCache, parse_filter
+
+
+class ModelFilter(BaseModelFilter):
+    or_groups = True
+
+    def _get_field_value(self, model: dict[str, Any], field: str) -> Any:
+        return model.get(field)
+
+    def _matches_in_operator(self, value: Any, filter_value: str) -> bool:
+        if isinstance(value, list):
+            return any(filter_value.lower() == v.lower() for v in value)
+        return False
+
+
+def _catalog(size: int) -> list[dict[str, Any]]:
+    families = ["Llama", "Mistral", "Qwen", "Gemma", "Phi"]
+    return [
+        {
+            "name": f"{families[idx % 5]}-{idx}-Instruct",
+            "pipeline": "text-generation" if idx % 3 else "embeddings",
+            "gated": idx % 4 == 0,
+            "size": idx % 70,
+            "tags": ["chat", f"v{idx % 7}"] if idx % 2 else [f"v{idx % 7}"],
+        }
+        for idx in range(size)
+    ]
+
+
+MODELS = _catalog(10_000)
+
+FILTERS = {
+    "eq": "pipeline:eq:embeddings,gated:eq:true",
+    "like": "name:like:qwen",
+    "in": "tags:in:chat",
+    "range": "size:gt:10,size:lt:20",
+    "or": "name:like:gemma,gated:eq:true|tags:in:v3",
+    "sort": "name:like:llama,sort:-size",
+}
+
+
+@pytest.fixture(scope="module")
+def collection() -> IndexedModelCollection[dict[str, Any]]:
+    return IndexedModelCollection(
+        MODELS,
+        ModelFilter,
+        eq_fields=["pipeline", "gated"],
+        in_fields=["tags"],
+        like_fields=["name"],
+    )
+
+
+@pytest.mark.parametrize("kind", list(FILTERS))
+def test_parse_filter(benchmark, kind):
+    benchmark.group = "filter_parse"
+
+    parsed = benchmark(parse_filter, FILTERS[kind], or_groups=True)
+
+    assert parsed.groups
+
+
+@pytest.mark.parametrize("kind", list(FILTERS))
+def test_filter_apply(benchmark, kind):
+    model_filter = ModelFilter(FILTERS[kind])
+    value_cache = FieldValueCache()
+    benchmark.group = "filter_apply"
+    benchmark.extra_info["models"] = len(MODELS)
+
+    matches = benchmark(model_filter.apply, MODELS, value_cache)
+
+    assert matches
+
+
+@pytest.mark.parametrize("kind", list(FILTERS))
+def test_collection_page(benchmark, collection, kind):
+    params = DynamicAppFilterParams(filter=FILTERS[kind], limit=50)
+    benchmark.group = "filter_page"
+    benchmark.extra_info["models"] = len(MODELS)
+
+    page = benchmark(collection.page, params)
+
+    assert page == ModelFilter(FILTERS[kind]).apply(MODELS)[:50]
@@ -0,0 +1,67 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+
+def _cumulative_import_us(module: str) -> int:
+    """Cumulative import time of ``module`` in a fresh interpreter, in us."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # lines look like "import time:  self [us] | cumulative | imported package"
+    for line in reversed(completed.stderr.splitlines()):
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].strip() == module:
+            return int(fields[1])
+    msg = f"No import time reported for {module}"
+    raise AssertionError(msg)
+
+
+@pytest.mark.parametrize("module", ["apolo_app_types", "apolo_app_types.cli"])
+def test_import_time(benchmark, module):
+    benchmark.group = "import"
+    samples: list[int] = []
+
+    benchmark.pedantic(lambda: samples.append(_cumulative_import_us(module)), rounds=5)
+
+    # the round timings include interpreter start-up, this is the import alone
+    benchmark.extra_info["cumulative_import_us"] = min(samples)
+    assert samples
+
+
+RESOLVE_EXPORTS = """
+import json, time
+start = time.perf_counter()
+import apolo_app_types
+lazy = time.perf_counter() - start
+start = time.perf_counter()
+for name in apolo_app_types.__all__:
+    getattr(apolo_app_types, name)
+print(json.dumps({"lazy": lazy, "eager": time.perf_counter() - start}))
+"""
+
+
+def test_resolve_exports(benchmark):
+    """Bare package import against resolving every public name after it."""
+    benchmark.group = "import"
+    samples: list[dict[str, float]] = []
+
+    def run() -> None:
+        completed = subprocess.run(
+            [sys.executable, "-c", RESOLVE_EXPORTS],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        samples.append(json.loads(completed.stdout))
+
+    benchmark.pedantic(run, rounds=5)
+
+    benchmark.extra_info["lazy_s"] = min(sample["lazy"] for sample in samples)
+    benchmark.extra_info["eager_s"] = min(sample["eager"] for sample in samples)
+    assert benchmark.extra_info["lazy_s"] < benchmark.extra_info["eager_s"]
@@ -0,0 +1,97 @@
+import typing as t
+
+import pytest
+from apolo_app_types_fixtures.constants import (
+    DEFAULT_NAMESPACE,
+    DEFAULT_ORG_NAME,
+    DEFAULT_PROJECT_NAME,
+)
+
+from apolo_app_types.outputs.registry import (
+    get_outputs_generator,
+    registered_app_types,
+)
+
+
+LLM_VALUES = {
+    "model": {
+        "modelHFName": "meta-llama/Llama-3.1-8B-Instruct",
+        "tokenizerHFName": "meta-llama/Llama-3.1-8B-Instruct",
+    },
+    "serverExtraArgs": ["--api-key dummy-api-key"],
+    "env": {"VLLM_API_KEY": "dummy"},
+}
+
+# Generators not listed here read nothing from the helm values
+HELM_VALUES: dict[str, dict[str, t.Any]] = {
+    "llm-inference": LLM_VALUES,
+    "llama4": LLM_VALUES,
+    "deepseek": LLM_VALUES,
+    "mistral": LLM_VALUES,
+    "gpt-oss": LLM_VALUES,
+    "stable-diffusion": {"model": {"modelHFName": "stabilityai/sdxl-turbo"}},
+    "weaviate": {
+        "nameOverride": "weaviate",
+        "clusterApi": {"username": "admin", "password": "admin"},
+        "ingress": {"enabled": True},
+    },
+    "dockerhub": {
+        "job": {
+            "args": {
+                "org": DEFAULT_ORG_NAME,
+                "namespace": DEFAULT_NAMESPACE,
+                "project": DEFAULT_PROJECT_NAME,
+                "user": "user",
+                "registry_name": "DockerHub",
+                "registry_provider_host": "https://index.docker.io/v1/",
+                "registry_api_url": "https://hub.docker.com",
+                "registry_user": "user",
+                "registry_secret": "secret",
+            }
+        }
+    },
+    "custom-deployment": {"image": {"repository": "myrepo/app", "tag": "v1"}},
+    "spark-job": {"image": {"repository": "myrepo/spark-job", "tag": "v1"}},
+    "text-embeddings-inference": {"model": {"modelHFName": "BAAI/bge-m3"}},
+    "superset": {
+        "extraSecretEnv": {"SUPERSET_SECRET_KEY": "key"},
+        "init": {
+            "adminUser": {
+                "username": "admin",
+                "firstname": "Admin",
+                "lastname": "User",
+                "email": "admin@example.com",
+                "password": "password",
+            }
+        },
+    },
+    "lightrag": {
+        "service": {"type": "ClusterIP", "port": 9621},
+        "env": {
+            "LLM_BINDING": "openai",
+            "LLM_MODEL": "gpt-4",
+            "LLM_BINDING_HOST": "https://api.openai.com:443/v1",
+            "EMBEDDING_BINDING": "openai",
+            "EMBEDDING_MODEL": "text-embedding-ada-002",
+            "EMBEDDING_DIM": 1536,
+            "EMBEDDING_BINDING_HOST": "https://api.openai.com:443/v1",
+        },
+    },
+}
+
+
+@pytest.mark.parametrize("app_type", registered_app_types())
+def test_outputs_generator(
+    benchmark, run_async, setup_clients, mock_kubernetes_client, app_type
+):
+    generator = get_outputs_generator(app_type)
+    assert generator is not None
+    helm_values = HELM_VALUES.get(app_type, {})
+    benchmark.group = "outputs"
+
+    async def generate() -> dict[str, t.Any]:
+        return await generator(helm_values, "test-app-instance-id")
+
+    outputs = benchmark(run_async, generate)
+
+    assert isinstance(outputs, dict)
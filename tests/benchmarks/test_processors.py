@@ -0,0 +1,323 @@
+import typing as t
+
+import pytest
+from apolo_app_types_fixtures.constants import (
+    APP_ID,
+    APP_SECRETS_NAME,
+    DEFAULT_NAMESPACE,
+    DEFAULT_POSTGRES_CREDS,
+)
+
+from apolo_app_types import (
+    ContainerImage,
+    CrunchyPostgresUserCredentials,
+    CustomDeploymentInputs,
+    DockerHubInputs,
+    HuggingFaceModel,
+    HuggingFaceToken,
+    LLMInputs,
+    ShellAppInputs,
+    StableDiffusionInputs,
+    WeaviateInputs,
+)
+from apolo_app_types.app_types import AppType
+from apolo_app_types.helm.apps import (
+    BaseChartValueProcessor,
+    CustomDeploymentChartValueProcessor,
+    LLMChartValueProcessor,
+    StableDiffusionChartValueProcessor,
+)
+from apolo_app_types.helm.apps.bundles.llm import (
+    DeepSeekValueProcessor,
+    GPTOSSValueProcessor,
+    Llama4ValueProcessor,
+    MistralValueProcessor,
+)
+from apolo_app_types.helm.apps.dockerhub import DockerHubModelChartValueProcessor
+from apolo_app_types.helm.apps.fooocus import FooocusChartValueProcessor
+from apolo_app_types.helm.apps.jupyter import JupyterChartValueProcessor
+from apolo_app_types.helm.apps.lightrag import LightRAGChartValueProcessor
+from apolo_app_types.helm.apps.openwebui import OpenWebUIChartValueProcessor
+from apolo_app_types.helm.apps.privategpt import PrivateGptChartValueProcessor
+from apolo_app_types.helm.apps.shell import ShellChartValueProcessor
+from apolo_app_types.helm.apps.spark_job import SparkJobValueProcessor
+from apolo_app_types.helm.apps.superset import SupersetChartValueProcessor
+from apolo_app_types.helm.apps.text_embeddings import TextEmbeddingsChartValueProcessor
+from apolo_app_types.helm.apps.vscode import VSCodeChartValueProcessor
+from apolo_app_types.helm.apps.weaviate import WeaviateChartValueProcessor
+from apolo_app_types.protocols.bundles.llm import (
+    DeepSeekR1Inputs,
+    DeepSeekR1Size,
+    GptOssInputs,
+    GptOssSize,
+    LLama4Inputs,
+    Llama4Size,
+    MistralInputs,
+    MistralSize,
+)
+from apolo_app_types.protocols.common import (
+    ApoloSecret,
+    AppInputs,
+    IngressHttp,
+    Preset,
+)
+from apolo_app_types.protocols.common.ingress import BasicNetworkingConfig
+from apolo_app_types.protocols.common.openai_compat import (
+    OpenAICompatChatAPI,
+    OpenAICompatEmbeddingsAPI,
+)
+from apolo_app_types.protocols.common.storage import ApoloFilesFile
+from apolo_app_types.protocols.dockerhub import DockerHubModel
+from apolo_app_types.protocols.fooocus import (
+    FooocusAppInputs,
+    FooocusSpecificAppInputs,
+)
+from apolo_app_types.protocols.jupyter import (
+    JupyterAppInputs,
+    JupyterSpecificAppInputs,
+)
+from apolo_app_types.protocols.lightrag import (
+    LightRAGAppInputs,
+    OpenAIEmbeddingProvider,
+    OpenAILLMProvider,
+)
+from apolo_app_types.protocols.openwebui import (
+    DataBaseConfig,
+    OpenWebUIAppInputs,
+    SQLiteDatabase,
+)
+from apolo_app_types.protocols.private_gpt import PrivateGPTAppInputs
+from apolo_app_types.protocols.spark_job import (
+    DriverConfig,
+    ExecutorConfig,
+    SparkApplicationConfig,
+    SparkApplicationType,
+    SparkAutoScalingConfig,
+    SparkDependencies,
+    SparkJobInputs,
+)
+from apolo_app_types.protocols.stable_diffusion import StableDiffusionParams
+from apolo_app_types.protocols.superset import (
+    SupersetInputs,
+    SupersetPostgresConfig,
+    WebConfig,
+    WorkerConfig,
+)
+from apolo_app_types.protocols.text_embeddings import (
+    TextEmbeddingsInferenceAppInputs,
+)
+from apolo_app_types.protocols.vscode import (
+    VSCodeAppInputs,
+    VSCodeSpecificAppInputs,
+)
+from apolo_app_types.protocols.weaviate import WeaviatePersistence
+
+
+HF_TOKEN = HuggingFaceToken(token_name="hf-token", token=ApoloSecret(key="hf-token"))
+CHAT_API = OpenAICompatChatAPI(
+    host="llm-host",
+    port=8000,
+    protocol="https",
+    base_path="/",
+    hf_model=HuggingFaceModel(model_hf_name="llm-model"),
+)
+EMBEDDINGS_API = OpenAICompatEmbeddingsAPI(
+    host="tei-host",
+    port=3000,
+    protocol="https",
+    base_path="/",
+    hf_model=HuggingFaceModel(model_hf_name="tei-model"),
+)
+
+# One typical input per app type of apolo_app_types.inputs.args.app_type_to_vals
+PROCESSORS: dict[AppType, tuple[type[BaseChartValueProcessor[t.Any]], AppInputs]] = {
+    AppType.LLMInference: (
+        LLMChartValueProcessor,
+        LLMInputs(
+            preset=Preset(name="cpu-large"),
+            ingress_http=IngressHttp(),
+            hugging_face_model=HuggingFaceModel(
+                model_hf_name="meta-llama/Llama-3.1-8B-Instruct", hf_token=HF_TOKEN
+            ),
+            server_extra_args=["--max-model-len 8192"],
+        ),
+    ),
+    AppType.StableDiffusion: (
+        StableDiffusionChartValueProcessor,
+        StableDiffusionInputs(
+            preset=Preset(name="cpu-large"),
+            ingress_http=IngressHttp(),
+            stable_diffusion=StableDiffusionParams(
+                replica_count=1,
+                stablestudio=None,
+                hugging_face_model=HuggingFaceModel(
+                    model_hf_name="stabilityai/sdxl-turbo", hf_token=HF_TOKEN
+                ),
+            ),
+        ),
+    ),
+    AppType.Weaviate: (
+        WeaviateChartValueProcessor,
+        WeaviateInputs(
+            preset=Preset(name="cpu-large"),
+            persistence=WeaviatePersistence(size=64, enable_backups=False),
+            ingress_http=IngressHttp(),
+        ),
+    ),
+    AppType.DockerHub: (
+        DockerHubModelChartValueProcessor,
+        DockerHubInputs(
+            dockerhub=DockerHubModel(
+                username="user", password=ApoloSecret(key="dockerhub-password")
+            )
+        ),
+    ),
+    AppType.CustomDeployment: (
+        CustomDeploymentChartValueProcessor,
+        CustomDeploymentInputs(
+            preset=Preset(name="cpu-small"),
+            image=ContainerImage(repository="myrepo/custom-deployment", tag="v1"),
+        ),
+    ),
+    AppType.SparkJob: (
+        SparkJobValueProcessor,
+        SparkJobInputs(
+            spark_application_config=SparkApplicationConfig(
+                type=SparkApplicationType.PYTHON,
+                main_application_file=ApoloFilesFile(path="storage://path/to/main.py"),
+                dependencies=SparkDependencies(pypi_packages=["scikit-learn"]),
+            ),
+            driver_config=DriverConfig(preset=Preset(name="cpu-small")),
+            executor_config=ExecutorConfig(preset=Preset(name="cpu-medium")),
+            image=ContainerImage(repository="myrepo/spark-job", tag="v1"),
+            spark_auto_scaling_config=SparkAutoScalingConfig(
+                initial_executors=2,
+                min_executors=1,
+                max_executors=5,
+                shuffle_tracking_timeout=30,
+            ),
+        ),
+    ),
+    AppType.Fooocus: (
+        FooocusChartValueProcessor,
+        FooocusAppInputs(
+            preset=Preset(name="cpu-small"),
+            ingress_http=IngressHttp(),
+            fooocus_specific=FooocusSpecificAppInputs(
+                huggingface_token_secret=ApoloSecret(key="hf-token")
+            ),
+        ),
+    ),
+    AppType.LightRAG: (
+        LightRAGChartValueProcessor,
+        LightRAGAppInputs(
+            preset=Preset(name="cpu-large"),
+            ingress_http=IngressHttp(),
+            pgvector_user=CrunchyPostgresUserCredentials(
+                user="lightrag",
+                password=ApoloSecret(key="lightrag-password"),
+                host="postgres-host",
+                port=5432,
+                pgbouncer_host="pgbouncer-host",
+                pgbouncer_port=6432,
+                dbname="lightrag",
+            ),
+            llm_config=OpenAILLMProvider(model="gpt-4", api_key="key"),
+            embedding_config=OpenAIEmbeddingProvider(
+                model="text-embedding-3-small", api_key="key", dimensions=1536
+            ),
+        ),
+    ),
+    AppType.Jupyter: (
+        JupyterChartValueProcessor,
+        JupyterAppInputs(
+            preset=Preset(name="cpu-small"),
+            jupyter_specific=JupyterSpecificAppInputs(http_auth=False),
+        ),
+    ),
+    AppType.TextEmbeddingsInference: (
+        TextEmbeddingsChartValueProcessor,
+        TextEmbeddingsInferenceAppInputs(
+            preset=Preset(name="cpu-small"),
+            ingress_http=IngressHttp(),
+            model=HuggingFaceModel(model_hf_name="BAAI/bge-m3", hf_token=HF_TOKEN),
+        ),
+    ),
+    AppType.PrivateGPT: (
+        PrivateGptChartValueProcessor,
+        PrivateGPTAppInputs(
+            preset=Preset(name="cpu-small"),
+            ingress_http=IngressHttp(),
+            llm_chat_api=CHAT_API,
+            pgvector_user=DEFAULT_POSTGRES_CREDS,
+            embeddings_api=EMBEDDINGS_API,
+        ),
+    ),
+    AppType.VSCode: (
+        VSCodeChartValueProcessor,
+        VSCodeAppInputs(
+            preset=Preset(name="cpu-small"),
+            vscode_specific=VSCodeSpecificAppInputs(),
+        ),
+    ),
+    AppType.Shell: (
+        ShellChartValueProcessor,
+        ShellAppInputs(preset=Preset(name="cpu-small")),
+    ),
+    AppType.Superset: (
+        SupersetChartValueProcessor,
+        SupersetInputs(
+            worker_config=WorkerConfig(preset=Preset(name="cpu-large")),
+            web_config=WebConfig(preset=Preset(name="cpu-large")),
+            ingress_http=IngressHttp(),
+            postgres_config=SupersetPostgresConfig(preset=Preset(name="cpu-large")),
+            redis_preset=Preset(name="cpu-large"),
+        ),
+    ),
+    AppType.OpenWebUI: (
+        OpenWebUIChartValueProcessor,
+        OpenWebUIAppInputs(
+            preset=Preset(name="cpu-small"),
+            networking_config=BasicNetworkingConfig(ingress_http=IngressHttp()),
+            llm_chat_api=CHAT_API,
+            database_config=DataBaseConfig(database=SQLiteDatabase()),
+            embeddings_api=EMBEDDINGS_API,
+        ),
+    ),
+    AppType.Llama4: (
+        Llama4ValueProcessor,
+        LLama4Inputs(size=Llama4Size.scout, hf_token=HF_TOKEN),
+    ),
+    AppType.DeepSeek: (
+        DeepSeekValueProcessor,
+        DeepSeekR1Inputs(size=DeepSeekR1Size.r1_distill_qwen_1_5_b, hf_token=HF_TOKEN),
+    ),
+    AppType.Mistral: (
+        MistralValueProcessor,
+        MistralInputs(size=MistralSize.mistral_7b_v02, hf_token=HF_TOKEN),
+    ),
+    AppType.GptOss: (
+        GPTOSSValueProcessor,
+        GptOssInputs(size=GptOssSize.gpt_oss_20b, hf_token=HF_TOKEN),
+    ),
+}
+
+
+@pytest.mark.parametrize("app_type", list(PROCESSORS), ids=str)
+def test_gen_extra_values(benchmark, run_async, setup_clients, app_type):
+    processor_class, inputs = PROCESSORS[app_type]
+    processor = processor_class(setup_clients)
+    benchmark.group = "gen_extra_values"
+
+    async def gen_extra_values() -> dict[str, t.Any]:
+        return await processor.gen_extra_values(
+            input_=inputs,
+            app_name="bench-app",
+            namespace=DEFAULT_NAMESPACE,
+            app_secrets_name=APP_SECRETS_NAME,
+            app_id=APP_ID,
+        )
+
+    values = benchmark(run_async, gen_extra_values)
+
+    assert values
@@ -0,0 +1,54 @@
+import jsonref
+import pytest
+
+import apolo_app_types
+from apolo_app_types.protocols.common import AppInputs
+from apolo_app_types.schema_utils import (
+    InlineSchemaCache,
+    _replace_downstream_defaults,
+    app_schema_models,
+    get_inline_schema,
+)
+
+
+INPUTS_MODELS = {
+    name: model
+    for name, model in sorted(app_schema_models(apolo_app_types).items())
+    if issubclass(model, AppInputs)
+}
+
+
+@pytest.mark.parametrize("model_name", list(INPUTS_MODELS))
+def test_build_inline_schema(benchmark, model_name):
+    model = INPUTS_MODELS[model_name]
+    # a private cache, cleared before each round, so every round builds
+    cache = InlineSchemaCache()
+    benchmark.group = "inline_schema"
+
+    schema = benchmark.pedantic(cache.get, args=(model,), setup=cache.clear, rounds=5)
+
+    assert schema["type"] == "object"
+
+
+def test_cached_inline_schemas(benchmark):
+    models = list(INPUTS_MODELS.values())
+    benchmark.group = "inline_schema"
+    benchmark.extra_info["models"] = len(models)
+
+    schemas = benchmark(lambda: [get_inline_schema(model) for model in models])
+
+    assert len(schemas) == len(models)
+
+
+def test_replace_downstream_defaults(benchmark):
+    # the transform copies what it changes, so the inputs can be reused
+    schemas = [
+        jsonref.replace_refs(model.model_json_schema(), merge_props=True, proxies=False)
+        for model in INPUTS_MODELS.values()
+    ]
+    benchmark.group = "inline_schema"
+    benchmark.extra_info["models"] = len(schemas)
+
+    results = benchmark(lambda: [_replace_downstream_defaults(s) for s in schemas])
+
+    assert len(results) == len(schemas)
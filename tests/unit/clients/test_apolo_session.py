@@ -0,0 +1,172 @@
+import asyncio
+import base64
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from apolo_app_types.clients import apolo_session
+from apolo_app_types.clients.apolo_session import (
+    SessionParams,
+    bootstrap_config,
+    open_client,
+)
+
+
+def _client() -> MagicMock:
+    client = MagicMock()
+    client.__aenter__ = AsyncMock(return_value=client)
+    client.__aexit__ = AsyncMock(return_value=None)
+    client.close = AsyncMock()
+    client.config.switch_org = AsyncMock()
+    client.config.switch_cluster = AsyncMock()
+    client.config.switch_project = AsyncMock()
+    return client
+
+
+@pytest.fixture
+def sdk():
+    client = _client()
+    with (
+        patch("apolo_sdk.login_with_token", AsyncMock()) as login,
+        patch("apolo_sdk.Factory") as factory,
+    ):
+        factory.return_value.get = AsyncMock(return_value=client)
+        yield login, factory, client
+
+
+@pytest.fixture(autouse=True)
+def _fresh_sessions():
+    apolo_session.reset_sessions()
+    yield
+    apolo_session.reset_sessions()
+
+
+def test_resolve_from_passed_config():
+    passed = base64.b64encode(
+        json.dumps(
+            {
+                "token": "tok",
+                "cluster": "second",
+                "url": "https://api.example.com",
+                "org_name": "org-b",
+            }
+        ).encode()
+    ).decode()
+
+    params = SessionParams.resolve(passed_config=passed, project="beta")
+
+    assert params == SessionParams(
+        api_url="https://api.example.com",
+        api_token="tok",
+        org="org-b",
+        cluster="second",
+        project="beta",
+    )
+    assert "tok" not in repr(params)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"passed_config": "not base64 json"},
+        {"api_token": "tok"},
+    ],
+)
+def test_resolve_rejects_bad_params(kwargs):
+    with pytest.raises(ValueError):  # noqa: PT011
+        SessionParams.resolve(**kwargs)
+
+
+@pytest.mark.asyncio
+async def test_config_bootstrapped_once_per_process(sdk):
+    login, factory, client = sdk
+    params = SessionParams(
+        api_url="https://api.example.com", api_token="tok", org="org-b"
+    )
+
+    paths = await asyncio.gather(*(bootstrap_config(params) for _ in range(3)))
+    other = await bootstrap_config(
+        SessionParams(api_url="https://api.example.com", api_token="other")
+    )
+
+    assert paths[0] == paths[1] == paths[2]
+    assert paths[0].is_dir()
+    assert other != paths[0]
+    assert login.await_count == 2
+    assert login.await_args_list[0].kwargs["path"] == paths[0]
+    # only the names given are switched, the SDK keeps a valid project
+    client.config.switch_org.assert_awaited_once_with("org-b")
+    client.config.switch_cluster.assert_not_awaited()
+    client.config.switch_project.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_failed_bootstrap_is_retried(sdk):
+    login, _, client = sdk
+    client.config.switch_project.side_effect = [RuntimeError("no project"), None]
+    params = SessionParams(
+        api_url="https://api.example.com", api_token="tok", project="beta"
+    )
+
+    with pytest.raises(RuntimeError, match="no project"):
+        await bootstrap_config(params)
+    path = await bootstrap_config(params)
+
+    assert path is not None
+    assert login.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_configs_are_removed(sdk):
+    login, _, _ = sdk
+    params = [
+        SessionParams(api_url="https://api.example.com", api_token=f"tok-{idx}")
+        for idx in range(3)
+    ]
+
+    with patch.object(apolo_session, "MAX_SESSIONS", 2):
+        first, second = [await bootstrap_config(p) for p in params[:2]]
+        assert await bootstrap_config(params[0]) == first
+        third = await bootstrap_config(params[2])
+
+        assert first.is_dir()
+        assert not second.is_dir()
+        assert third.is_dir()
+        assert list(apolo_session._config_paths) == [params[0], params[2]]
+        assert apolo_session._config_locks == {}
+        # an evicted config is bootstrapped again on its next use
+        assert (await bootstrap_config(params[1])).is_dir()
+        assert login.await_count == 4
+        assert not first.is_dir()
+
+
+@pytest.mark.asyncio
+async def test_failed_bootstrap_leaves_nothing_behind(sdk):
+    login, _, _ = sdk
+    login.side_effect = RuntimeError("bad token")
+    params = SessionParams(api_url="https://api.example.com", api_token="bad")
+
+    with pytest.raises(RuntimeError, match="bad token"):
+        await bootstrap_config(params)
+
+    assert apolo_session._config_paths == {}
+    assert apolo_session._config_locks == {}
+    assert list(apolo_session._session_root().iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_default_config_is_switched_per_client(sdk):
+    login, factory, client = sdk
+
+    assert await open_client(SessionParams(cluster="second")) is client
+
+    login.assert_not_awaited()
+    factory.assert_called_once_with(None)
+    client.config.switch_cluster.assert_awaited_once_with("second")
+    client.config.switch_org.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_no_token_uses_default_config():
+    assert await bootstrap_config(SessionParams(org="org-a")) is None
@@ -0,0 +1,58 @@
+from unittest.mock import mock_open, patch
+
+import pytest
+
+from apolo_app_types.clients import kube
+from apolo_app_types.clients.kube import (
+    get_api_client,
+    get_ingresses_as_dict,
+    get_services,
+    reset_api_client,
+)
+
+
+@pytest.mark.asyncio
+async def test_incluster_config_loaded_once(mock_kubernetes_client):
+    await get_services({"application": "app"})
+    await get_services({"application": "app"})
+    await get_ingresses_as_dict("application=app")
+
+    mock_kubernetes_client["mock_load_incluster_config"].assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_api_wrappers_share_api_client(mock_kubernetes_client):
+    await get_services({"application": "app"})
+    await get_ingresses_as_dict("application=app")
+
+    api_client = get_api_client()
+    core_v1_api = mock_kubernetes_client["mock_core_v1_api"]
+    networking_v1_api = mock_kubernetes_client["mock_networking_v1_api"]
+    assert core_v1_api.call_args.args == (api_client,)
+    assert networking_v1_api.call_args.args == (api_client,)
+
+
+def test_reset_api_client_reloads_config(mock_kubernetes_client):
+    first = get_api_client()
+    reset_api_client()
+    second = get_api_client()
+
+    assert first is not second
+    assert mock_kubernetes_client["mock_load_incluster_config"].call_count == 2
+
+
+def test_namespace_file_read_once(monkeypatch):
+    monkeypatch.delenv(kube.NAMESPACE_ENV_VAR, raising=False)
+    reset_api_client()
+    with patch("pathlib.Path.open", mock_open(read_data="apps-ns\n")) as opened:
+        assert kube.get_current_namespace() == "apps-ns"
+        assert kube.get_current_namespace() == "apps-ns"
+    reset_api_client()
+
+    opened.assert_called_once()
+
+
+def test_namespace_env_var_takes_precedence(monkeypatch):
+    monkeypatch.setenv(kube.NAMESPACE_ENV_VAR, "env-ns")
+
+    assert kube.get_current_namespace() == "env-ns"
@@ -0,0 +1,171 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import apolo_sdk
+import pytest
+from apolo_app_types_fixtures.constants import (
+    DEFAULT_CLUSTER_NAME,
+    DEFAULT_ORG_NAME,
+    DEFAULT_PROJECT_NAME,
+)
+from click.testing import CliRunner
+
+from apolo_app_types import ShellAppInputs
+from apolo_app_types.cli import cli
+from apolo_app_types.clients.offline import (
+    OfflineClient,
+    RecordedClusterConfig,
+    record_cluster_config,
+)
+from apolo_app_types.helm.apps.shell import ShellChartValueProcessor
+from apolo_app_types.protocols.common import Preset
+
+
+@pytest.fixture
+async def recorded(setup_clients) -> RecordedClusterConfig:
+    setup_clients.config.username = "test-user"
+    setup_clients.config.registry_url = "https://registry.cluster.org.neu.ro"
+    return await record_cluster_config(setup_clients)
+
+
+@pytest.fixture
+def cluster_config_path(recorded, tmp_path) -> Path:
+    path = tmp_path / "cluster.json"
+    # the test presets give GPU memory as floats
+    path.write_text(recorded.model_dump_json(warnings=False))
+    return path
+
+
+@pytest.mark.asyncio
+async def test_recorded_config_round_trips(recorded, cluster_config_path):
+    restored = RecordedClusterConfig.from_file(cluster_config_path)
+
+    assert restored.model_dump(mode="json") == recorded.model_dump(
+        mode="json", warnings=False
+    )
+    assert restored.hostname_templates == ["{app_names}.apps.some.org.neu.ro"]
+    assert restored.capacity["cpu-small"] == 1
+
+
+@pytest.mark.asyncio
+async def test_offline_values_match_live_client(setup_clients, recorded):
+    offline = OfflineClient(recorded).as_client()
+    inputs = ShellAppInputs(preset=Preset(name="cpu-small"))
+    kwargs = {
+        "input_": inputs,
+        "app_name": "shell-app",
+        "namespace": "default",
+        "app_secrets_name": "apps-secrets",
+        "app_id": "app-id",
+    }
+
+    live = await ShellChartValueProcessor(setup_clients).gen_extra_values(**kwargs)
+    values = await ShellChartValueProcessor(offline).gen_extra_values(**kwargs)
+
+    assert values == live
+    annotations = values["podAnnotations"]
+    storage = json.loads(annotations["platform.apolo.us/inject-storage"])[0]
+    assert storage["storage_uri"] == (
+        f"storage://{DEFAULT_CLUSTER_NAME}/{DEFAULT_ORG_NAME}/{DEFAULT_PROJECT_NAME}/"
+        ".apps/shell/shell-app"
+    )
+
+
+@pytest.mark.asyncio
+async def test_offline_secrets_and_unavailable_apis(recorded):
+    client = OfflineClient(recorded)
+
+    await client.secrets.add(key="token", value=b"value")
+    assert await client.secrets.get(key="token") == b"value"
+    await client.secrets.rm(key="token")
+    with pytest.raises(apolo_sdk.ResourceNotFound):
+        await client.secrets.get(key="token")
+    assert await client.jobs.get_capacity() == recorded.capacity
+    with pytest.raises(AttributeError, match="not available offline"):
+        _ = client.buckets
+
+
+@pytest.mark.parametrize(
+    "type_args",
+    [
+        [],
+        [
+            "--inputs-type",
+            "ShellAppInputs",
+            "--preprocessor-type",
+            "ShellChartValueProcessor",
+        ],
+    ],
+)
+def test_render_values_cli(cluster_config_path, tmp_path, type_args):
+    inputs_path = tmp_path / "inputs.json"
+    inputs_path.write_text(json.dumps([{"preset": {"name": "cpu-small"}}] * 2))
+    output_path = tmp_path / "values.json"
+
+    result = CliRunner().invoke(
+        cli,
+        [
+            "render-values",
+            "shell",
+            str(inputs_path),
+            str(cluster_config_path),
+            "--output",
+            str(output_path),
+            *type_args,
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    rendered = json.loads(output_path.read_text())
+    assert len(rendered) == 2
+    assert rendered[0]["helm_args"] == ["--timeout", "15m", "--dependency-update"]
+    assert rendered[0]["helm_values"]["ingress"]["hosts"][0]["host"] == (
+        "shell--offline.apps.some.org.neu.ro"
+    )
+
+
+def test_render_values_rejects_foreign_types(cluster_config_path, tmp_path):
+    inputs_path = tmp_path / "inputs.json"
+    inputs_path.write_text(json.dumps({"preset": {"name": "cpu-small"}}))
+
+    result = CliRunner().invoke(
+        cli,
+        [
+            "render-values",
+            "shell",
+            str(inputs_path),
+            str(cluster_config_path),
+            "--preprocessor-type",
+            "JupyterChartValueProcessor",
+        ],
+    )
+
+    assert result.exit_code == 1
+
+
+def test_render_values_prints_only_json(cluster_config_path, tmp_path):
+    inputs_path = tmp_path / "inputs.json"
+    inputs_path.write_text(json.dumps({"preset": {"name": "cpu-small"}}))
+
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "apolo_app_types.cli",
+            "render-values",
+            "shell",
+            str(inputs_path),
+            str(cluster_config_path),
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "LOG_LEVEL": "INFO"},
+    )
+
+    rendered = json.loads(completed.stdout)
+    assert rendered["helm_args"] == ["--timeout", "15m", "--dependency-update"]
+    assert "INFO" in completed.stderr
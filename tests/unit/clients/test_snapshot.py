@@ -0,0 +1,192 @@
+import asyncio
+
+import pytest
+
+from apolo_app_types.clients.kube import (
+    INSTANCE_LABEL,
+    get_service_host_port,
+    get_services,
+)
+from apolo_app_types.clients.snapshot import (
+    SELECTOR_CHUNK_SIZE,
+    InstanceResourceSnapshot,
+    NamespaceResourceSnapshot,
+    ResourceIndex,
+    use_instance_snapshot,
+)
+from apolo_app_types.outputs.utils.ingress import get_ingress_host_port
+from apolo_app_types.outputs.weaviate import get_weaviate_outputs
+
+
+INSTANCE_ID = "test-app-instance-id"
+
+
+def _service(name: str, port: int, **labels: str) -> dict:
+    return {
+        "metadata": {
+            "name": name,
+            "namespace": "default-namespace",
+            "labels": {INSTANCE_LABEL: INSTANCE_ID, **labels},
+        },
+        "spec": {"ports": [{"port": port}]},
+    }
+
+
+def _ingress(name: str, host: str, **labels: str) -> dict:
+    return {
+        "metadata": {"name": name, "labels": {INSTANCE_LABEL: INSTANCE_ID, **labels}},
+        "spec": {"rules": [{"host": host}]},
+    }
+
+
+SERVICES = [
+    _service("weaviate", 80, application="weaviate"),
+    _service("weaviate-grpc", 443, application="weaviate"),
+    _service("metrics", 9090, application="metrics"),
+]
+INGRESSES = [_ingress("weaviate", "weaviate.apps.example.com", application="weaviate")]
+
+
+def test_resource_index_matches_all_labels():
+    index = ResourceIndex(SERVICES)
+
+    found = index.find({"application": "weaviate", INSTANCE_LABEL: INSTANCE_ID})
+
+    assert [s["metadata"]["name"] for s in found] == ["weaviate", "weaviate-grpc"]
+    assert index.find({"application": "missing"}) == []
+    assert index.get("metrics") is SERVICES[2]
+
+
+@pytest.mark.asyncio
+async def test_lookups_answered_from_snapshot(mock_kubernetes_client):
+    snapshot = InstanceResourceSnapshot.from_items(
+        INSTANCE_ID, services=SERVICES, ingresses=INGRESSES
+    )
+    labels = {"application": "metrics", INSTANCE_LABEL: INSTANCE_ID}
+
+    with use_instance_snapshot(snapshot):
+        host, port = await get_service_host_port(labels)
+        ingress = await get_ingress_host_port(labels)
+
+    assert (host, port) == ("metrics.default-namespace", "9090")
+    assert ingress is None
+    mock_kubernetes_client[
+        "mock_v1_instance"
+    ].list_namespaced_service.assert_not_called()
+    mock_kubernetes_client[
+        "mock_networking_instance"
+    ].list_namespaced_ingress.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_each_kind_listed_once(mock_kubernetes_client):
+    list_services = mock_kubernetes_client["mock_v1_instance"].list_namespaced_service
+    list_ingresses = mock_kubernetes_client[
+        "mock_networking_instance"
+    ].list_namespaced_ingress
+    list_services.side_effect = None
+    list_services.return_value = {"items": SERVICES}
+    list_ingresses.side_effect = None
+    list_ingresses.return_value = {"items": INGRESSES}
+
+    with use_instance_snapshot(InstanceResourceSnapshot(INSTANCE_ID)):
+        res = await get_weaviate_outputs({"ingress": {"enabled": True}}, INSTANCE_ID)
+        await asyncio.gather(
+            get_services({INSTANCE_LABEL: INSTANCE_ID}),
+            get_services({"application": "metrics", INSTANCE_LABEL: INSTANCE_ID}),
+        )
+
+    assert res["grpc_endpoint"]["internal_url"]["host"] == (
+        "weaviate-grpc.default-namespace"
+    )
+    assert res["rest_endpoint"]["external_url"]["host"] == "weaviate.apps.example.com"
+    list_services.assert_called_once_with(
+        namespace="default-namespace",
+        label_selector=f"{INSTANCE_LABEL}={INSTANCE_ID}",
+    )
+    list_ingresses.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_other_instances_bypass_snapshot(mock_kubernetes_client):
+    snapshot = InstanceResourceSnapshot.from_items(INSTANCE_ID, services=[])
+
+    with use_instance_snapshot(snapshot):
+        services = await get_services({INSTANCE_LABEL: "another-instance"})
+
+    assert services
+    mock_kubernetes_client[
+        "mock_v1_instance"
+    ].list_namespaced_service.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_namespace_snapshot_lists_each_kind_once(mock_kubernetes_client):
+    other = {
+        "metadata": {
+            "name": "other",
+            "namespace": "default-namespace",
+            "labels": {INSTANCE_LABEL: "other-instance"},
+        },
+        "spec": {"ports": [{"port": 8080}]},
+    }
+    list_services = mock_kubernetes_client["mock_v1_instance"].list_namespaced_service
+    list_ingresses = mock_kubernetes_client[
+        "mock_networking_instance"
+    ].list_namespaced_ingress
+    list_services.side_effect = None
+    list_services.return_value = {"items": [*SERVICES, other]}
+    list_ingresses.side_effect = None
+    list_ingresses.return_value = {"items": INGRESSES}
+
+    namespace_snapshot = NamespaceResourceSnapshot([INSTANCE_ID, "other-instance"])
+    await namespace_snapshot.prefetch()
+    with use_instance_snapshot(namespace_snapshot.for_instance("other-instance")):
+        other_services = await get_services({INSTANCE_LABEL: "other-instance"})
+    with use_instance_snapshot(namespace_snapshot.for_instance(INSTANCE_ID)):
+        res = await get_weaviate_outputs({"ingress": {"enabled": True}}, INSTANCE_ID)
+
+    assert other_services == [other]
+    assert res["rest_endpoint"]["external_url"]["host"] == "weaviate.apps.example.com"
+    list_services.assert_called_once_with(
+        namespace="default-namespace",
+        label_selector=f"{INSTANCE_LABEL} in (other-instance,{INSTANCE_ID})",
+    )
+    list_ingresses.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "instance_id",
+    ["", "a,b", "a) or (b", "-app", "app_", "a b", "x" * 64],
+)
+def test_namespace_snapshot_rejects_invalid_ids(instance_id):
+    with pytest.raises(ValueError, match="not a valid label value"):
+        NamespaceResourceSnapshot(["app-1", instance_id])
+
+
+@pytest.mark.asyncio
+async def test_namespace_snapshot_chunks_selectors(mock_kubernetes_client):
+    instance_ids = [f"app-{idx:03}" for idx in range(2 * SELECTOR_CHUNK_SIZE + 1)]
+    list_services = mock_kubernetes_client["mock_v1_instance"].list_namespaced_service
+    list_services.side_effect = lambda namespace, label_selector: {
+        "items": [
+            _service(instance_id, 80, **{INSTANCE_LABEL: instance_id})
+            for instance_id in label_selector.split("(")[1].rstrip(")").split(",")
+        ]
+    }
+
+    namespace_snapshot = NamespaceResourceSnapshot(reversed(instance_ids))
+    await namespace_snapshot.prefetch("services")
+
+    assert list_services.call_count == 3
+    selectors = [call.kwargs["label_selector"] for call in list_services.call_args_list]
+    assert sorted(selectors) == [
+        f"{INSTANCE_LABEL} in ({','.join(instance_ids[:SELECTOR_CHUNK_SIZE])})",
+        f"{INSTANCE_LABEL} in ({','.join(instance_ids[SELECTOR_CHUNK_SIZE:-1])})",
+        f"{INSTANCE_LABEL} in ({instance_ids[-1]})",
+    ]
+    for instance_id in instance_ids:
+        snapshot = namespace_snapshot.for_instance(instance_id)
+        assert [s["metadata"]["name"] for s in await snapshot.find_services({})] == [
+            instance_id
+        ]
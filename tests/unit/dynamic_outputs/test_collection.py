@@ -0,0 +1,146 @@
+import time
+from typing import Any
+
+import pytest
+
+from apolo_app_types.dynamic_outputs import (
+    BaseModelFilter,
+    DynamicAppFilterParams,
+    FilterCondition,
+    IndexedModelCollection,
+)
+
+
+class ModelFilter(BaseModelFilter):
+    or_groups = True
+    lookups = 0
+
+    def _get_field_value(self, model: dict[str, Any], field: str) -> Any:
+        ModelFilter.lookups += 1
+        return model.get(field)
+
+    def _matches_in_operator(self, value: Any, filter_value: str) -> bool:
+        if isinstance(value, list):
+            return any(filter_value.lower() == v.lower() for v in value)
+        return False
+
+
+def _catalog(size: int) -> list[dict[str, Any]]:
+    families = ["Llama", "Mistral", "Qwen", "Gemma", "Phi"]
+    return [
+        {
+            "name": f"{families[idx % 5]}-{idx}-Instruct",
+            "pipeline": "text-generation" if idx % 3 else "embeddings",
+            "gated": idx % 4 == 0,
+            "size": idx % 70,
+            "tags": ["chat", f"v{idx % 7}"] if idx % 2 else [f"v{idx % 7}"],
+        }
+        for idx in range(size)
+    ]
+
+
+MODELS = _catalog(500) + [{"name": None, "pipeline": 5, "tags": "chat"}]
+
+
+@pytest.fixture
+def collection() -> IndexedModelCollection[dict[str, Any]]:
+    return IndexedModelCollection(
+        MODELS,
+        ModelFilter,
+        eq_fields=["name", "pipeline", "gated", "size"],
+        in_fields=["tags"],
+        like_fields=["name", "Pipeline"],
+    )
+
+
+@pytest.mark.parametrize(
+    "filter_string",
+    [
+        None,
+        "name:eq:qwen-2-instruct",
+        "pipeline:eq:EMBEDDINGS,gated:eq:true",
+        "size:eq:7",
+        "tags:in:CHAT,tags:in:v3",
+        "name:like:llama,pipeline:like:text",
+        "name:like:ma-1",
+        "name:like:ll",
+        "name:like:zzz",
+        "name:ne:qwen-2-instruct,pipeline:like:emb",
+        "gated:eq:false,tags:in:v1,name:like:instruct",
+        "name:prefix:qwen-1",
+        "size:ge:65,tags:in:chat",
+        "name:eq:qwen-2-instruct|tags:in:v3,gated:eq:true",
+        "name:like:gemma|size:lt:2",
+        "tags:in:v2,sort:-size,sort:name",
+        "sort:name:desc",
+    ],
+)
+def test_matches_apply(collection, filter_string):
+    expected = ModelFilter(filter_string).apply(MODELS)
+
+    assert list(collection.iter_matches(filter_string)) == expected
+    for offset, limit in ((0, 10), (5, 3), (len(expected), 10)):
+        params = DynamicAppFilterParams(
+            filter=filter_string, offset=offset, limit=limit
+        )
+        assert collection.page(params) == expected[offset : offset + limit]
+
+
+def test_indexes_narrow_candidates(collection):
+    candidates = collection.candidates(ModelFilter("tags:in:v3,name:like:gemma"))
+
+    assert len(candidates) == len(
+        ModelFilter("tags:in:v3,name:like:gemma").apply(MODELS)
+    )
+    assert len(collection.candidates(ModelFilter("name:ne:x"))) == len(MODELS)
+
+
+def test_or_groups_narrow_to_union(collection):
+    filter_ = ModelFilter("name:eq:qwen-2-instruct|tags:in:v3,gated:eq:true")
+
+    candidates = collection.candidates(filter_)
+
+    assert len(candidates) == len(filter_.apply(MODELS))
+    assert len(collection.candidates(ModelFilter("tags:in:v3|size:gt:3"))) == len(
+        MODELS
+    )
+
+
+def test_pagination_is_lazy(collection):
+    ModelFilter.lookups = 0
+    matches = collection.iter_matches("name:ne:x", limit=5)
+    assert ModelFilter.lookups == 0
+
+    assert len(list(matches)) == 5
+    assert ModelFilter.lookups == 5
+
+
+def test_custom_matches_is_not_narrowed(collection):
+    class PrefixFilter(ModelFilter):
+        def _matches(self, model: Any, condition: FilterCondition) -> bool:
+            value = self._get_field_value(model, condition.field)
+            return str(value).lower().startswith(condition.value.lower())
+
+    names = [m["name"] for m in collection.iter_matches(PrefixFilter("name:eq:q"))]
+
+    assert names
+    assert all(name.startswith("Qwen") for name in names)
+
+
+def test_page_benchmark():
+    models = _catalog(50_000)
+    catalog = IndexedModelCollection(
+        models, ModelFilter, in_fields=["tags"], like_fields=["name"]
+    )
+    params = DynamicAppFilterParams(filter="tags:in:v3,name:like:gemma-1", limit=100)
+
+    start = time.perf_counter()
+    expected = ModelFilter(params.filter).apply(models)[: params.limit]
+    full_scan = time.perf_counter() - start
+
+    start = time.perf_counter()
+    page = catalog.page(params)
+    indexed = time.perf_counter() - start
+
+    assert page == expected
+    assert indexed * 5 < full_scan, {"indexed": indexed, "full_scan": full_scan}
@@ -0,0 +1,319 @@
+import datetime as dt
+import time
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from apolo_app_types.dynamic_outputs import (
+    BaseModelFilter,
+    FieldValueCache,
+    FilterCondition,
+    FilterOperator,
+    ParsedCondition,
+    ParsedSortKey,
+    SortKey,
+    parse_filter,
+    parse_filter_expression,
+    parse_filter_string,
+)
+
+
+class DictFilter(BaseModelFilter):
+    or_groups = True
+
+    def __init__(self, filter_string: str | None) -> None:
+        super().__init__(filter_string)
+        self.lookups = 0
+
+    def _get_field_value(self, model: dict[str, Any], field: str) -> Any:
+        self.lookups += 1
+        return model.get(field)
+
+    def _matches_in_operator(self, value: Any, filter_value: str) -> bool:
+        if isinstance(value, list):
+            return any(filter_value.lower() == v.lower() for v in value)
+        return False
+
+
+MODELS: list[dict[str, Any]] = [
+    {"name": "Llama-3-8B", "size": 8, "score": 0.5, "gated": True, "tags": ["Chat"]},
+    {"name": "llama-3-70b", "size": 70, "score": 1.5, "gated": False, "tags": []},
+    {"name": "Mistral-7B", "size": 7, "score": 0.5, "tags": ["chat", "base"]},
+    {"name": "bert-base", "size": None, "gated": True, "tags": ["base"]},
+]
+
+
+def _reference(filter_: BaseModelFilter, models: list[Any]) -> list[Any]:
+    """Condition-by-condition evaluation through _matches()."""
+    groups = filter_.condition_groups()
+    if not groups:
+        return models
+    return [
+        model
+        for model in models
+        if any(
+            all(filter_._matches(model, condition) for condition in conditions)
+            for conditions in groups
+        )
+    ]
+
+
+@pytest.mark.parametrize(
+    "filter_string",
+    [
+        "name:like:LLAMA",
+        "name:eq:mistral-7b",
+        "name:ne:mistral-7b",
+        "size:eq:70",
+        "size:eq:seventy",
+        "size:ne:8",
+        "score:eq:0.5",
+        "gated:eq:TRUE",
+        "tags:in:chat",
+        "name:like:llama,gated:eq:false",
+        "tags:in:base,size:ne:7,name:like:e",
+        "missing:ne:x,missing:eq:x",
+        "name:prefix:LLAMA-3",
+        "size:gt:7",
+        "size:ge:8,size:le:8",
+        "size:lt:7.5",
+        "score:gt:1",
+        "size:gt:big",
+        "gated:gt:false",
+        "name:ge:m",
+        "tags:gt:a",
+        "name:eq:bert-base|size:gt:10",
+        "tags:in:chat,size:lt:8|missing:ne:x",
+    ],
+)
+def test_compiled_plan_matches_reference(filter_string):
+    filter_ = DictFilter(filter_string)
+
+    assert filter_.apply(MODELS) == _reference(filter_, MODELS)
+    assert filter_.apply(MODELS, value_cache=FieldValueCache()) == _reference(
+        filter_, MODELS
+    )
+
+
+def test_single_pass_short_circuits():
+    filter_ = DictFilter("name:eq:bert-base,tags:in:base,gated:eq:true")
+
+    result = filter_.apply(MODELS)
+
+    assert result == [MODELS[3]]
+    # every model is read once for the first condition, only bert for the rest
+    assert filter_.lookups == len(MODELS) + 2
+
+
+def test_parse_is_backward_compatible():
+    conditions = parse_filter_string("name:like:llama,tags:in:chat,bad,x:op:y")
+
+    assert conditions == [
+        FilterCondition(field="name", operator=FilterOperator.LIKE, value="llama"),
+        FilterCondition(field="tags", operator=FilterOperator.IN, value="chat"),
+    ]
+    expression = parse_filter_expression("name:like:llama,tags:in:chat")
+    assert expression.groups == [conditions]
+    assert expression.sort == []
+
+
+def test_parse_or_groups_and_sort_keys():
+    expression = parse_filter_expression(
+        "size:ge:7,sort:-size|name:prefix:llama,sort:name:asc,sort:score:desc|,",
+        or_groups=True,
+    )
+
+    assert expression.groups == [
+        [FilterCondition(field="size", operator=FilterOperator.GE, value="7")],
+        [FilterCondition(field="name", operator=FilterOperator.PREFIX, value="llama")],
+    ]
+    assert expression.sort == [
+        SortKey(field="size", descending=True),
+        SortKey(field="name"),
+        SortKey(field="score", descending=True),
+    ]
+    # a field named sort is still filterable
+    assert parse_filter_expression("sort:eq:x").groups == [
+        [FilterCondition(field="sort", operator=FilterOperator.EQ, value="x")]
+    ]
+    assert parse_filter_string("size:gt:7,sort:size") == [
+        FilterCondition(field="size", operator=FilterOperator.GT, value="7")
+    ]
+
+
+class PlainDictFilter(DictFilter):
+    or_groups = False
+
+
+def test_pipe_is_literal_without_or_groups():
+    models = [{"name": "a|b"}, {"name": "a"}, {"name": "b"}]
+
+    assert PlainDictFilter("name:eq:a|b").apply(models) == models[:1]
+    assert PlainDictFilter("name:like:|").apply(models) == models[:1]
+    assert parse_filter_expression("name:eq:a|b").groups == [
+        [FilterCondition(field="name", operator=FilterOperator.EQ, value="a|b")]
+    ]
+    # OR filters read "|" as a separator unless it is escaped
+    assert DictFilter("name:eq:a|name:eq:b").apply(models) == models[1:]
+    assert DictFilter(r"name:eq:a\|b").apply(models) == models[:1]
+    assert DictFilter(r"name:eq:b|name:eq:a\|b").apply(models) == [
+        models[0],
+        models[2],
+    ]
+
+
+@pytest.mark.parametrize("invalid", ["bad", "x:op:y", "a:b,c", ""])
+def test_invalid_or_group_does_not_change_results(invalid):
+    expected = DictFilter("tags:in:base").apply(MODELS)
+
+    assert DictFilter(f"tags:in:base|{invalid}").apply(MODELS) == expected
+    assert DictFilter(f"{invalid}|tags:in:base").apply(MODELS) == expected
+
+
+def test_assigned_conditions_replace_or_groups():
+    filter_ = DictFilter("name:like:llama|tags:in:base,sort:name")
+    assert len(filter_.condition_groups()) == 2
+
+    filter_.conditions = [ParsedCondition("name", FilterOperator.EQ, "bert-base")]
+
+    assert filter_.groups == [[ParsedCondition("name", FilterOperator.EQ, "bert-base")]]
+    assert filter_.apply(MODELS) == [MODELS[3]]
+    filter_.conditions = []
+    assert filter_.groups == []
+    assert [m["name"] for m in filter_.apply(MODELS)][0] == "bert-base"
+
+
+def test_single_group_conditions_changed_in_place():
+    filter_ = DictFilter("name:like:llama")
+
+    filter_.conditions.append(ParsedCondition("size", FilterOperator.GT, "10"))
+
+    assert filter_.apply(MODELS) == [MODELS[1]]
+
+
+def test_cached_parser_returns_shared_immutable_tuples():
+    filter_string = "name:like:llama,size:gt:7|tags:in:chat,sort:-size"
+    parse_filter.cache_clear()
+
+    first = parse_filter(filter_string, or_groups=True)
+    second = parse_filter(filter_string, or_groups=True)
+
+    assert second is first
+    assert parse_filter.cache_info().hits == 1
+    assert first.groups == (
+        (
+            ParsedCondition("name", FilterOperator.LIKE, "llama"),
+            ParsedCondition("size", FilterOperator.GT, "7"),
+        ),
+        (ParsedCondition("tags", FilterOperator.IN, "chat"),),
+    )
+    assert first.sort == (ParsedSortKey("size", descending=True),)
+    condition = first.groups[0][0]
+    assert not hasattr(condition, "__dict__")
+    with pytest.raises(AttributeError):
+        condition.value = "mistral"  # type: ignore[misc]
+
+
+def test_filter_construction_skips_pydantic():
+    with patch(
+        "apolo_app_types.dynamic_outputs.filters.FilterCondition",
+        side_effect=AssertionError("validated"),
+    ):
+        filter_ = DictFilter("name:like:llama|tags:in:base,sort:name")
+
+    assert [m["name"] for m in filter_.apply(MODELS)] == [
+        "bert-base",
+        "llama-3-70b",
+        "Llama-3-8B",
+        "Mistral-7B",
+    ]
+    # filters sharing a cached parse can't affect each other
+    filter_.conditions.clear()
+    assert DictFilter("name:like:llama|tags:in:base,sort:name").conditions
+
+
+def test_sort_keys():
+    names = [m["name"] for m in DictFilter("sort:-size,sort:name").apply(MODELS)]
+    assert names == ["llama-3-70b", "Llama-3-8B", "Mistral-7B", "bert-base"]
+
+    names = [m["name"] for m in DictFilter("sort:score,sort:-name").apply(MODELS)]
+    assert names == ["Mistral-7B", "Llama-3-8B", "llama-3-70b", "bert-base"]
+
+    filtered = DictFilter("tags:in:base|gated:eq:true,sort:name:desc").apply(MODELS)
+    assert [m["name"] for m in filtered] == ["Mistral-7B", "Llama-3-8B", "bert-base"]
+
+
+def test_ordering_compares_dates():
+    models = [
+        {"created": dt.date(2024, 5, 1)},
+        {"created": dt.datetime(2025, 1, 2, tzinfo=dt.UTC)},
+        {"created": dt.datetime(2023, 1, 2)},
+    ]
+
+    assert DictFilter("created:ge:2024-01-01").apply(models) == models[:2]
+    assert DictFilter("created:lt:2024-01-01").apply(models) == models[2:]
+    assert DictFilter("created:gt:yesterday").apply(models) == []
+
+
+def test_value_cache_reused_across_calls():
+    cache = FieldValueCache()
+
+    DictFilter("name:like:llama").apply(MODELS, value_cache=cache)
+    assert len(cache) == len(MODELS)
+    DictFilter("name:eq:bert-base").apply(MODELS, value_cache=cache)
+    assert len(cache) == len(MODELS)
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_subclass_matches_override_is_honoured():
+    class PrefixFilter(DictFilter):
+        def _matches(self, model: Any, condition: FilterCondition) -> bool:
+            return str(self._get_field_value(model, condition.field)).startswith(
+                condition.value
+            )
+
+    assert PrefixFilter("name:like:llama").apply(MODELS) == [MODELS[1]]
+
+
+def _best_of(runs: int, func: Any) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def test_cached_parse_benchmark():
+    filter_string = "name:like:llama,tags:in:chat|size:ge:7,sort:-size"
+
+    def validated() -> None:
+        for _ in range(2000):
+            parse_filter_expression(filter_string, or_groups=True)
+
+    def cached() -> None:
+        for _ in range(2000):
+            DictFilter(filter_string)
+
+    assert _best_of(3, cached) * 3 < _best_of(3, validated)
+
+
+def test_compiled_plan_benchmark():
+    class PlainFilter(DictFilter):
+        def _get_field_value(self, model: dict[str, Any], field: str) -> Any:
+            return model.get(field)
+
+    models = [
+        {"name": f"Model-{idx}-Instruct", "size": idx % 100, "tags": ["chat"]}
+        for idx in range(20_000)
+    ]
+    filter_ = PlainFilter("name:like:instruct,name:ne:model-7-instruct,size:ne:3")
+
+    assert filter_.apply(models) == _reference(filter_, models)
+    reference = _best_of(5, lambda: _reference(filter_, models))
+    compiled = _best_of(5, lambda: filter_.apply(models))
+
+    assert compiled < reference, {"compiled": compiled, "reference": reference}
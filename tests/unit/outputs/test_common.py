@@ -0,0 +1,56 @@
+import threading
+
+import pytest
+
+from apolo_app_types.outputs.common import get_internal_external_web_urls
+from apolo_app_types.outputs.lightrag import get_lightrag_outputs
+from apolo_app_types.outputs.mlflow import get_mlflow_outputs
+
+
+@pytest.mark.asyncio
+async def test_service_and_ingress_lookups_overlap(mock_kubernetes_client):
+    """Both blocking kube calls must be in flight at the same time."""
+    barrier = threading.Barrier(2, timeout=5)
+    list_services = mock_kubernetes_client["mock_v1_instance"].list_namespaced_service
+    list_ingresses = mock_kubernetes_client[
+        "mock_networking_instance"
+    ].list_namespaced_ingress
+    services_side_effect = list_services.side_effect
+    ingresses_side_effect = list_ingresses.side_effect
+
+    def list_services_in_parallel(**kwargs):
+        barrier.wait()
+        return services_side_effect(**kwargs)
+
+    def list_ingresses_in_parallel(**kwargs):
+        barrier.wait()
+        return ingresses_side_effect(**kwargs)
+
+    list_services.side_effect = list_services_in_parallel
+    list_ingresses.side_effect = list_ingresses_in_parallel
+
+    internal, external = await get_internal_external_web_urls(
+        {"application": "app", "app.kubernetes.io/instance": "instance"}
+    )
+
+    assert internal is not None
+    assert internal.host == "app.default-namespace"
+    assert external is not None
+    assert external.host == "example.com"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("generator", [get_lightrag_outputs, get_mlflow_outputs])
+async def test_service_and_ingress_looked_up_once(
+    setup_clients, mock_kubernetes_client, app_instance_id, generator
+):
+    outputs = await generator({}, app_instance_id)
+
+    assert outputs["app_url"]["internal_url"] is not None
+    assert outputs["server_url"]["internal_url"] is not None
+    mock_kubernetes_client[
+        "mock_v1_instance"
+    ].list_namespaced_service.assert_called_once()
+    mock_kubernetes_client[
+        "mock_networking_instance"
+    ].list_namespaced_ingress.assert_called_once()
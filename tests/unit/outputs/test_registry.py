@@ -0,0 +1,111 @@
+import subprocess
+import sys
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from apolo_app_types.app_types import AppType
+from apolo_app_types.outputs import registry
+from apolo_app_types.outputs.llm import get_llm_inference_outputs
+from apolo_app_types.outputs.registry import (
+    get_outputs_generator,
+    register_outputs_generator,
+    unregister_outputs_generator,
+)
+from apolo_app_types.outputs.update_outputs import generate_app_outputs
+from apolo_app_types.outputs.weaviate import get_weaviate_outputs
+
+
+CUSTOM_APP_TYPE = "custom-registry-test-app"
+
+
+@pytest.fixture(autouse=True)
+def _cleanup_registry():
+    yield
+    unregister_outputs_generator(CUSTOM_APP_TYPE)
+
+
+def test_builtin_generators_resolve():
+    assert get_outputs_generator(AppType.Weaviate) is get_weaviate_outputs
+    assert get_outputs_generator("weaviate") is get_weaviate_outputs
+    for app_type in (AppType.Llama4, AppType.DeepSeek, AppType.GptOss):
+        assert get_outputs_generator(app_type) is get_llm_inference_outputs
+    for app_type in registry.registered_app_types():
+        assert callable(get_outputs_generator(app_type))
+
+
+def test_unknown_app_type():
+    assert get_outputs_generator(CUSTOM_APP_TYPE) is None
+
+
+def test_only_requested_generator_module_is_imported():
+    code = (
+        "import sys\n"
+        "from apolo_app_types.outputs import update_outputs, registry\n"
+        "modules = {ref.partition(':')[0] "
+        "for ref in registry._BUILTIN_GENERATORS.values()}\n"
+        "before = modules & set(sys.modules)\n"
+        "registry.get_outputs_generator('shell')\n"
+        "print(sorted(before), sorted(modules & set(sys.modules)))\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+
+    assert out.strip() == "[] ['apolo_app_types.outputs.shell']"
+
+
+def test_register_and_replace():
+    generator = AsyncMock(return_value={"ok": True})
+    register_outputs_generator(CUSTOM_APP_TYPE, generator)
+
+    assert get_outputs_generator(CUSTOM_APP_TYPE) is generator
+    with pytest.raises(ValueError, match="already registered"):
+        register_outputs_generator(CUSTOM_APP_TYPE, generator)
+
+    register_outputs_generator(
+        CUSTOM_APP_TYPE,
+        "apolo_app_types.outputs.weaviate:get_weaviate_outputs",
+        replace=True,
+    )
+    assert get_outputs_generator(CUSTOM_APP_TYPE) is get_weaviate_outputs
+
+
+def test_invalid_reference():
+    register_outputs_generator(CUSTOM_APP_TYPE, "apolo_app_types.outputs.weaviate")
+
+    with pytest.raises(ValueError, match="expected 'module:attribute'"):
+        get_outputs_generator(CUSTOM_APP_TYPE)
+
+
+def test_generator_from_entry_point():
+    generator = AsyncMock()
+    entry_point = MagicMock()
+    entry_point.load.return_value = generator
+
+    with patch.object(
+        registry, "entry_points", return_value=[entry_point]
+    ) as entry_points:
+        assert get_outputs_generator(CUSTOM_APP_TYPE) is generator
+        assert get_outputs_generator(CUSTOM_APP_TYPE) is generator
+
+    entry_points.assert_called_once_with(
+        group=registry.ENTRY_POINT_GROUP, name=CUSTOM_APP_TYPE
+    )
+
+
+@pytest.mark.asyncio
+async def test_generate_app_outputs_uses_registered_generator():
+    generator = AsyncMock(return_value={"url": "https://example.com"})
+    register_outputs_generator(CUSTOM_APP_TYPE, generator)
+
+    outputs = await generate_app_outputs({"key": "value"}, CUSTOM_APP_TYPE, "app-id")
+
+    assert outputs == {"url": "https://example.com"}
+    generator.assert_awaited_once_with({"key": "value"}, "app-id")
+
+
+@pytest.mark.asyncio
+async def test_generate_app_outputs_unsupported_type():
+    with pytest.raises(ValueError, match="Unsupported app type"):
+        await generate_app_outputs({}, CUSTOM_APP_TYPE, "app-id")
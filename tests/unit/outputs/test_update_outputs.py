@@ -0,0 +1,199 @@
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from apolo_app_types.clients.kube import INSTANCE_LABEL
+from apolo_app_types.clients.snapshot import get_active_snapshot
+from apolo_app_types.outputs import update_outputs
+from apolo_app_types.outputs.update_outputs import (
+    PostOutputsResult,
+    RetryPolicy,
+    parse_retry_after,
+    post_outputs,
+    update_apps_outputs,
+)
+
+
+API_URL = "https://apps.example.com/outputs"
+
+
+@pytest.fixture
+def responses():
+    """Queue of responses (or exceptions) served to post_outputs, in order."""
+    queue: list[httpx.Response | Exception] = []
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        item = queue.pop(0)
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    real_client = httpx.AsyncClient
+
+    def make_client(**kwargs):
+        return real_client(transport=httpx.MockTransport(handler), **kwargs)
+
+    with (
+        patch.object(update_outputs.httpx, "AsyncClient", side_effect=make_client),
+        patch.object(update_outputs.asyncio, "sleep", new_callable=AsyncMock) as sleep,
+    ):
+        yield queue, requests, sleep
+
+
+@pytest.mark.asyncio
+async def test_success_on_first_attempt(responses):
+    queue, requests, sleep = responses
+    queue.append(httpx.Response(200))
+
+    result = await post_outputs(API_URL, "token", {"a": 1})
+
+    assert result == PostOutputsResult(ok=True, attempts=1, status_code=200)
+    assert result.exit_code == 0
+    assert requests[0].headers["Authorization"] == "Bearer token"
+    sleep.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_fatal_status_fails_without_retry(responses):
+    queue, requests, sleep = responses
+    queue.append(httpx.Response(401, text="bad token"))
+
+    result = await post_outputs(API_URL, "token", {})
+
+    assert not result.ok
+    assert result.exit_code == 1
+    assert (result.attempts, result.status_code) == (1, 401)
+    assert result.error == "HTTP 401: bad token"
+    assert len(requests) == 1
+    sleep.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_retryable_errors_back_off_exponentially(responses):
+    queue, _, sleep = responses
+    queue.extend(
+        [
+            httpx.Response(503),
+            httpx.ConnectError("refused"),
+            httpx.Response(502),
+            httpx.Response(200),
+        ]
+    )
+    policy = RetryPolicy(base_delay=1.0, max_delay=3.0, jitter=0.0)
+
+    result = await post_outputs(API_URL, "token", {}, policy=policy)
+
+    assert result.ok
+    assert result.attempts == 4
+    assert [c.args[0] for c in sleep.call_args_list] == [1.0, 2.0, 3.0]
+
+
+@pytest.mark.asyncio
+async def test_retry_after_is_honoured(responses):
+    queue, _, sleep = responses
+    queue.extend(
+        [httpx.Response(429, headers={"Retry-After": "7"}), httpx.Response(200)]
+    )
+
+    result = await post_outputs(
+        API_URL, "token", {}, policy=RetryPolicy(base_delay=1.0, jitter=0.0)
+    )
+
+    assert result.ok
+    sleep.assert_called_once_with(7.0)
+
+
+@pytest.mark.asyncio
+async def test_gives_up_when_next_retry_passes_deadline(responses):
+    queue, requests, sleep = responses
+    queue.append(httpx.Response(429, headers={"Retry-After": "120"}))
+
+    result = await post_outputs(API_URL, "token", {}, policy=RetryPolicy(deadline=60))
+
+    assert not result.ok
+    assert (result.attempts, result.status_code) == (1, 429)
+    assert len(requests) == 1
+    sleep.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_exhausted_attempts(responses):
+    queue, requests, sleep = responses
+    queue.extend([httpx.Response(500)] * 3)
+
+    result = await post_outputs(
+        API_URL, "token", {}, policy=RetryPolicy(max_attempts=3, jitter=0.0)
+    )
+
+    assert not result.ok
+    assert (result.attempts, result.status_code) == (3, 500)
+    assert len(requests) == 3
+    assert sleep.call_count == 2
+
+
+def test_backoff_jitter_stays_within_bounds():
+    policy = RetryPolicy(base_delay=2.0, max_delay=100.0, jitter=0.5)
+
+    delays = [policy.backoff(3) for _ in range(100)]
+
+    assert all(4.0 <= delay <= 8.0 for delay in delays)
+
+
+def test_parse_retry_after():
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("12") == 12.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("not a date") is None
+
+
+@pytest.mark.asyncio
+async def test_batch_update_shares_one_snapshot(responses):
+    queue, requests, _ = responses
+    queue.extend([httpx.Response(200), httpx.Response(503)])
+    instances = {
+        f"inst-{i}": {
+            "PLATFORM_APPS_APP_TYPE": "fake",
+            "PLATFORM_APPS_URL": f"{API_URL}/{i}",
+            "PLATFORM_APPS_TOKEN": "token",
+        }
+        for i in range(2)
+    }
+    instances["broken"] = {"PLATFORM_APPS_APP_TYPE": "fake"}
+    seen_snapshots = {}
+
+    async def generate(helm_outputs, app_type, app_instance_id):
+        seen_snapshots[app_instance_id] = get_active_snapshot(
+            {INSTANCE_LABEL: app_instance_id}
+        )
+        return {"instance": app_instance_id}
+
+    with (
+        patch.object(
+            update_outputs.NamespaceResourceSnapshot, "prefetch", AsyncMock()
+        ) as prefetch,
+        patch.object(update_outputs, "generate_app_outputs", side_effect=generate),
+    ):
+        results = await update_apps_outputs(
+            instances,
+            max_concurrency=1,
+            retry_policy=RetryPolicy(max_attempts=1),
+        )
+
+    prefetch.assert_awaited_once()
+    assert results["inst-0"].ok
+    assert not results["inst-1"].ok
+    assert results["broken"] == PostOutputsResult(
+        ok=False, attempts=0, error="KeyError: 'PLATFORM_APPS_URL'"
+    )
+    assert set(seen_snapshots) == {"inst-0", "inst-1"}
+    assert all(snapshot is not None for snapshot in seen_snapshots.values())
+    assert sorted(str(r.url) for r in requests) == [f"{API_URL}/0", f"{API_URL}/1"]
+
+
+@pytest.mark.asyncio
+async def test_batch_update_rejects_bad_concurrency():
+    with pytest.raises(ValueError, match="max_concurrency"):
+        await update_apps_outputs({}, max_concurrency=0)
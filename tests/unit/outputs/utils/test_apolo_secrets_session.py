@@ -0,0 +1,99 @@
+"""Unit tests for sharing one apolo_sdk client across secret helpers."""
+
+from __future__ import annotations
+
+import contextlib
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from apolo_app_types.outputs.utils.apolo_secrets import (
+    apolo_secrets_session,
+    create_apolo_secret,
+    create_apolo_secrets,
+    delete_apolo_secret,
+    get_apolo_secret,
+)
+from apolo_app_types.protocols.common import ApoloSecret
+
+
+@pytest.fixture
+def sdk_client():
+    client = MagicMock()
+    client.secrets.add = AsyncMock()
+    client.secrets.rm = AsyncMock()
+    client.secrets.get = AsyncMock(return_value=b"value")
+    opened = {"n": 0}
+
+    @contextlib.asynccontextmanager
+    async def fake_get():
+        opened["n"] += 1
+        yield client
+
+    with patch("apolo_sdk.get", side_effect=fake_get):
+        yield client, opened
+
+
+@pytest.mark.asyncio
+async def test_without_session_each_call_opens_client(sdk_client):
+    _, opened = sdk_client
+
+    await create_apolo_secret("app-1", "password", "p")
+    await get_apolo_secret("app-1", "password")
+
+    assert opened["n"] == 2
+
+
+@pytest.mark.asyncio
+async def test_session_reuses_one_client(sdk_client):
+    client, opened = sdk_client
+
+    async with apolo_secrets_session():
+        await create_apolo_secret("app-1", "password", "p")
+        await create_apolo_secret("app-1", "token", "t")
+        assert await get_apolo_secret("app-1", "token") == "value"
+        await delete_apolo_secret("app-1", "password")
+
+    assert opened["n"] == 1
+    assert client.secrets.add.call_count == 2
+    client.secrets.rm.assert_called_once_with(key="password-app-1")
+
+
+@pytest.mark.asyncio
+async def test_unused_session_opens_nothing(sdk_client):
+    _, opened = sdk_client
+
+    async with apolo_secrets_session():
+        pass
+
+    assert opened["n"] == 0
+
+
+@pytest.mark.asyncio
+async def test_session_with_explicit_client(sdk_client):
+    _, opened = sdk_client
+    explicit = MagicMock()
+    explicit.secrets.add = AsyncMock()
+
+    async with apolo_secrets_session(explicit):
+        await create_apolo_secret("app-1", "password", "p")
+
+    assert opened["n"] == 0
+    explicit.secrets.add.assert_called_once_with(key="password-app-1", value=b"p")
+
+
+@pytest.mark.asyncio
+async def test_bulk_create(sdk_client):
+    client, opened = sdk_client
+
+    secrets = await create_apolo_secrets(
+        "app-1", {"password": "p", "api-key": "k", "token": "t"}
+    )
+
+    assert secrets == {
+        "password": ApoloSecret(key="password-app-1"),
+        "api-key": ApoloSecret(key="api-key-app-1"),
+        "token": ApoloSecret(key="token-app-1"),
+    }
+    assert opened["n"] == 1
+    assert client.secrets.add.call_count == 3
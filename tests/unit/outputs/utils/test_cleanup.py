@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -7,6 +8,7 @@ from tenacity import RetryError
 from apolo_app_types.outputs.utils.cleanup import (
     cleanup_secrets,
     delete_secret_with_retry,
+    delete_secrets,
     get_app_outputs,
 )
 from apolo_app_types.protocols.common import ApoloSecret, AppOutputs
@@ -235,3 +237,77 @@ class TestGetAppOutputs:
         )
 
         assert result is None
+
+
+class TestConcurrentCleanup:
+    """Tests for concurrent secret deletion."""
+
+    @pytest.mark.asyncio
+    async def test_deletions_overlap_up_to_limit(self, mock_apolo_client):
+        in_flight = 0
+        peak = 0
+
+        async def slow_rm(key):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        mock_apolo_client.secrets.rm.side_effect = slow_rm
+
+        summary = await delete_secrets(
+            [f"secret-{i}" for i in range(10)], mock_apolo_client, max_concurrency=3
+        )
+
+        assert peak == 3
+        assert sorted(summary.deleted) == sorted(f"secret-{i}" for i in range(10))
+        assert summary.ok
+
+    @pytest.mark.asyncio
+    async def test_summary_reports_failures(self, mock_apolo_client, monkeypatch):
+        async def failing_delete(secret_key, client):
+            if secret_key == "broken":
+                msg = "permission denied"
+                raise RuntimeError(msg)
+
+        monkeypatch.setattr(
+            "apolo_app_types.outputs.utils.cleanup.delete_secret_with_retry",
+            failing_delete,
+        )
+
+        summary = await delete_secrets(["ok-1", "broken", "ok-2"], mock_apolo_client)
+
+        assert sorted(summary.deleted) == ["ok-1", "ok-2"]
+        assert summary.failed == {"broken": "permission denied"}
+        assert not summary.ok
+
+    @pytest.mark.asyncio
+    async def test_duplicate_keys_deleted_once(self, mock_apolo_client):
+        summary = await delete_secrets(["a", "b", "a"], mock_apolo_client)
+
+        assert mock_apolo_client.secrets.rm.call_count == 2
+        assert sorted(summary.deleted) == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_cleanup_secrets_returns_summary(
+        self, complete_app_outputs, mock_apolo_client
+    ):
+        mock_apolo_client.apps.get_output.return_value = (
+            complete_app_outputs.model_dump()
+        )
+
+        summary = await cleanup_secrets(
+            app_id="test-app-123",
+            output_class=MockAppOutputs,
+            client=mock_apolo_client,
+            max_concurrency=2,
+        )
+
+        assert len(summary.deleted) == 4
+        assert summary.ok
+
+    @pytest.mark.asyncio
+    async def test_rejects_non_positive_concurrency(self, mock_apolo_client):
+        with pytest.raises(ValueError, match="max_concurrency"):
+            await delete_secrets(["a"], mock_apolo_client, max_concurrency=0)
@@ -0,0 +1,83 @@
+import importlib
+from unittest.mock import patch
+
+import pytest
+
+from apolo_app_types import AppOutputs, WeaviateInputs, WeaviateOutputs
+from apolo_app_types.operations import load_preprocessor
+from apolo_app_types.outputs.utils import discovery
+from apolo_app_types.outputs.utils.discovery import (
+    clear_component_cache,
+    load_app_inputs,
+    load_app_outputs,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_component_cache()
+    yield
+    clear_component_cache()
+
+
+def test_resolves_package_without_scanning_sys_path():
+    with patch("pkgutil.iter_modules", side_effect=AssertionError("scanned")):
+        outputs_cls = load_app_outputs("weaviate", "apolo_app_types", "WeaviateOutputs")
+        inputs_cls = load_app_inputs("weaviate", "apolo_app_types", "WeaviateInputs")
+
+    assert outputs_cls is WeaviateOutputs
+    assert inputs_cls is WeaviateInputs
+
+
+def test_missing_package_returns_none():
+    assert load_app_outputs("missing", "apolo_apps_does_not_exist") is None
+    assert load_app_outputs("missing", "apolo_apps_missing.nested") is None
+
+
+@pytest.mark.parametrize("package_name", [None, ""])
+def test_no_package_name_returns_none(package_name):
+    assert load_app_inputs("weaviate", package_name) is None
+    assert load_app_outputs("weaviate", package_name, "WeaviateOutputs") is None
+
+
+def test_no_package_name_reports_missing_inputs():
+    with pytest.raises(ValueError, match="Unable to find inputs type"):
+        load_preprocessor("weaviate", None, {})
+
+
+def test_multiple_matches_raise():
+    with pytest.raises(ValueError, match="Multiple components found"):
+        load_app_outputs("any", "apolo_app_types")
+
+
+def test_package_imported_and_scanned_once():
+    with (
+        patch.object(
+            discovery.importlib,
+            "import_module",
+            wraps=importlib.import_module,
+        ) as import_module,
+        patch.object(
+            discovery.inspect,
+            "getmembers",
+            wraps=discovery.inspect.getmembers,
+        ) as getmembers,
+    ):
+        for _ in range(3):
+            load_app_outputs("weaviate", "apolo_app_types", "WeaviateOutputs")
+            load_app_inputs("weaviate", "apolo_app_types", "WeaviateInputs")
+
+    import_module.assert_called_once_with("apolo_app_types")
+    getmembers.assert_called_once()
+
+
+def test_component_results_cached_per_key():
+    first = discovery._resolve_components(
+        "apolo_app_types", AppOutputs, "WeaviateOutputs"
+    )
+    second = discovery._resolve_components(
+        "apolo_app_types", AppOutputs, "WeaviateOutputs"
+    )
+
+    assert first is second
+    assert first == (WeaviateOutputs,)
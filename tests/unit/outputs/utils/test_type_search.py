@@ -1,7 +1,11 @@
 """Tests for type search utilities."""
 
-from pydantic import BaseModel
+import typing as t
+from unittest.mock import patch
 
+from pydantic import BaseModel, ConfigDict
+
+from apolo_app_types.outputs.utils import type_search
 from apolo_app_types.outputs.utils.type_search import (
     find_instances_recursive,
     find_instances_recursive_simple,
@@ -292,3 +296,103 @@ class TestFindInstancesRecursiveSimple:
         assert len(results) == 5
         values = {r.value for r in results}
         assert values == {"1", "2", "3", "4", "5"}
+
+
+class ScalarModel(BaseModel):
+    """Model whose fields can never hold the target type."""
+
+    name: str
+    count: int = 0
+    mode: t.Literal["a", "b"] = "a"
+    tags: list[str] = []
+    labels: dict[str, str] = {}
+
+
+class MixedModel(BaseModel):
+    """Model mixing scalar, model-typed and untyped fields."""
+
+    name: str = "mixed"
+    scalars: ScalarModel | None = None
+    base: BaseModel | None = None
+    anything: dict[str, t.Any] = {}
+    target: TargetType | None = None
+
+
+class SubclassedScalarModel(ScalarModel):
+    """Subclass adding a target-typed field to a scalar-only model."""
+
+    target: TargetType | None = None
+
+
+class ExtraModel(BaseModel):
+    """Model accepting extra fields."""
+
+    model_config = ConfigDict(extra="allow")
+
+    name: str = "extra"
+
+
+class TestFieldLocator:
+    """Tests for the per-class field locator used to prune the search."""
+
+    def test_locator_skips_fields_that_cannot_hold_target(self):
+        """Test that scalar, literal and scalar container fields are skipped."""
+        assert type_search._get_field_locator(ScalarModel, TargetType) == ()
+        assert type_search._get_field_locator(MixedModel, TargetType) == (
+            "scalars",
+            "base",
+            "anything",
+            "target",
+        )
+
+    def test_locator_depends_on_target_type(self):
+        """Test that fields assignable to the target type are kept."""
+        assert type_search._get_field_locator(ScalarModel, str) == (
+            "name",
+            "mode",
+            "tags",
+            "labels",
+        )
+
+    def test_skipped_fields_are_not_visited(self):
+        """Test that values of pruned fields are never searched."""
+        model = MixedModel(
+            scalars=ScalarModel(name="s", tags=["x", "y"]),
+            target=TargetType(value="t"),
+        )
+
+        with patch.object(
+            type_search,
+            "find_instances_recursive",
+            wraps=type_search.find_instances_recursive,
+        ) as search:
+            results = type_search.find_instances_recursive(model, TargetType)
+
+        assert [path for path, _ in results] == ["target"]
+        visited = [c.args[0] for c in search.call_args_list]
+        assert "mixed" not in visited
+        assert ["x", "y"] not in visited
+
+    def test_runtime_subclass_is_searched(self):
+        """Test that a subclass instance in a model-typed field is searched."""
+        model = MixedModel(
+            scalars=SubclassedScalarModel(name="s", target=TargetType(value="sub")),
+            base=NestedModel(name="n", target=TargetType(value="base")),
+            anything={"key": TargetType(value="any")},
+        )
+
+        results = find_instances_recursive(model, TargetType)
+
+        assert [(path, found.value) for path, found in results] == [
+            ("scalars.target", "sub"),
+            ("base.target", "base"),
+            ("anything['key']", "any"),
+        ]
+
+    def test_extra_fields_are_searched(self):
+        """Test that extra fields are searched after declared fields."""
+        model = ExtraModel(secret=TargetType(value="extra"))
+
+        results = find_instances_recursive(model, TargetType)
+
+        assert [(path, found.value) for path, found in results] == [("secret", "extra")]
@@ -0,0 +1,99 @@
+import json
+import sys
+import textwrap
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from apolo_app_types.cli import cli
+from apolo_app_types.schema.schema_dumper import dump_schema_type, dump_schema_types
+
+
+@pytest.fixture
+def app_package(tmp_path: Path) -> Iterator[Path]:
+    package = tmp_path / "src" / "apolo_apps_dumper_test"
+    package.mkdir(parents=True)
+    (package / "__init__.py").write_text(
+        textwrap.dedent(
+            """
+            from pydantic import BaseModel
+
+            from apolo_app_types import AppInputs, AppOutputs
+
+
+            class Helper(BaseModel):
+                name: str = "helper"
+
+
+            class DemoInputs(AppInputs):
+                helper: Helper = Helper()
+                replicas: int = 1
+
+
+            class DemoOutputs(AppOutputs):
+                url: str | None = None
+            """
+        )
+    )
+    yield package
+    sys.modules.pop(package.name, None)
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_bulk_dump_writes_every_type(app_package, tmp_path, jobs):
+    output_dir = tmp_path / "schemas"
+
+    summary = dump_schema_types(app_package, output_dir, jobs=jobs)
+
+    assert sorted(path.name for path in summary.written) == [
+        "DemoInputs.json",
+        "DemoOutputs.json",
+    ]
+    assert summary.unchanged == []
+    schema = json.loads((output_dir / "DemoInputs.json").read_text())
+    assert schema["properties"]["replicas"]["default"] == 1
+    assert "Helper" in schema["$defs"]
+
+
+def test_bulk_dump_matches_single_dump(app_package, tmp_path):
+    dump_schema_types(app_package, tmp_path / "bulk", jobs=1)
+    dump_schema_type(app_package, "DemoOutputs", tmp_path / "DemoOutputs.json")
+
+    assert (tmp_path / "bulk" / "DemoOutputs.json").read_text() == (
+        tmp_path / "DemoOutputs.json"
+    ).read_text()
+
+
+def test_bulk_dump_skips_unchanged_files(app_package, tmp_path):
+    output_dir = tmp_path / "schemas"
+    dump_schema_types(app_package, output_dir, jobs=1)
+    outputs = output_dir / "DemoOutputs.json"
+    outputs.write_text("{}\n")
+    inputs = output_dir / "DemoInputs.json"
+    mtime = inputs.stat().st_mtime_ns
+
+    summary = dump_schema_types(app_package, output_dir, jobs=1)
+
+    assert summary.written == [outputs]
+    assert summary.unchanged == [inputs]
+    assert inputs.stat().st_mtime_ns == mtime
+    assert json.loads(outputs.read_text())["title"] == "DemoOutputs"
+
+
+def test_cli_bulk_mode(app_package, tmp_path):
+    runner = CliRunner()
+    output_dir = tmp_path / "schemas"
+
+    result = runner.invoke(
+        cli,
+        ["dump-types-schema", str(app_package), "--output-dir", str(output_dir)],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert (output_dir / "DemoInputs.json").is_file()
+
+    result = runner.invoke(cli, ["dump-types-schema", str(app_package)])
+    assert result.exit_code == 2
+    assert "required without --output-dir" in result.output
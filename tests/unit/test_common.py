@@ -1,15 +1,19 @@
 from decimal import Decimal
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 from apolo_sdk import Preset
 from apolo_sdk._server_cfg import NvidiaGPUPreset
 
+from apolo_app_types.app_types import AppType
 from apolo_app_types.helm.apps.common import (
     NVIDIA_MIG_KEY_PREFIX,
+    gen_extra_values,
     get_preset,
+    get_preset_resolver,
     preset_to_resources,
 )
+from apolo_app_types.protocols.common import Preset as PresetType
 
 
 def test_get_preset_raises_value_error_when_preset_not_found():
@@ -139,3 +143,63 @@ def test_preset_to_resources_with_empty_nvidia_migs():
     assert not any(
         key.startswith(NVIDIA_MIG_KEY_PREFIX) for key in result["requests"].keys()
     )
+
+
+def _client_with_preset() -> MagicMock:
+    client = MagicMock()
+    client.config.cluster_name = "test-cluster"
+    client.config.presets = {
+        "cpu-small": Preset(
+            credits_per_hour=Decimal("1.0"),
+            cpu=1.0,
+            memory=1 << 30,
+            resource_pool_names=("cpu",),
+            available_resource_pool_names=("cpu",),
+        )
+    }
+    client.config.resource_pools = {"cpu": MagicMock(amd_gpu=None, nvidia_gpu=None)}
+    return client
+
+
+@pytest.mark.asyncio
+async def test_preset_resolver_resolves_each_preset_once():
+    client = _client_with_preset()
+
+    with patch(
+        "apolo_app_types.helm.apps.common.get_preset", wraps=get_preset
+    ) as mock_get_preset:
+        first = await gen_extra_values(
+            client, PresetType(name="cpu-small"), "app-id", AppType.SparkJob
+        )
+        second = await gen_extra_values(
+            client,
+            PresetType(name="cpu-small"),
+            "app-id",
+            AppType.SparkJob,
+            component_name="executor",
+        )
+
+    mock_get_preset.assert_called_once_with(client, "cpu-small")
+    assert first["resources"] == second["resources"]
+    assert first["podLabels"]["platform.apolo.us/component"] == "app"
+    assert second["podLabels"]["platform.apolo.us/component"] == "executor"
+
+
+@pytest.mark.asyncio
+async def test_preset_resolver_returns_independent_copies():
+    resolver = get_preset_resolver(_client_with_preset())
+
+    first = await resolver.get_component_values("cpu-small")
+    first["resources"]["requests"]["cpu"] = "changed"
+    first["tolerations"].clear()
+    second = await resolver.get_component_values("cpu-small")
+
+    assert second["resources"]["requests"]["cpu"] == "1000.0m"
+    assert second["tolerations"]
+
+
+def test_preset_resolver_is_scoped_to_client():
+    client = _client_with_preset()
+
+    assert get_preset_resolver(client) is get_preset_resolver(client)
+    assert get_preset_resolver(client) is not get_preset_resolver(_client_with_preset())
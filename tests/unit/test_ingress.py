@@ -0,0 +1,73 @@
+import pytest
+
+from apolo_app_types.app_types import AppType
+from apolo_app_types.helm.apps.ingress import (
+    DOMAIN_SECTION_MAX_LENGTH,
+    IngressHostnameTemplate,
+    _generate_ingress_config,
+    compile_hostname_template,
+)
+
+
+def test_compile_normalizes_placeholder():
+    template = compile_hostname_template("{app_names}.apps.some.org.neu.ro.")
+
+    assert template.template == "{app_name}.apps.some.org.neu.ro"
+    assert template.max_app_name_length == DOMAIN_SECTION_MAX_LENGTH
+    assert template.render("llm--abc") == "llm--abc.apps.some.org.neu.ro"
+
+
+def test_compile_rejects_multiple_placeholders():
+    with pytest.raises(AssertionError, match="Invalid template"):
+        compile_hostname_template("{a}.{b}.example.com")
+
+
+def test_placeholder_sharing_a_label():
+    template = IngressHostnameTemplate.compile("app-{app_name}-x.example.com")
+
+    assert template.max_app_name_length == DOMAIN_SECTION_MAX_LENGTH - len("app--x")
+    assert template.render("a" * template.max_app_name_length)
+    with pytest.raises(Exception, match="is too long"):
+        template.render("a" * (template.max_app_name_length + 1))
+
+
+@pytest.mark.parametrize(
+    ("raw_template", "app_name"),
+    [
+        ("{app_name}.apps.example.com", "a" * 63),
+        ("{app_name}.apps.example.com", "a" * 64),
+        ("{x}-apps.example.com", "a" * 58),
+        ("{x}-apps.example.com", "a" * 59),
+        ("{app_name}." + "b" * 64 + ".example.com", "short"),
+        ("{app_name}.apps.example.com", "dotted." + "a" * 63),
+        ("{app_name}.apps.example.com", "dotted." + "a" * 64),
+    ],
+)
+def test_length_validation_matches_per_label_check(raw_template, app_name):
+    template = compile_hostname_template(raw_template)
+    hostname = template.template.format(app_name=app_name)
+    expected_ok = all(
+        len(label) <= DOMAIN_SECTION_MAX_LENGTH for label in hostname.split(".")
+    )
+
+    if expected_ok:
+        assert template.render(app_name) == hostname
+    else:
+        with pytest.raises(Exception, match="is too long"):
+            template.render(app_name)
+
+
+@pytest.mark.asyncio
+async def test_template_compiled_once_per_cluster(setup_clients):
+    compile_hostname_template.cache_clear()
+
+    for app_id in ("one", "two", "three"):
+        config = await _generate_ingress_config(
+            setup_clients, app_id, AppType.LLMInference
+        )
+        assert config["hosts"][0]["host"] == (
+            f"llm-inference--{app_id}.apps.some.org.neu.ro"
+        )
+
+    info = compile_hostname_template.cache_info()
+    assert (info.misses, info.hits) == (1, 2)
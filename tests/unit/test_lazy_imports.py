@@ -0,0 +1,56 @@
+import importlib
+import json
+import subprocess
+import sys
+
+import pytest
+
+import apolo_app_types
+
+
+def _run_python(code: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout
+
+
+def _loaded_modules(code: str) -> set[str]:
+    out = _run_python(
+        f"import json, sys\n{code}\nprint(json.dumps(sorted(sys.modules)))\n"
+    )
+    return set(json.loads(out))
+
+
+def test_package_import_does_not_load_submodules():
+    loaded = _loaded_modules("import apolo_app_types")
+
+    assert "apolo_sdk" not in loaded
+    assert "pydantic" not in loaded
+    assert {m for m in loaded if m.startswith("apolo_app_types.")} == set()
+
+
+def test_attribute_access_loads_only_its_module():
+    loaded = _loaded_modules("from apolo_app_types import parse_filter_string")
+
+    assert "apolo_app_types.dynamic_outputs.filters" in loaded
+    assert not {m for m in loaded if m.startswith("apolo_app_types.protocols")}
+    assert "apolo_app_types.helm" not in loaded
+
+
+def test_public_names_resolve_to_source_objects():
+    for name in apolo_app_types.__all__:
+        source = importlib.import_module(apolo_app_types._LAZY_IMPORTS[name])
+        assert getattr(apolo_app_types, name) is getattr(source, name), name
+
+
+def test_dir_lists_lazy_names():
+    assert set(apolo_app_types.__all__) <= set(dir(apolo_app_types))
+
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError, match="no attribute 'DoesNotExist'"):
+        _ = apolo_app_types.DoesNotExist
@@ -1,8 +1,28 @@
-from pydantic import ConfigDict, Field
+import importlib
+import inspect
+import json
+import pkgutil
+from typing import Any
+from unittest.mock import patch
 
+import jsonref
+import pytest
+from pydantic import BaseModel, ConfigDict, Field
+
+import apolo_app_types.protocols
+from apolo_app_types import AppInputs, LightRAGAppInputs, SparkJobInputs
 from apolo_app_types.protocols.common.abc_ import AbstractAppFieldType
 from apolo_app_types.protocols.common.schema_extra import SchemaExtraMetadata
-from apolo_app_types.schema_utils import get_inline_schema
+from apolo_app_types.schema_utils import (
+    InlineSchemaCache,
+    _is_editable,
+    _is_top_level_schema,
+    _replace_downstream_defaults,
+    build_inline_schema,
+    get_inline_schema,
+    get_inline_schema_hash,
+    warm_inline_schemas,
+)
 
 
 def test_get_inline_schema_simple():
@@ -98,3 +118,233 @@ def test_get_inline_schema_union():
             assert option_schema["properties"]["option_b_field"]["default"] == 10
     assert found_a
     assert found_b
+
+
+def test_inline_schema_cached_per_model():
+    cache = InlineSchemaCache()
+    with patch(
+        "apolo_app_types.schema_utils.build_inline_schema",
+        wraps=build_inline_schema,
+    ) as build:
+        first = cache.get(LightRAGAppInputs)
+        second = cache.get(LightRAGAppInputs)
+
+    build.assert_called_once_with(LightRAGAppInputs)
+    assert first == second == build_inline_schema(LightRAGAppInputs)
+    # every caller gets its own copy
+    first["title"] = "changed"
+    assert cache.get(LightRAGAppInputs)["title"] == "LightRAGAppInputs"
+
+
+@pytest.fixture
+def released_package():
+    """Treat the package under test as a regular, non-editable install."""
+    with patch("apolo_app_types.schema_utils._is_editable", return_value=False):
+        yield
+
+
+@pytest.mark.usefixtures("released_package")
+def test_inline_schema_disk_cache(tmp_path):
+    expected_hash = InlineSchemaCache(tmp_path).content_hash(SparkJobInputs)
+    (path,) = tmp_path.glob("SparkJobInputs-*.json")
+
+    with patch(
+        "apolo_app_types.schema_utils.build_inline_schema",
+        side_effect=AssertionError("rebuilt"),
+    ):
+        cache = InlineSchemaCache(tmp_path)
+        assert cache.get(SparkJobInputs) == build_inline_schema(SparkJobInputs)
+        assert cache.content_hash(SparkJobInputs) == expected_hash
+
+    data = json.loads(path.read_text())
+    data["schema"]["title"] = "tampered"
+    path.write_text(json.dumps(data))
+    assert InlineSchemaCache(tmp_path).get(SparkJobInputs)["title"] == (
+        "SparkJobInputs"
+    )
+
+
+def test_local_models_not_cached_on_disk(tmp_path):
+    class LocalInputs(AbstractAppFieldType):
+        name: str = Field("local")
+
+    cache = InlineSchemaCache(tmp_path)
+
+    assert cache.get(LocalInputs)["properties"]["name"]["default"] == "local"
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_editable_installs_not_cached_on_disk(tmp_path):
+    with patch("apolo_app_types.schema_utils._is_editable", return_value=True):
+        cache = InlineSchemaCache(tmp_path)
+
+        assert cache.get(SparkJobInputs) == build_inline_schema(SparkJobInputs)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_editable_install_detected():
+    class FakeDistribution:
+        def __init__(self, direct_url: str | None) -> None:
+            self.direct_url = direct_url
+
+        def read_text(self, filename: str) -> str | None:
+            assert filename == "direct_url.json"
+            return self.direct_url
+
+    cases = {
+        '{"url": "file:///src", "dir_info": {"editable": true}}': True,
+        '{"url": "file:///src", "dir_info": {}}': False,
+        '{"url": "https://example.com/pkg.whl", "archive_info": {}}': False,
+        "not json": False,
+        None: False,
+    }
+    for direct_url, editable in cases.items():
+        _is_editable.cache_clear()
+        with patch(
+            "apolo_app_types.schema_utils._package_distribution",
+            return_value=FakeDistribution(direct_url),
+        ):
+            assert _is_editable("pkg") is editable, direct_url
+    _is_editable.cache_clear()
+
+
+def test_warm_inline_schemas():
+    hashes = warm_inline_schemas()
+
+    assert len(hashes) > 20
+    assert hashes["LightRAGAppInputs"] == get_inline_schema_hash(LightRAGAppInputs)
+    with patch(
+        "apolo_app_types.schema_utils.build_inline_schema",
+        side_effect=AssertionError("rebuilt"),
+    ):
+        assert get_inline_schema(SparkJobInputs)["title"] == "SparkJobInputs"
+
+
+def _reference_replace_defaults(  # noqa: C901
+    schema: dict[str, Any], defaults: dict[str, Any] | None = None
+) -> dict[str, Any]:
+    """The previous recursive, in-place implementation."""
+    if not isinstance(schema, dict):
+        return schema
+
+    if defaults is None:
+        defaults = {}
+        if schema.get("type") == "object" and "default" in schema:
+            defaults = schema["default"]
+
+    if _is_top_level_schema(schema):
+        value_dict = schema["properties"]
+        for prop, prop_schema in value_dict.items():
+            new_defaults = None
+            if prop in defaults:
+                new_defaults = defaults[prop]
+                del defaults[prop]
+                if prop_schema.get("type") not in ["array", "object"]:
+                    prop_schema["default"] = new_defaults
+            _reference_replace_defaults(prop_schema, new_defaults)
+    else:
+        for _, value in schema.items():
+            if isinstance(value, dict):
+                _reference_replace_defaults(value, defaults)
+            elif isinstance(value, list):
+                for item in value:
+                    new_default = defaults
+                    if (
+                        "default" in schema
+                        and isinstance(schema["default"], dict)
+                        and schema["default"].get("__type__", "")
+                        == item.get("title", "")
+                    ):
+                        new_default = schema["default"]
+                    _reference_replace_defaults(item, new_default)
+
+    if (
+        isinstance(schema.get("default"), dict)
+        and schema.get("type") == "object"
+        and schema["default"] == {}
+    ):
+        del schema["default"]
+    return schema
+
+
+def _protocol_input_models() -> list[type[BaseModel]]:
+    models: dict[str, type[BaseModel]] = {}
+    for module_info in pkgutil.walk_packages(
+        apolo_app_types.protocols.__path__, "apolo_app_types.protocols."
+    ):
+        module = importlib.import_module(module_info.name)
+        for _, cls in inspect.getmembers(module, inspect.isclass):
+            if issubclass(cls, AppInputs) and cls is not AppInputs:
+                models[f"{cls.__module__}.{cls.__qualname__}"] = cls
+    return [models[name] for name in sorted(models)]
+
+
+def _inlined(model: type[BaseModel]) -> dict[str, Any]:
+    return jsonref.replace_refs(
+        model.model_json_schema(), merge_props=True, proxies=False
+    )
+
+
+PROTOCOL_INPUT_MODELS = _protocol_input_models()
+
+
+def test_protocol_input_models_found():
+    assert len(PROTOCOL_INPUT_MODELS) > 20
+    assert LightRAGAppInputs in PROTOCOL_INPUT_MODELS
+
+
+@pytest.mark.parametrize(
+    "model", PROTOCOL_INPUT_MODELS, ids=lambda model: model.__name__
+)
+def test_replace_defaults_matches_reference(model):
+    schema = _inlined(model)
+    snapshot = json.dumps(schema, sort_keys=True)
+
+    result = _replace_downstream_defaults(schema)
+
+    # the reference mutates shared nodes in place, so give it an unshared copy
+    expected = _reference_replace_defaults(json.loads(snapshot))
+    assert json.dumps(result, sort_keys=True) == json.dumps(expected, sort_keys=True)
+    assert json.dumps(schema, sort_keys=True) == snapshot
+
+
+def test_replace_defaults_per_shared_node():
+    class Inner(AbstractAppFieldType):
+        x: int = 0
+
+    class Outer(AbstractAppFieldType):
+        a: Inner = Field(Inner(x=1))
+        b: Inner = Field(Inner(x=2))
+        c: Inner = Field(Inner())
+
+    schema = get_inline_schema(Outer)
+
+    assert [
+        schema["properties"][name]["properties"]["x"]["default"] for name in "abc"
+    ] == [1, 2, 0]
+
+
+def test_replace_defaults_deeply_nested():
+    leaf: dict[str, Any] = {"type": "string"}
+    schema = leaf
+    for depth in range(5000):
+        schema = {
+            "title": f"Level{depth}",
+            "type": "object",
+            "properties": {"child": schema},
+        }
+    schema["default"] = {"child": {"child": {}}}
+
+    result = _replace_downstream_defaults(schema)
+
+    assert "default" not in result
+    assert result["properties"]["child"] is not schema["properties"]["child"]
+    assert schema["default"] == {"child": {"child": {}}}
+
+
+def test_replace_defaults_reference_cycle():
+    schema: dict[str, Any] = {"title": "Node", "type": "object", "properties": {}}
+    schema["properties"]["child"] = {"anyOf": [schema, {"type": "null"}]}
+
+    with pytest.raises(ValueError, match="reference cycle"):
+        _replace_downstream_defaults(schema)
@@ -0,0 +1,370 @@
+import asyncio
+import stat
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+from click.testing import CliRunner
+
+from apolo_app_types.cli import cli
+from apolo_app_types.clients.apolo_session import SessionParams
+from apolo_app_types.outputs.update_outputs import PostOutputsResult
+from apolo_app_types.outputs.utils.cleanup import SecretCleanupSummary
+from apolo_app_types.server import (
+    ApoloAuth,
+    ApoloClientPool,
+    bind_unix_socket,
+    create_app,
+)
+
+
+TOKEN = "serve-token"
+HEADERS = {"Authorization": f"Bearer {TOKEN}"}
+
+
+class FakeProcessor:
+    def __init__(self, client):
+        self.client = client
+
+    async def gen_extra_helm_args(self):
+        return ["--timeout", "30m"]
+
+    async def gen_extra_values(self, input_, app_name, namespace, **kwargs):
+        return {"app": app_name, "namespace": namespace, "app_id": kwargs["app_id"]}
+
+
+@pytest.fixture
+def open_client():
+    client = MagicMock()
+    client.close = AsyncMock()
+    with patch(
+        "apolo_app_types.server.open_client", AsyncMock(return_value=client)
+    ) as open_client:
+        yield open_client, client
+
+
+@pytest.fixture
+def app(open_client):
+    default_auth = ApoloAuth(api_url="https://api.example.com", org="org")
+    return create_app(default_auth, auth_token=TOKEN, preload_models=False)
+
+
+def serve(app):
+    return TestClient(TestServer(app), headers=HEADERS)
+
+
+async def test_health(app):
+    async with serve(app) as http:
+        response = await http.get("/health")
+
+        assert response.status == 200
+        assert await response.json() == {"status": "ok"}
+
+
+async def test_run_preprocessor_reuses_client(app, open_client):
+    open_client, _ = open_client
+    async with serve(app) as http:
+        body = {
+            "app_type": "fake",
+            "app_id": "app-1",
+            "app_name": "my-app",
+            "namespace": "ns",
+            "inputs": {},
+            "apps_secret_name": "apps-secrets",
+            "auth": {"api_token": "token", "cluster": "cluster", "project": "proj"},
+        }
+
+        with patch(
+            "apolo_app_types.server.load_preprocessor",
+            return_value=(MagicMock(), FakeProcessor),
+        ):
+            for _ in range(3):
+                response = await http.post("/run-preprocessor", json=body)
+                assert response.status == 200
+
+        assert await response.json() == {
+            "helm_args": ["--timeout", "30m"],
+            "helm_values": {"app": "my-app", "namespace": "ns", "app_id": "app-1"},
+        }
+        open_client.assert_awaited_once_with(
+            SessionParams(
+                api_url="https://api.example.com",
+                api_token="token",
+                org="org",
+                cluster="cluster",
+                project="proj",
+            )
+        )
+
+
+async def test_update_outputs(app):
+    async with serve(app) as http:
+        with patch(
+            "apolo_app_types.server.update_app_outputs",
+            AsyncMock(
+                return_value=PostOutputsResult(ok=False, attempts=2, error="boom")
+            ),
+        ) as update:
+            response = await http.post(
+                "/update-outputs",
+                json={"helm_outputs": {"a": 1}, "app_instance_id": "inst-1"},
+            )
+
+        assert response.status == 502
+        assert await response.json() == {
+            "ok": False,
+            "attempts": 2,
+            "status_code": None,
+            "error": "boom",
+        }
+        assert update.await_args.kwargs["app_instance_id"] == "inst-1"
+
+
+async def test_cleanup(app, open_client):
+    _, client = open_client
+    async with serve(app) as http:
+        summary = SecretCleanupSummary(deleted=["password-app-1"])
+        with (
+            patch(
+                "apolo_app_types.server.load_outputs_class", return_value=MagicMock()
+            ),
+            patch(
+                "apolo_app_types.server.cleanup_app", AsyncMock(return_value=summary)
+            ) as cleanup,
+        ):
+            response = await http.post(
+                "/cleanup",
+                json={
+                    "app_type": "fake",
+                    "app_id": "app-1",
+                    "auth": {"api_token": "token"},
+                },
+            )
+
+        assert response.status == 200
+        assert await response.json() == {"deleted": ["password-app-1"], "failed": {}}
+        assert cleanup.await_args.args[0] is client
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b"not json",
+        b'{"app_type": "fake"}',
+        # credentials are never taken from the server defaults
+        b'{"app_type": "fake", "app_id": "app-1"}',
+    ],
+)
+async def test_bad_request(app, body):
+    async with serve(app) as http:
+        response = await http.post("/cleanup", data=body)
+
+        assert response.status == 400
+        assert "error" in await response.json()
+
+
+def _new_client():
+    client = MagicMock()
+    client.close = AsyncMock()
+    client.config.fetch = AsyncMock()
+    return client
+
+
+@pytest.fixture
+def new_clients():
+    with patch(
+        "apolo_app_types.server.open_client",
+        AsyncMock(side_effect=lambda params: _new_client()),
+    ) as open_client:
+        yield open_client
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _auth(token):
+    return ApoloAuth(api_url="https://api.example.com", api_token=token)
+
+
+async def test_pool_keeps_one_client_per_auth(new_clients):
+    pool = ApoloClientPool()
+
+    async with pool.client(_auth("a")) as first:
+        async with pool.client(_auth("a")) as again:
+            assert again is first
+    async with pool.client(_auth("b")) as second:
+        assert second is not first
+    assert len(pool) == 2
+    assert new_clients.await_count == 2
+
+    await pool.close()
+    assert len(pool) == 0
+    first.close.assert_awaited_once()
+    second.close.assert_awaited_once()
+
+
+async def test_pool_refreshes_expired_clients(new_clients):
+    clock = FakeClock()
+    pool = ApoloClientPool(ttl=60, clock=clock)
+
+    async with pool.client(_auth("a")) as first:
+        pass
+    first.config.fetch.assert_not_awaited()
+    clock.now = 59
+    async with pool.client(_auth("a")) as client:
+        assert client is first
+    clock.now = 60
+    async with pool.client(_auth("a")) as second:
+        assert second is not first
+
+    first.close.assert_awaited_once()
+    second.config.fetch.assert_awaited_once()
+    assert len(pool) == 1
+
+
+async def test_pool_evicts_least_recently_used(new_clients):
+    pool = ApoloClientPool(max_size=2)
+
+    async with pool.client(_auth("a")) as first:
+        pass
+    async with pool.client(_auth("b")):
+        pass
+    async with pool.client(_auth("a")):
+        pass
+    async with pool.client(_auth("c")):
+        pass
+
+    assert len(pool) == 2
+    first.close.assert_not_awaited()
+    async with pool.client(_auth("b")):
+        pass
+    # "b" came back, so "a" is the least recently used one now
+    first.close.assert_awaited_once()
+    assert new_clients.await_count == 4
+
+
+async def test_pool_keeps_clients_in_use(new_clients):
+    pool = ApoloClientPool(max_size=1)
+
+    async with pool.client(_auth("a")) as first:
+        async with pool.client(_auth("b")) as second:
+            assert len(pool) == 2
+        # "b" was the only idle client to drop
+        second.close.assert_awaited_once()
+        first.close.assert_not_awaited()
+    assert len(pool) == 1
+    async with pool.client(_auth("c")):
+        pass
+    first.close.assert_awaited_once()
+
+
+async def test_pool_does_not_drop_clients_being_lent(new_clients):
+    pool = ApoloClientPool(max_size=1)
+    async with pool.client(_auth("a")) as first:
+        pass
+    closing = asyncio.Event()
+    first.close.side_effect = closing.wait
+    release = asyncio.Event()
+    lent = {}
+    ready = {"b": asyncio.Event(), "c": asyncio.Event()}
+
+    async def use(token):
+        async with pool.client(_auth(token)) as client:
+            lent[token] = client
+            ready[token].set()
+            await release.wait()
+            client.close.assert_not_awaited()
+
+    # "b" evicts "a" and waits for it to close while "c" is opened
+    first_use = asyncio.create_task(use("b"))
+    await asyncio.sleep(0)
+    second_use = asyncio.create_task(use("c"))
+    await asyncio.wait_for(ready["c"].wait(), timeout=5)
+    closing.set()
+    await asyncio.wait_for(ready["b"].wait(), timeout=5)
+    assert len(pool) == 2
+    release.set()
+    await asyncio.wait_for(asyncio.gather(first_use, second_use), timeout=5)
+
+    assert len(pool) == 1
+    assert sum(client.close.await_count for client in lent.values()) == 1
+    first.close.assert_awaited_once()
+    await pool.close()
+    assert all(client.close.await_count == 1 for client in lent.values())
+
+
+async def test_pool_requires_url_with_token():
+    with pytest.raises(ValueError, match="api_url"):
+        async with ApoloClientPool().client(ApoloAuth(api_token="a")):
+            pass
+
+
+async def test_component_cache_is_refreshed(open_client):
+    app = create_app(auth_token=TOKEN, preload_models=False, cache_ttl=0)
+    with patch("apolo_app_types.server.clear_component_cache") as clear:
+        async with serve(app) as http:
+            await http.get("/health")
+            await http.get("/health")
+
+    assert clear.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [
+        {},
+        {"Authorization": "Bearer wrong"},
+        {"Authorization": f"Basic {TOKEN}"},
+    ],
+)
+async def test_requests_need_the_shared_token(app, open_client, headers):
+    open_client, _ = open_client
+    async with TestClient(TestServer(app), headers=headers) as http:
+        assert (await http.get("/health")).status == 200
+        response = await http.post(
+            "/cleanup",
+            json={"app_type": "fake", "app_id": "a", "auth": {"api_token": "t"}},
+        )
+
+        assert response.status == 401
+        open_client.assert_not_awaited()
+
+
+def test_auth_request_fields_override_defaults():
+    defaults = ApoloAuth(
+        api_url="https://api.example.com", api_token="server-token", org="org"
+    )
+
+    merged = ApoloAuth(api_token="tok", org="other", project="proj").with_defaults(
+        defaults
+    )
+
+    assert merged == ApoloAuth(
+        api_url="https://api.example.com",
+        api_token="tok",
+        org="other",
+        project="proj",
+    )
+    with pytest.raises(ValueError, match="api_token"):
+        ApoloAuth(org="other").with_defaults(defaults)
+
+
+def test_unix_socket_is_private(tmp_path):
+    path = tmp_path / "serve.sock"
+
+    with bind_unix_socket(path):
+        assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+
+def test_serve_needs_token_on_tcp(monkeypatch):
+    monkeypatch.delenv("APOLO_APP_TYPES_SERVE_TOKEN", raising=False)
+
+    result = CliRunner().invoke(cli, ["serve", "--no-preload"])
+
+    assert result.exit_code == 2
+    assert "--auth-token" in result.output
@@ -0,0 +1,136 @@
+import copy
+import typing as t
+from functools import reduce
+
+from apolo_app_types.helm.utils.deep_merging import deep_merge, merge_list_of_dicts
+
+
+def _reference_deep_merge(
+    dict1: dict[str, t.Any], dict2: dict[str, t.Any]
+) -> dict[str, t.Any]:
+    """The previous deepcopy-per-call implementation, kept as an oracle."""
+    merged = copy.deepcopy(dict1)
+    for key, value in dict2.items():
+        if key in merged:
+            if isinstance(merged[key], dict) and isinstance(value, dict):
+                merged[key] = _reference_deep_merge(merged[key], value)
+            elif isinstance(merged[key], list) and isinstance(value, list):
+                merged[key].extend(value)
+            else:
+                merged[key] = value
+        else:
+            merged[key] = value
+    return merged
+
+
+def _helm_fragments(count: int) -> list[dict[str, t.Any]]:
+    """Value fragments shaped like the ones the chart value processors merge."""
+    fragments: list[dict[str, t.Any]] = [
+        {
+            "image": {"repository": "vllm/vllm-openai", "tag": "v0.9.0"},
+            "resources": {
+                "requests": {"cpu": "4000.0m", "memory": "16384M"},
+                "limits": {"cpu": "4000.0m", "memory": "16384M"},
+            },
+            "affinity": {
+                "nodeAffinity": {
+                    "requiredDuringSchedulingIgnoredDuringExecution": {
+                        "nodeSelectorTerms": [
+                            {
+                                "matchExpressions": [
+                                    {
+                                        "key": "platform.apolo.us/cpu-pool",
+                                        "operator": "Exists",
+                                    }
+                                ]
+                            }
+                        ]
+                    }
+                }
+            },
+            "tolerations": [
+                {"key": "platform.neuromation.io/job", "operator": "Exists"}
+            ],
+            "podLabels": {"platform.apolo.us/component": "app"},
+            "ingress": {"enabled": True, "hosts": [{"host": "app.example.com"}]},
+        }
+    ]
+    for idx in range(count - 1):
+        fragments.append(
+            {
+                "env": {f"VAR_{idx}": str(idx)},
+                "serverExtraArgs": [f"--arg-{idx}"],
+                "podLabels": {f"label-{idx}": "value"},
+                "resources": {"limits": {f"nvidia.com/gpu-{idx % 4}": "1"}},
+                "tolerations": [{"key": f"taint-{idx}", "operator": "Exists"}],
+                "ingress": {"annotations": {f"annotation-{idx}": "on"}},
+                "replicaCount": idx,
+            }
+        )
+    return fragments
+
+
+def test_nested_dicts_are_merged_and_lists_extended():
+    result = deep_merge(
+        {"a": {"b": 1, "c": [1]}, "d": 1, "e": {"x": 1}},
+        {"a": {"c": [2], "f": 3}, "d": {"new": True}, "e": None},
+    )
+
+    assert result == {"a": {"b": 1, "c": [1, 2], "f": 3}, "d": {"new": True}, "e": None}
+
+
+def test_inputs_are_not_mutated():
+    fragments = _helm_fragments(10)
+    snapshot = copy.deepcopy(fragments)
+
+    merge_list_of_dicts(fragments)
+    deep_merge(fragments[0], fragments[1])
+
+    assert fragments == snapshot
+
+
+def test_shared_fragment_values_are_not_cross_modified():
+    model = {"name": "llama", "args": ["--a"]}
+
+    result = merge_list_of_dicts(
+        [{"model": model, "llm": model}, {"model": {"args": ["--b"]}}]
+    )
+
+    assert result["model"] == {"name": "llama", "args": ["--a", "--b"]}
+    assert result["llm"] == {"name": "llama", "args": ["--a"]}
+    assert model == {"name": "llama", "args": ["--a"]}
+
+
+def test_matches_reference_implementation():
+    fragments = _helm_fragments(25)
+
+    expected = reduce(_reference_deep_merge, copy.deepcopy(fragments), {})
+
+    assert merge_list_of_dicts(fragments) == expected
+    assert deep_merge(fragments[0], fragments[1]) == _reference_deep_merge(
+        copy.deepcopy(fragments[0]), copy.deepcopy(fragments[1])
+    )
+
+
+def test_untouched_subtrees_alias_the_inputs():
+    first = {"image": {"tag": "v1"}, "env": {"A": "1"}, "args": ["--a"]}
+    second = {"env": {"B": "2"}, "labels": {"app": "x"}}
+
+    result = deep_merge(first, second)
+
+    assert result["image"] is first["image"]
+    assert result["labels"] is second["labels"]
+    assert result["args"] is first["args"]
+    # merged paths are new containers, the inputs keep their values
+    assert result["env"] is not first["env"]
+    assert result["env"] == {"A": "1", "B": "2"}
+    assert first["env"] == {"A": "1"}
+
+
+def test_merged_lists_are_copied():
+    first = {"args": ["--a"]}
+
+    result = merge_list_of_dicts([first, {"args": ["--b"]}, {"args": ["--c"]}])
+
+    assert result["args"] == ["--a", "--b", "--c"]
+    assert first["args"] == ["--a"]